@@ -29,5 +29,6 @@ setup(
     package_dir={'': "src"},
     zip_safe=False,
     install_requires=['requests>=2.20.0'],
+    extras_require={'fast': ['orjson']},
     python_requires='>=3.5',
 )
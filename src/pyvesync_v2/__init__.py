@@ -2,7 +2,18 @@
 
 # pylint: skip-file
 # flake8: noqa
-from .vesync import VeSync
+from .vesync import VeSync, UpdateReport
+from .vesyncasync import AsyncVeSync
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .breaker import CircuitBreaker
+from .cache import ResponseCache
+from .latency import LatencyTracker
+from .hedge import Hedger
+from .offline import OfflineTracker
+from .scheduler import PollScheduler
+from .transport import (Transport, SessionTransport, PriorityTransport,
+                        FakeTransport, RecordReplayTransport)
 from .vesyncoutlet import (VeSyncOutlet10A, VeSyncOutlet15A, VeSyncOutlet7A,
                            VeSyncOutdoorPlug)
 from .vesyncswitch import VeSyncWallSwitch
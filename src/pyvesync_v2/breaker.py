@@ -0,0 +1,112 @@
+"""Circuit breaker for VeSync API endpoint families."""
+
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30
+DEFAULT_HALF_OPEN_PROBES = 1
+DEFAULT_PROBE_TIMEOUT = 30
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Fail fast for endpoint families that keep failing.
+
+    Each key, the endpoint prefix of a device family, has its own
+    circuit. After failure_threshold consecutive failures the circuit
+    opens and calls are refused for reset_timeout seconds. It then
+    half opens and lets half_open_probes calls through - a success
+    closes the circuit and a failure opens it again. Probes released
+    without a result, or not recorded within probe_timeout seconds,
+    are let through again.
+    """
+
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+                 half_open_probes: int = DEFAULT_HALF_OPEN_PROBES,
+                 probe_timeout: float = DEFAULT_PROBE_TIMEOUT):
+        """Initialize circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.probe_timeout = probe_timeout
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, key) -> dict:
+        """Return circuit for key, creating a closed one if needed."""
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = {'state': CLOSED, 'failures': 0, 'opened': 0,
+                       'probes': 0, 'probed': 0}
+            self._circuits[key] = circuit
+        return circuit
+
+    def state(self, key) -> str:
+        """Return state of circuit for key."""
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit['state'] == OPEN and \
+                    time.monotonic() - circuit['opened'] >= self.reset_timeout:
+                return HALF_OPEN
+            return circuit['state']
+
+    def allow(self, key) -> bool:
+        """Return True if a call for key may be sent."""
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit['state'] == CLOSED:
+                return True
+            if circuit['state'] == OPEN:
+                if time.monotonic() - circuit['opened'] < self.reset_timeout:
+                    return False
+                circuit['state'] = HALF_OPEN
+                circuit['probes'] = 0
+            if circuit['probes'] and time.monotonic() - circuit['probed'] \
+                    >= self.probe_timeout:
+                _LOGGER.debug('Probe for %s timed out', key)
+                circuit['probes'] = 0
+            if circuit['probes'] < self.half_open_probes:
+                circuit['probes'] += 1
+                circuit['probed'] = time.monotonic()
+                return True
+            return False
+
+    def release(self, key):
+        """Return probe for key allowed by allow() without a result."""
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit['state'] == HALF_OPEN and circuit['probes']:
+                circuit['probes'] -= 1
+
+    def record(self, key, success: bool):
+        """Record result of a call for key."""
+        with self._lock:
+            circuit = self._circuit(key)
+            if success:
+                if circuit['state'] != CLOSED:
+                    _LOGGER.debug('Circuit closed for %s', key)
+                circuit.update(state=CLOSED, failures=0, probes=0)
+                return
+            circuit['failures'] += 1
+            if circuit['state'] == HALF_OPEN or \
+                    circuit['failures'] >= self.failure_threshold:
+                if circuit['state'] != OPEN:
+                    _LOGGER.warning('Circuit opened for %s after %d failures',
+                                    key, circuit['failures'])
+                circuit.update(state=OPEN, opened=time.monotonic(), probes=0)
+
+    def reset(self, key=None):
+        """Close circuit for key, or all circuits."""
+        with self._lock:
+            if key is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(key, None)
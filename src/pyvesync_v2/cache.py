@@ -0,0 +1,76 @@
+"""Response cache for slow changing VeSync API endpoints."""
+
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_CACHE_SIZE = 512
+DEFAULT_CONFIG_TTL = 21600
+
+# TTL in seconds by endpoint path or last path segment
+DEFAULT_TTLS = {
+    'configurations': DEFAULT_CONFIG_TTL
+}
+
+
+class ResponseCache:
+    """Least recently used cache of API responses with TTLs.
+
+    ttls maps full endpoint paths or their last path segment to the
+    seconds a response stays fresh. Endpoints without a TTL are not
+    cached. At most max_size responses are kept.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE, ttls: dict = None):
+        """Initialize cache with size and TTL overrides."""
+        self.max_size = max_size
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls is not None:
+            self.ttls.update(ttls)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return number of cached responses."""
+        return len(self._entries)
+
+    def ttl(self, api: str) -> float:
+        """Return TTL of endpoint, 0 if it is not cached."""
+        if api in self.ttls:
+            return self.ttls[api]
+        return self.ttls.get(api.rsplit('/', 1)[-1], 0)
+
+    def get(self, key):
+        """Return fresh cached value for key or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if time.monotonic() >= expires:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float):
+        """Store value for ttl seconds, evicting least recently used."""
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, api: str = None):
+        """Remove cached responses of endpoint, or all responses.
+
+        Keys are (method, api, body) tuples from Helpers.request_key.
+        """
+        with self._lock:
+            if api is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[1] == api]:
+                del self._entries[key]
@@ -0,0 +1,45 @@
+"""JSON encoding and decoding using the fastest installed library.
+
+orjson is used when installed, then ujson, then the standard library.
+"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+import json
+
+if orjson is not None:
+    BACKEND = 'orjson'
+elif ujson is not None:
+    BACKEND = 'ujson'
+else:
+    BACKEND = 'json'
+
+
+def dumps(obj) -> bytes:
+    """Return compact UTF-8 encoded JSON of obj."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    if ujson is not None:
+        return ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'),
+                      ensure_ascii=False).encode('utf-8')
+
+
+def dumps_str(obj) -> str:
+    """Return compact JSON of obj as a string."""
+    return dumps(obj).decode('utf-8')
+
+
+def loads(data):
+    """Decode JSON from bytes or string."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,118 @@
+"""Hedged requests for idempotent VeSync API reads."""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_HEDGE_PERCENTILE = 95
+DEFAULT_HEDGE_WORKERS = 16
+# Hedges earned by each request, and most hedges saved up or in flight
+DEFAULT_HEDGE_BUDGET = 0.1
+DEFAULT_HEDGE_BURST = 2
+
+
+class Hedger:
+    """Send a second request when the first one is slow.
+
+    When a request has not been answered after the percentile latency
+    of its endpoint, an identical request is sent from a hedging
+    thread. Its answer is used if the first request ends without
+    one, such as on a timeout, and discarded otherwise.
+
+    Each request earns budget hedges, so hedges are at most that
+    fraction of requests beyond a burst of saved up hedges, and no more
+    than burst hedges are in flight at once.
+    """
+
+    def __init__(self, percentile: float = DEFAULT_HEDGE_PERCENTILE,
+                 max_workers: int = DEFAULT_HEDGE_WORKERS,
+                 budget: float = DEFAULT_HEDGE_BUDGET,
+                 burst: int = DEFAULT_HEDGE_BURST):
+        """Initialize hedger with latency percentile and thread count."""
+        self.percentile = percentile
+        self.max_workers = max_workers
+        self.budget = budget
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._in_flight = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _submit(self, send):
+        """Run send() in the hedging thread pool."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers)
+            return self._executor.submit(send)
+
+    def _take_hedge(self) -> bool:
+        """Take a hedge from the budget if one is left."""
+        with self._lock:
+            if self._tokens < 1 or self._in_flight >= self.burst:
+                return False
+            self._tokens -= 1
+            self._in_flight += 1
+            return True
+
+    def _end_hedge(self, refund: bool = False):
+        """Free in flight hedge, refunding it if it was not sent."""
+        with self._lock:
+            self._in_flight -= 1
+            if refund:
+                self._tokens = min(self.burst, self._tokens + 1)
+
+    def run(self, send, delay: float, allow_hedge=None,
+            started: threading.Event = None) -> tuple:
+        """Return (response, status_code) of send(), hedged if slow.
+
+        The first call runs on the calling thread, so hedging never
+        limits how many requests are in flight. A hedging thread sends
+        a second call if the first one has not returned delay seconds
+        after started is set by send(), or after it was called without
+        started, and the hedge budget and allow_hedge(), used to check
+        the rate limit budget, allow it. The answer of the second call
+        is used when the first one has no status code.
+        """
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.budget)
+        if started is None:
+            started = threading.Event()
+            started.set()
+        done = threading.Event()
+        hedge = self._submit(
+            lambda: self._hedge(send, delay, allow_hedge, started, done))
+        try:
+            result = send()
+        finally:
+            done.set()
+            started.set()
+        if result[1] is not None or hedge.cancel():
+            return result
+        hedged = hedge.result()
+        if hedged is not None and hedged[1] is not None:
+            return hedged
+        return result
+
+    def _hedge(self, send, delay: float, allow_hedge, started, done):
+        """Send second call unless the first returns within delay."""
+        started.wait()
+        if done.wait(delay) or not self._take_hedge():
+            return None
+        if allow_hedge is not None and not allow_hedge():
+            self._end_hedge(refund=True)
+            return None
+        _LOGGER.debug('Hedging request after %.3f seconds', delay)
+        try:
+            return send()
+        finally:
+            self._end_hedge()
+
+    def close(self):
+        """Shut down hedging threads."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
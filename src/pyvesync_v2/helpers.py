@@ -2,14 +2,32 @@
 
 import hashlib
 import logging
+import threading
 import time
+from contextlib import contextmanager
+from json import dumps
+from types import MappingProxyType
 import requests
+from requests.adapters import HTTPAdapter
+from pyvesync_v2 import codec
 
 _LOGGER = logging.getLogger(__name__)
 
 API_BASE_URL = 'https://smartapi.vesync.com'
 API_RATE_LIMIT = 30
 API_TIMEOUT = 5
+DEFAULT_POOL_SIZE = 10
+JSON_HEADERS = {'content-type': 'application/json'}
+
+LOGIN_API = '/cloud/v1/user/login'
+BYPASS_API = '/cloud/v1/deviceManaged/bypass'
+# Endpoint suffixes of idempotent detail reads that may be hedged
+HEDGE_API_SUFFIXES = ('/devicedetail', '/deviceDetail', '/detail')
+HEDGE_BYPASS_CMDS = ('getLightStatus',)
+# Status of calls refused by the local rate limiter without being sent
+THROTTLED = -1
+# Response codes for invalid or expired tokens
+TOKEN_ERROR_CODES = (-11001000, -11012022, 4001004)
 
 DEFAULT_TZ = 'America/New_York'
 
@@ -19,12 +37,39 @@ PHONE_OS = 'Android'
 MOBILE_ID = '1234567890123456'
 USER_TYPE = '1'
 
+# Update deadline and request send time of the calling thread
+_LOCAL = threading.local()
+
 
 class Helpers:
     """VeSync Helper Functions."""
 
     @staticmethod
-    def req_headers(manager):
+    def req_templates(manager) -> dict:
+        """Return request templates of manager for its current login.
+
+        Templates are dropped when the token, account id or time zone
+        of the manager changes.
+        """
+        state = (manager.token, manager.account_id, manager.time_zone)
+        cached = getattr(manager, '_req_templates', None)
+        if cached is None or cached[0] != state:
+            cached = (state, {})
+            manager._req_templates = cached
+        return cached[1]
+
+    @classmethod
+    def req_headers(cls, manager):
+        """Return copy of cached header for api requests."""
+        templates = cls.req_templates(manager)
+        template = templates.get('headers')
+        if template is None:
+            template = MappingProxyType(cls.build_headers(manager))
+            templates['headers'] = template
+        return dict(template)
+
+    @staticmethod
+    def build_headers(manager):
         """Build header for api requests."""
         headers = {
             'accept-language': 'en',
@@ -64,6 +109,25 @@ class Helpers:
 
     @classmethod
     def req_body(cls, manager, type_):
+        """Return body of api requests from cached template.
+
+        Bodies are built once per type and login and copied with a new
+        traceId. Login bodies are built on every call.
+        """
+        if type_ == 'login':
+            return cls.build_body(manager, type_)
+        templates = cls.req_templates(manager)
+        template = templates.get(type_)
+        if template is None:
+            template = MappingProxyType(cls.build_body(manager, type_))
+            templates[type_] = template
+        body = dict(template)
+        if 'traceId' in body:
+            body['traceId'] = str(int(time.time()))
+        return body
+
+    @classmethod
+    def build_body(cls, manager, type_):
         """Builder for body of api requests."""
         body = {}
 
@@ -154,39 +218,367 @@ class Helpers:
         return hashlib.md5(string.encode('utf-8')).hexdigest()
 
     @staticmethod
-    def call_api(api: str, method: str,
-                 json: dict = None, headers: dict = None):
-        """Make API calls by passing endpoint, header and body."""
+    def build_session(pool_size: int = DEFAULT_POOL_SIZE):
+        """Return requests session with keep-alive connection pool."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @staticmethod
+    def http_send(requester, method: str, url: str, json: dict = None,
+                  headers: dict = None, timeout: float = API_TIMEOUT) -> tuple:
+        """Send HTTP request with requester and return response and status.
+
+        requester is a requests session or the requests module. Bodies
+        are sent as JSON encoded bytes and responses decoded with the
+        codec module.
+        """
         response = None
         status_code = None
+        if method not in ('get', 'post', 'put'):
+            _LOGGER.warning('Unsupported method %s', method)
+            return response, status_code
 
+        data = None
+        if json is not None:
+            data = codec.dumps(json)
+            if headers is None:
+                headers = JSON_HEADERS
         try:
-            _LOGGER.debug("[%s] calling '%s' api", method, api)
-            if method == 'get':
-                r = requests.get(
-                    API_BASE_URL + api, json=json,
-                    headers=headers, timeout=API_TIMEOUT
-                )
-            elif method == 'post':
-                r = requests.post(
-                    API_BASE_URL + api, json=json,
-                    headers=headers, timeout=API_TIMEOUT
-                )
-            elif method == 'put':
-                r = requests.put(
-                    API_BASE_URL + api, json=json,
-                    headers=headers, timeout=API_TIMEOUT
-                )
+            _LOGGER.debug("[%s] calling '%s'", method, url)
+            r = getattr(requester, method)(
+                url, data=data, headers=headers, timeout=timeout
+            )
         except requests.exceptions.RequestException as e:
-            _LOGGER.waring(e)
+            _LOGGER.warning(e)
         else:
+            status_code = r.status_code
             if r.status_code == 200:
-                status_code = 200
-                response = r.json()
+                try:
+                    response = codec.loads(r.content)
+                except ValueError:
+                    _LOGGER.warning('Invalid JSON response from %s', url)
             else:
-                _LOGGER.debug('Unable to fetch %s%s', API_BASE_URL, api)
+                _LOGGER.debug('Unable to fetch %s', url)
+        return response, status_code
+
+    @classmethod
+    def send_request(cls, api: str, method: str, json: dict = None,
+                     headers: dict = None, manager=None,
+                     timeout: float = None) -> tuple:
+        """Send request and return response and HTTP status code.
+
+        Calls are sent through the transport of the manager when one
+        is passed, otherwise a new connection is opened. timeout
+        defaults to the timeout of the transport.
+        """
+        if manager is not None:
+            return manager.transport.send(method, api, json, headers,
+                                          timeout=timeout)
+        return cls.http_send(requests, method, API_BASE_URL + api, json,
+                             headers, timeout or API_TIMEOUT)
+
+    @staticmethod
+    def token_expired(response, status_code) -> bool:
+        """Test if API rejected the token of the request."""
+        if status_code == 401:
+            return True
+        return isinstance(response, dict) and \
+            response.get('code') in TOKEN_ERROR_CODES
+
+    @staticmethod
+    def update_auth(manager, headers: dict, json: dict) -> tuple:
+        """Return copies of headers and body with current manager token."""
+        if headers is not None and 'tk' in headers:
+            headers = dict(headers, tk=manager.token,
+                           accountId=manager.account_id)
+        if json is not None and 'token' in json:
+            json = dict(json, token=manager.token,
+                        accountID=manager.account_id)
+        return headers, json
+
+    @staticmethod
+    def request_kind(api: str, method: str, json: dict = None) -> str:
+        """Return 'write' for calls that change device state, else 'read'."""
+        if method == 'put':
+            return 'write'
+        if api == BYPASS_API and json is not None:
+            json_cmd = json.get('jsonCmd')
+            if isinstance(json_cmd, dict) and \
+                    any(v != 'get' for v in json_cmd.values()):
+                return 'write'
+        return 'read'
+
+    @staticmethod
+    def hedgeable(api: str, method: str, json: dict = None) -> bool:
+        """Return True for idempotent detail reads that may be hedged."""
+        if method == 'put':
+            return False
+        if api == BYPASS_API:
+            json_cmd = (json or {}).get('jsonCmd')
+            return isinstance(json_cmd, dict) and \
+                any(cmd in json_cmd for cmd in HEDGE_BYPASS_CMDS) and \
+                all(v == 'get' for v in json_cmd.values())
+        return api.endswith(HEDGE_API_SUFFIXES)
+
+    @staticmethod
+    def endpoint_family(api: str) -> str:
+        """Return endpoint prefix shared by a device family."""
+        if api.startswith('/cloud/'):
+            return api
+        return '/' + api.split('/')[1].lower()
+
+    @staticmethod
+    def current_deadline() -> float:
+        """Return monotonic update deadline of this thread, None if unset."""
+        return getattr(_LOCAL, 'deadline', None)
+
+    @staticmethod
+    @contextmanager
+    def deadline_scope(deadline: float = None):
+        """Bound manager reads made by this thread by monotonic deadline.
+
+        Scopes nest, the earliest deadline wins. Each thread has its
+        own deadline, so concurrent updates do not share one.
+        """
+        previous = getattr(_LOCAL, 'deadline', None)
+        if deadline is not None and previous is not None:
+            deadline = min(deadline, previous)
+        elif deadline is None:
+            deadline = previous
+        _LOCAL.deadline = deadline
+        try:
+            yield deadline
         finally:
-            return (response, status_code)  # pylint: disable=W0150
+            _LOCAL.deadline = previous
+
+    @staticmethod
+    def send_started(timeout: float = None):
+        """Mark request of this thread as sent with timeout.
+
+        Transports that queue requests call this when a request leaves
+        the queue, so that latency records and hedge delays do not
+        include time spent waiting in the queue.
+        """
+        _LOCAL.sent = time.monotonic(), timeout
+        callback = getattr(_LOCAL, 'on_send', None)
+        _LOCAL.on_send = None
+        if callback is not None:
+            callback()
+
+    @classmethod
+    def time_left(cls, api: str, method: str, json: dict = None,
+                  manager=None) -> float:
+        """Return seconds left before the update deadline of this thread.
+
+        Only manager read calls are bounded by the deadline, None is
+        returned for other calls and threads without a deadline.
+        """
+        deadline = cls.current_deadline()
+        if manager is None or deadline is None or api == LOGIN_API or \
+                cls.request_kind(api, method, json) != 'read':
+            return None
+        return deadline - time.monotonic()
+
+    @classmethod
+    def dispatch(cls, api: str, method: str, json: dict = None,
+                 headers: dict = None, manager=None,
+                 timeout: float = None) -> tuple:
+        """Wait for rate limit budget of manager and send request.
+
+        Calls refused by the rate limiter return (None, THROTTLED).
+        Without a timeout the request times out after the adaptive
+        timeout of the endpoint kept by the latency tracker of the
+        manager, which records the latency of answered requests and of
+        timed out requests as at least their timeout.
+        Detail reads not answered within the hedging percentile latency
+        are sent a second time if the rate limit budget allows.
+        Latency and hedge delays are measured from when a queueing
+        transport sends the request. Reads are not sent after the
+        update deadline of the calling thread and time out when it is
+        reached.
+        """
+        latency = None
+        limiter = None
+        hedger = None
+        left = cls.time_left(api, method, json, manager)
+        if manager is not None:
+            latency = manager.latency
+            limiter = manager.rate_limiter
+            hedger = manager.hedger
+            if limiter is not None and not limiter.acquire(
+                    cls.request_kind(api, method, json), left):
+                return None, THROTTLED
+        if timeout is None and latency is not None:
+            timeout = latency.timeout(api)
+        if left is not None:
+            left = cls.time_left(api, method, json, manager)
+            if left <= 0:
+                return None, None
+            timeout = min(timeout, left) if timeout else left
+
+        queued = manager is not None and \
+            getattr(manager.transport, 'queued', False) is True
+
+        def send(on_send=None):
+            _LOCAL.sent = None
+            _LOCAL.on_send = on_send
+            start = time.monotonic()
+            try:
+                if not queued:
+                    cls.send_started(timeout)
+                result = cls.send_request(api, method, json, headers,
+                                          manager, timeout)
+            finally:
+                _LOCAL.on_send = None
+                if on_send is not None:
+                    on_send()
+            start, sent_timeout = _LOCAL.sent or (start, timeout)
+            elapsed = time.monotonic() - start
+            if latency is not None:
+                if result[1] is not None and result[1] != THROTTLED:
+                    latency.record(api, elapsed)
+                elif result[1] is None and sent_timeout and \
+                        elapsed >= sent_timeout:
+                    latency.record(api, max(elapsed, sent_timeout))
+            return result
+
+        if hedger is not None and latency is not None \
+                and cls.hedgeable(api, method, json):
+            delay = latency.latency(api, hedger.percentile)
+            if delay is not None:
+                started = threading.Event()
+                return hedger.run(lambda: send(started.set), delay,
+                                  lambda: limiter is None
+                                  or limiter.try_acquire('read'), started)
+        return send()
+
+    @staticmethod
+    def request_key(api: str, method: str, json: dict = None) -> tuple:
+        """Return key identifying calls with the same meaning.
+
+        The traceId and token of the body do not change the response
+        and are ignored.
+        """
+        if json is None:
+            return method, api, None
+        body = {k: v for k, v in json.items()
+                if k not in ('traceId', 'token')}
+        return method, api, dumps(body, sort_keys=True, default=str)
+
+    @classmethod
+    def call_api(cls, api: str, method: str, json: dict = None,
+                 headers: dict = None, manager=None, retry: bool = None,
+                 timeout: float = None):
+        """Make API calls by passing endpoint, header and body.
+
+        Successful read calls to endpoints with a TTL in the response
+        cache of the manager are answered from the cache while fresh.
+        Identical read calls of a manager that are in flight at the
+        same time share one request and response. timeout overrides
+        the adaptive timeout of each request in seconds.
+        """
+        if manager is None or api == LOGIN_API \
+                or cls.request_kind(api, method, json) != 'read':
+            return cls._call_api(api, method, json, headers, manager, retry,
+                                 timeout)
+
+        key = cls.request_key(api, method, json)
+        cache = manager.response_cache
+        ttl = cache.ttl(api) if cache is not None else 0
+        if ttl:
+            cached = cache.get(key)
+            if cached is not None:
+                _LOGGER.debug("[%s] '%s' api response from cache",
+                              method, api)
+                return cached
+
+        if manager.single_flight is not None:
+            result = manager.single_flight.do(
+                key, lambda: cls._call_api(api, method, json, headers,
+                                           manager, retry, timeout))
+        else:
+            result = cls._call_api(api, method, json, headers, manager,
+                                   retry, timeout)
+
+        response = result[0]
+        if ttl and isinstance(response, dict) \
+                and response.get('code', 0) == 0:
+            cache.set(key, result, ttl)
+        return result
+
+    @classmethod
+    def _call_api(cls, api: str, method: str, json: dict = None,
+                  headers: dict = None, manager=None, retry: bool = None,
+                  timeout: float = None):
+        """Send API call with retries, circuit breaker and token refresh.
+
+        Read calls of a manager are retried with its retry policy,
+        calls that change device state only when retry is True. Calls
+        to an endpoint family whose circuit is open return (None, None)
+        without being sent.
+        When the token of a manager call has expired, the manager logs
+        in again once for all waiting callers and the request is sent
+        again with the new token.
+        Reads after the update deadline of the thread and calls refused
+        by the rate limiter return (None, None) and are not counted as
+        failures by the breaker.
+        """
+        policy = None
+        breaker = None
+        if manager is not None:
+            policy = manager.retry_policy
+            if retry is None:
+                retry = cls.request_kind(api, method, json) == 'read'
+            if api != LOGIN_API:
+                breaker = manager.circuit_breaker
+        left = cls.time_left(api, method, json, manager)
+        if left is not None and left <= 0:
+            _LOGGER.debug('Update deadline passed, skipping %s', api)
+            return None, None
+        family = cls.endpoint_family(api)
+        if breaker is not None and not breaker.allow(family):
+            _LOGGER.debug('Circuit open for %s, skipping call', family)
+            return None, None
+
+        def send():
+            if policy is not None and retry:
+                return policy.run(lambda: cls.dispatch(
+                    api, method, json, headers, manager, timeout),
+                    cls.time_left(api, method, json, manager))
+            return cls.dispatch(api, method, json, headers, manager, timeout)
+
+        response, status_code = None, None
+        success = False
+        try:
+            response, status_code = send()
+
+            if manager is not None and api != LOGIN_API and \
+                    cls.token_expired(response, status_code):
+                stale_token = (headers or {}).get(
+                    'tk', (json or {}).get('token'))
+                if manager.relogin(stale_token):
+                    headers, json = cls.update_auth(manager, headers, json)
+                    response, status_code = send()
+
+            left = cls.time_left(api, method, json, manager)
+            if breaker is None or status_code == THROTTLED or (
+                    status_code is None and left is not None and left <= 0):
+                success = None
+            else:
+                success = status_code is not None and status_code < 500
+        finally:
+            if breaker is not None:
+                if success is None:
+                    breaker.release(family)
+                else:
+                    breaker.record(family, success)
+
+        if status_code != 200:
+            return None, None
+        return response, status_code
 
     @staticmethod
     def code_check(r: dict) -> bool:
@@ -195,6 +587,28 @@ class Helpers:
             return True
         return False
 
+    @staticmethod
+    def unique_meters(outlets) -> list:
+        """Return first outlet of each energy meter.
+
+        Plugs of an outdoor unit share one meter and are counted once.
+        """
+        meters = {}
+        for outlet in outlets:
+            meters.setdefault(outlet.meter_id, outlet)
+        return list(meters.values())
+
+    @classmethod
+    def energy_total(cls, outlets, period: str = 'week') -> float:
+        """Return energy of outlets for week, month or year in kWh."""
+        return sum(outlet.energy.get(period, {}).get('total_energy', 0)
+                   for outlet in cls.unique_meters(outlets))
+
+    @classmethod
+    def power_total(cls, outlets) -> float:
+        """Return current power of outlets in watts."""
+        return sum(outlet.power for outlet in cls.unique_meters(outlets))
+
     @staticmethod
     def build_details_dict(r: dict) -> dict:
         """Build details dictionary from API response."""
@@ -0,0 +1,75 @@
+"""Rolling latency statistics and adaptive timeouts for API endpoints."""
+
+import math
+import threading
+from collections import deque
+
+from pyvesync_v2.helpers import API_TIMEOUT
+
+DEFAULT_WINDOW = 100
+DEFAULT_MIN_SAMPLES = 10
+DEFAULT_PERCENTILE = 99
+DEFAULT_MULTIPLIER = 2
+DEFAULT_FLOOR = 0.5
+
+
+class LatencyTracker:
+    """Track recent latencies of each endpoint path.
+
+    The timeout of an endpoint is multiplier times its latency
+    percentile over the last window calls, kept between floor and
+    ceiling seconds. Endpoints with fewer than min_samples calls use
+    the ceiling.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW,
+                 percentile: float = DEFAULT_PERCENTILE,
+                 multiplier: float = DEFAULT_MULTIPLIER,
+                 floor: float = DEFAULT_FLOOR,
+                 ceiling: float = API_TIMEOUT,
+                 min_samples: int = DEFAULT_MIN_SAMPLES):
+        """Initialize tracker."""
+        self.window = window
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = max(1, min_samples)
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, key, seconds: float):
+        """Record latency of a call to key."""
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = deque(maxlen=self.window)
+                self._samples[key] = samples
+            samples.append(seconds)
+
+    def latency(self, key, percentile: float = None) -> float:
+        """Return latency percentile of key, None without enough calls."""
+        if percentile is None:
+            percentile = self.percentile
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = math.ceil(percentile / 100 * len(ordered)) - 1
+        return ordered[min(max(index, 0), len(ordered) - 1)]
+
+    def timeout(self, key) -> float:
+        """Return timeout in seconds for the next call to key."""
+        latency = self.latency(key)
+        if latency is None:
+            return self.ceiling
+        return min(self.ceiling, max(self.floor, latency * self.multiplier))
+
+    def reset(self, key=None):
+        """Forget latencies of key, or of all endpoints."""
+        with self._lock:
+            if key is None:
+                self._samples.clear()
+            else:
+                self._samples.pop(key, None)
@@ -0,0 +1,80 @@
+"""Exponential probe backoff for offline VeSync devices."""
+
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PROBE_BACKOFF = 60
+DEFAULT_MAX_PROBE_BACKOFF = 3600
+
+
+class OfflineTracker:
+    """Poll offline devices less and less often.
+
+    Devices found offline by a detail call or the device list are
+    probed again after backoff seconds, doubling after each offline
+    or unanswered probe up to max_backoff. A device is polled normally
+    again as soon as a probe or the device list shows it online.
+    Devices are keyed by (cid, sub_device_no).
+    """
+
+    def __init__(self, backoff: float = DEFAULT_PROBE_BACKOFF,
+                 max_backoff: float = DEFAULT_MAX_PROBE_BACKOFF):
+        """Initialize tracker with first and maximum probe delay."""
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._offline = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(dev) -> tuple:
+        """Return tracking key of device."""
+        return dev.cid, dev.sub_device_no
+
+    def __len__(self):
+        """Return number of offline devices."""
+        return len(self._offline)
+
+    def is_offline(self, dev) -> bool:
+        """Return True if device is tracked as offline."""
+        return self.key(dev) in self._offline
+
+    def due(self, dev) -> bool:
+        """Return True if device is online or its next probe is due."""
+        with self._lock:
+            entry = self._offline.get(self.key(dev))
+        return entry is None or time.time() >= entry[1]
+
+    def record(self, dev):
+        """Track device from its connection status after a probe."""
+        if dev.connection_status == 'online':
+            self.online(dev)
+            return
+        self._back_off(dev)
+
+    def failed(self, dev):
+        """Back off device known to be offline whose probe failed."""
+        if self.is_offline(dev) or dev.connection_status != 'online':
+            self._back_off(dev)
+
+    def _back_off(self, dev):
+        """Double delay before next probe of offline device."""
+        with self._lock:
+            probes = self._offline.get(self.key(dev), (0, 0))[0] + 1
+            delay = min(self.max_backoff, self.backoff * 2 ** (probes - 1))
+            self._offline[self.key(dev)] = (probes, time.time() + delay)
+        _LOGGER.debug('%s offline, next probe in %d seconds',
+                      dev.device_name, delay)
+
+    def online(self, dev):
+        """Return device to normal polling."""
+        with self._lock:
+            if self._offline.pop(self.key(dev), None) is not None:
+                _LOGGER.debug('%s back online', dev.device_name)
+
+    def forget(self, key: tuple):
+        """Stop tracking removed device with key."""
+        with self._lock:
+            self._offline.pop(key, None)
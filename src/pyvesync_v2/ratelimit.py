@@ -0,0 +1,94 @@
+"""Client side rate limiting for VeSync API calls."""
+
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_READ_RATE = 10
+DEFAULT_WRITE_RATE = 5
+
+
+class TokenBucket:
+    """Token bucket allowing rate calls per second with bursts."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        """Initialize bucket with refill rate and capacity.
+
+        Capacity defaults to one second of calls, and at least one
+        call so that rates below one call per second work. The bucket
+        starts full.
+        """
+        if rate <= 0:
+            raise ValueError('Rate must be greater than 0')
+        if capacity is not None and capacity < 1:
+            raise ValueError('Capacity must be at least 1')
+        self.rate = float(rate)
+        self.capacity = float(max(1, capacity or rate))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add tokens for the time since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity,
+                           self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def try_acquire(self) -> bool:
+        """Take a token without waiting - return False if empty."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self, timeout: float = None) -> bool:
+        """Take a token, waiting up to timeout seconds for one."""
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining < wait:
+                    return False
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """Separate token buckets for read and write API calls.
+
+    Reads are detail, energy, configuration and device list calls.
+    Writes change device state. One limiter can be passed to several
+    VeSync managers to share the budget between them.
+    """
+
+    def __init__(self, read_rate: float = DEFAULT_READ_RATE,
+                 write_rate: float = DEFAULT_WRITE_RATE,
+                 read_burst: float = None, write_burst: float = None):
+        """Initialize limiter with calls per second for reads and writes."""
+        self.buckets = {
+            'read': TokenBucket(read_rate, read_burst),
+            'write': TokenBucket(write_rate, write_burst)
+        }
+
+    def try_acquire(self, kind: str = 'read') -> bool:
+        """Take a token for kind of call without waiting."""
+        return self.buckets[kind].try_acquire()
+
+    def acquire(self, kind: str = 'read', timeout: float = None) -> bool:
+        """Wait for a token for kind of call."""
+        if self.buckets[kind].acquire(timeout):
+            return True
+        _LOGGER.debug('Rate limit reached for %s calls', kind)
+        return False
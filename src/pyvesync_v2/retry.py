@@ -0,0 +1,78 @@
+"""Retry policy for VeSync API calls."""
+
+import logging
+import random
+import time
+
+from pyvesync_v2.helpers import THROTTLED
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_MAX_BACKOFF = 5
+DEFAULT_JITTER = 0.5
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter for failed API calls.
+
+    A call is retried when no response was received or the server
+    returned 429 or a 5xx status, up to max_attempts in total. Calls
+    refused by the local rate limiter are not retried. The
+    delay before retry n is backoff * 2 ** (n - 1), capped at
+    max_backoff and reduced by a random fraction up to jitter.
+    deadline limits the total seconds spent on one call.
+    """
+
+    def __init__(self, max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 backoff: float = DEFAULT_BACKOFF,
+                 max_backoff: float = DEFAULT_MAX_BACKOFF,
+                 jitter: float = DEFAULT_JITTER,
+                 deadline: float = None):
+        """Initialize retry policy."""
+        self.max_attempts = max(1, max_attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = min(max(jitter, 0), 1)
+        self.deadline = deadline
+
+    @staticmethod
+    def retryable(status_code) -> bool:
+        """Return True if call failed with a transient error."""
+        if status_code == THROTTLED:
+            return False
+        return status_code is None or status_code == 429 \
+            or status_code >= 500
+
+    def delay(self, attempt: int) -> float:
+        """Return seconds to wait after failed attempt number."""
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return delay * (1 - random.uniform(0, self.jitter))
+
+    def run(self, send, deadline: float = None) -> tuple:
+        """Call send() until it succeeds or the policy is exhausted.
+
+        send returns a (response, status_code) tuple. deadline further
+        limits the seconds spent on this call.
+        """
+        if deadline is None:
+            deadline = self.deadline
+        elif self.deadline is not None:
+            deadline = min(deadline, self.deadline)
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            response, status_code = send()
+            if not self.retryable(status_code) \
+                    or attempt >= self.max_attempts:
+                return response, status_code
+            delay = self.delay(attempt)
+            if deadline is not None and \
+                    time.monotonic() - start + delay > deadline:
+                _LOGGER.debug('Retry deadline reached')
+                return response, status_code
+            _LOGGER.debug('Retrying call in %.2f seconds, attempt %d of %d',
+                          delay, attempt + 1, self.max_attempts)
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,91 @@
+"""Per device detail poll scheduling for manager updates."""
+
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_POLL_GROWTH = 2
+
+
+class PollScheduler:
+    """Give each device its own next detail poll time.
+
+    Each device class sets poll_intervals, the (fast, idle) seconds
+    between detail calls. A device whose state just changed, or that
+    is subscribed, is polled at the fast interval. Each poll without
+    a change multiplies its interval by growth up to the idle
+    interval. Devices not polled yet are due at once. Devices are
+    keyed by (cid, sub_device_no).
+    """
+
+    def __init__(self, growth: float = DEFAULT_POLL_GROWTH):
+        """Initialize scheduler with interval growth factor."""
+        self.growth = growth
+        self._schedule = {}
+        self._subscribed = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(dev) -> tuple:
+        """Return scheduling key of device."""
+        return dev.cid, dev.sub_device_no
+
+    def due(self, dev, now: float = None) -> bool:
+        """Return True if next poll of device is due."""
+        next_due = self.next_due(dev)
+        return next_due is None or \
+            (time.time() if now is None else now) >= next_due
+
+    def next_due(self, dev) -> float:
+        """Return time of next poll of device, None if not polled yet."""
+        with self._lock:
+            entry = self._schedule.get(self.key(dev))
+        return None if entry is None else entry[1]
+
+    def interval(self, dev) -> float:
+        """Return current poll interval of device."""
+        with self._lock:
+            entry = self._schedule.get(self.key(dev))
+        return dev.poll_intervals[0] if entry is None else entry[0]
+
+    def record(self, dev, changed: bool = False):
+        """Schedule next poll of device after a detail call."""
+        fast, idle = dev.poll_intervals
+        key = self.key(dev)
+        with self._lock:
+            entry = self._schedule.get(key)
+            if changed or entry is None or key in self._subscribed:
+                interval = fast
+            else:
+                interval = min(idle, max(fast, entry[0] * self.growth))
+            self._schedule[key] = (interval, time.time() + interval)
+
+    def promote(self, dev):
+        """Poll device at once and at the fast interval after that."""
+        fast = dev.poll_intervals[0]
+        with self._lock:
+            self._schedule[self.key(dev)] = (fast, time.time())
+        _LOGGER.debug('%s changed, polling details', dev.device_name)
+
+    def subscribe(self, dev):
+        """Keep polling device at the fast interval."""
+        with self._lock:
+            self._subscribed.add(self.key(dev))
+        self.promote(dev)
+
+    def unsubscribe(self, dev):
+        """Let poll interval of device grow while it is idle."""
+        with self._lock:
+            self._subscribed.discard(self.key(dev))
+
+    def subscribed(self, dev) -> bool:
+        """Return True if device is subscribed."""
+        return self.key(dev) in self._subscribed
+
+    def forget(self, key: tuple):
+        """Stop scheduling removed device with key."""
+        with self._lock:
+            self._schedule.pop(key, None)
+            self._subscribed.discard(key)
@@ -0,0 +1,58 @@
+"""Coalesce identical concurrent VeSync API calls."""
+
+import threading
+
+
+class _Call:
+    """Call in flight and its result."""
+
+    def __init__(self):
+        """Initialize in flight call."""
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Share one result between identical calls made at the same time.
+
+    The first caller for a key runs the function while later callers
+    with the same key wait for and return its result. The key is
+    released as soon as the call finishes, so results are not cached.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self) -> int:
+        """Return number of calls in flight."""
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key, func):
+        """Return result of func(), shared with callers of the same key."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
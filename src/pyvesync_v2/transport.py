@@ -0,0 +1,253 @@
+"""Transports sending VeSync API requests."""
+
+import heapq
+import itertools
+import json as jsonlib
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+
+from pyvesync_v2.helpers import (Helpers as helpers, API_BASE_URL,
+                                 API_TIMEOUT, DEFAULT_POOL_SIZE, THROTTLED)
+
+_LOGGER = logging.getLogger(__name__)
+
+NOT_FOUND = 404
+# Seconds a poll waits before it is ordered like a new command
+DEFAULT_AGING = 2
+
+
+class Transport:
+    """Base class of transports used by the VeSync manager.
+
+    send() returns a (response, status_code) tuple. The response is
+    the decoded body of calls answered with status 200, None otherwise.
+    The status code is None when no response was received. Transports
+    that queue requests set queued and call Helpers.send_started()
+    when a request leaves the queue.
+    """
+
+    queued = False
+
+    def send(self, method: str, path: str, json: dict = None,
+             headers: dict = None, timeout: float = None) -> tuple:
+        """Send request to API path and return response and status.
+
+        timeout overrides the default timeout of the transport.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Release resources held by the transport."""
+
+
+class SessionTransport(Transport):
+    """Send requests through a pooled requests session.
+
+    base_url can point the library at a local stand-in server.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE,
+                 base_url: str = API_BASE_URL, timeout: float = API_TIMEOUT,
+                 session=None):
+        """Initialize transport with keep-alive connection pool."""
+        self.base_url = base_url
+        self.timeout = timeout
+        if session is None:
+            session = helpers.build_session(pool_size)
+        self.session = session
+
+    def send(self, method: str, path: str, json: dict = None,
+             headers: dict = None, timeout: float = None) -> tuple:
+        """Send request through session."""
+        return helpers.http_send(self.session, method, self.base_url + path,
+                                 json, headers, timeout or self.timeout)
+
+    def close(self):
+        """Close pooled connections of session."""
+        self.session.close()
+
+
+class PriorityTransport(Transport):
+    """Limit requests in flight and send commands ahead of polls.
+
+    At most max_in_flight requests are sent through the wrapped
+    transport at once. Waiting requests are sent in order of arrival,
+    except that calls changing device state are placed ahead of reads
+    that arrived less than aging seconds before them, so polls are
+    delayed by commands but never starved. A request still waiting
+    when its timeout expires is not sent and returns
+    (None, THROTTLED), otherwise it is sent with the time left.
+    """
+
+    queued = True
+
+    def __init__(self, transport: Transport = None,
+                 max_in_flight: int = DEFAULT_POOL_SIZE,
+                 aging: float = DEFAULT_AGING):
+        """Initialize with wrapped transport, a session one by default."""
+        self.transport = transport or SessionTransport(max_in_flight)
+        self.max_in_flight = max(1, max_in_flight)
+        self.aging = aging
+        self._waiting = []
+        self._in_flight = 0
+        self._order = itertools.count()
+        self._cond = threading.Condition()
+
+    @property
+    def session(self):
+        """Return requests session of wrapped transport."""
+        return getattr(self.transport, 'session', None)
+
+    def _acquire(self, interactive: bool, timeout: float = None) -> float:
+        """Wait up to timeout seconds for a free slot in priority order.
+
+        Return seconds spent waiting, None if timeout expired first.
+        """
+        start = time.monotonic()
+        rank = start if interactive else start + self.aging
+        entry = (rank, next(self._order))
+        waited = False
+        with self._cond:
+            heapq.heappush(self._waiting, entry)
+            while self._in_flight >= self.max_in_flight or \
+                    self._waiting[0] != entry:
+                remaining = None
+                if timeout is not None:
+                    remaining = start + timeout - time.monotonic()
+                    if remaining <= 0:
+                        self._waiting.remove(entry)
+                        heapq.heapify(self._waiting)
+                        self._cond.notify_all()
+                        return None
+                waited = True
+                self._cond.wait(remaining)
+            heapq.heappop(self._waiting)
+            self._in_flight += 1
+            self._cond.notify_all()
+        return time.monotonic() - start if waited else 0
+
+    def _release(self):
+        """Free slot and wake waiting requests."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def send(self, method: str, path: str, json: dict = None,
+             headers: dict = None, timeout: float = None) -> tuple:
+        """Send request when its turn comes."""
+        waited = self._acquire(
+            helpers.request_kind(path, method, json) == 'write', timeout)
+        if waited is None:
+            _LOGGER.debug('Timed out waiting to send [%s] %s', method, path)
+            return None, THROTTLED
+        try:
+            if timeout is not None and waited:
+                timeout = max(0.001, timeout - waited)
+            helpers.send_started(timeout)
+            return self.transport.send(method, path, json, headers,
+                                       timeout=timeout)
+        finally:
+            self._release()
+
+    def close(self):
+        """Close wrapped transport."""
+        self.transport.close()
+
+
+class FakeTransport(Transport):
+    """In process transport answering from a table of routes.
+
+    routes maps (method, path) tuples to a (response, status_code)
+    tuple or to a callable taking the body and headers and returning
+    one. Unknown routes are answered with status 404. Sent requests
+    are kept in calls.
+    """
+
+    def __init__(self, routes: dict = None):
+        """Initialize fake transport with routes."""
+        self.routes = dict(routes or {})
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def add_route(self, method: str, path: str, result):
+        """Answer requests to path with result."""
+        self.routes[(method, path)] = result
+
+    def send(self, method: str, path: str, json: dict = None,
+             headers: dict = None, timeout: float = None) -> tuple:
+        """Return response of route."""
+        with self._lock:
+            self.calls.append((method, path, json, headers))
+        result = self.routes.get((method, path))
+        if result is None:
+            _LOGGER.debug('No fake route for [%s] %s', method, path)
+            return None, NOT_FOUND
+        if callable(result):
+            return result(json, headers)
+        return result
+
+
+class RecordReplayTransport(Transport):
+    """Record interactions of a transport or replay recorded ones.
+
+    With a transport every request is sent through it and recorded.
+    Request bodies and headers are not recorded so that recordings do
+    not hold credentials. Without a transport, recorded responses are
+    replayed in order for each method and path, and exhausted routes
+    are answered with status 404.
+    """
+
+    def __init__(self, transport: Transport = None,
+                 interactions: list = None):
+        """Initialize recording or replaying transport."""
+        self.transport = transport
+        self.interactions = list(interactions or [])
+        self._replay = defaultdict(deque)
+        for item in self.interactions:
+            self._replay[(item['method'], item['path'])].append(
+                (item['response'], item['status_code']))
+        self._lock = threading.Lock()
+
+    @property
+    def queued(self) -> bool:
+        """Return True if recorded transport queues requests."""
+        return getattr(self.transport, 'queued', False)
+
+    @classmethod
+    def load(cls, path: str) -> 'RecordReplayTransport':
+        """Return replaying transport from recording file."""
+        with open(path) as f:
+            return cls(interactions=jsonlib.load(f))
+
+    def save(self, path: str):
+        """Write recorded interactions to file."""
+        with self._lock:
+            interactions = list(self.interactions)
+        with open(path, 'w') as f:
+            jsonlib.dump(interactions, f, indent=2)
+
+    def send(self, method: str, path: str, json: dict = None,
+             headers: dict = None, timeout: float = None) -> tuple:
+        """Send and record request, or replay recorded response."""
+        if self.transport is None:
+            with self._lock:
+                queue = self._replay.get((method, path))
+                if queue:
+                    return queue.popleft()
+            _LOGGER.debug('No recorded response for [%s] %s', method, path)
+            return None, NOT_FOUND
+
+        response, status_code = self.transport.send(
+            method, path, json, headers, timeout=timeout)
+        with self._lock:
+            self.interactions.append({
+                'method': method, 'path': path,
+                'status_code': status_code, 'response': response})
+        return response, status_code
+
+    def close(self):
+        """Close recorded transport."""
+        if self.transport is not None:
+            self.transport.close()
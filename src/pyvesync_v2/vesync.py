@@ -1,10 +1,24 @@
 """VeSync API Device Libary."""
 
+import functools
 import logging
+import random
 import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from itertools import chain
-from pyvesync_v2.helpers import Helpers as helpers
+from pyvesync_v2.helpers import (Helpers as helpers, DEFAULT_POOL_SIZE,
+                                 LOGIN_API)
+from pyvesync_v2.breaker import CircuitBreaker
+from pyvesync_v2.cache import ResponseCache
+from pyvesync_v2.hedge import Hedger
+from pyvesync_v2.latency import LatencyTracker
+from pyvesync_v2.offline import OfflineTracker
+from pyvesync_v2.retry import RetryPolicy
+from pyvesync_v2.scheduler import PollScheduler
+from pyvesync_v2.singleflight import SingleFlight
+from pyvesync_v2.transport import SessionTransport, PriorityTransport
 from pyvesync_v2.vesyncoutlet import (VeSyncOutlet7A, VeSyncOutlet10A,
                                       VeSyncOutlet15A, VeSyncOutdoorPlug)
 from pyvesync_v2.vesyncswitch import VeSyncWallSwitch, VeSyncDimmerSwitch
@@ -17,6 +31,28 @@ API_RATE_LIMIT = 30
 DEFAULT_TZ = 'America/New_York'
 
 DEFAULT_ENER_UP_INT = 21600
+DEFAULT_ENER_JITTER = 0.02
+# Week, month and year energy of an outlet are fetched concurrently
+DEFAULT_ENER_WORKERS = 3
+DEFAULT_MAX_WORKERS = 1
+DEVICE_PAGE_SIZE = 50
+DEVICE_PAGE_WORKERS = 4
+DEFAULT_RETRY = RetryPolicy()
+
+
+class UpdateReport(dict):
+    """Errors of an update keyed by device, with refreshed devices.
+
+    refreshed lists devices updated before the deadline, stale lists
+    devices whose call raised an error, returned False or finished
+    after it.
+    """
+
+    def __init__(self):
+        """Initialize empty report."""
+        super().__init__()
+        self.refreshed = []
+        self.stale = []
 
 
 def get_device(device_type, config, manager):
@@ -46,23 +82,55 @@ def get_device(device_type, config, manager):
 class VeSync:
     """VeSync API functions."""
 
-    def __init__(self, username, password, time_zone=DEFAULT_TZ):
-        """Initilize VeSync class with username, password and time zone."""
+    def __init__(self, username, password, time_zone=DEFAULT_TZ,
+                 pool_size=DEFAULT_POOL_SIZE, max_workers=DEFAULT_MAX_WORKERS,
+                 rate_limiter=None, retry_policy=DEFAULT_RETRY,
+                 transport=None):
+        """Initilize VeSync class with username, password and time zone.
+
+        pool_size sets the maximum number of keep-alive connections
+        held open to the API by the default session transport, whose
+        requests are queued with commands ahead of polls. transport
+        replaces it with another Transport. max_workers sets
+        the default number of threads used to update devices.
+        rate_limiter is an optional RateLimiter, which can be shared
+        between managers, used to throttle API calls. retry_policy is
+        the RetryPolicy for failed calls, None disables retries.
+        """
         self.username = username
         self.password = password
+        if transport is None:
+            transport = PriorityTransport(SessionTransport(pool_size),
+                                          max_in_flight=pool_size)
+        self.transport = transport
         self.token = None
         self.account_id = None
+        self._req_templates = None
         self.devices = None
         self.outlets = []
         self.switches = []
         self.fans = []
         self.bulbs = []
+        self._dev_index = {}
         self.enabled = False
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.circuit_breaker = CircuitBreaker()
+        self.single_flight = SingleFlight()
+        self.response_cache = ResponseCache()
+        self.latency = LatencyTracker()
+        self.hedger = Hedger()
+        self.offline = OfflineTracker()
+        self.scheduler = PollScheduler()
         self.update_interval = API_RATE_LIMIT
         self.last_update_ts = None
         self.in_process = False
         self._energy_update_interval = DEFAULT_ENER_UP_INT
         self._energy_check = True
+        self.energy_jitter = DEFAULT_ENER_JITTER
+        self._login_lock = threading.Lock()
+        self._relogin_failed = (None, 0)
 
         if isinstance(time_zone, str) and time_zone:
             reg_test = r"[^a-zA-Z/_]"
@@ -88,40 +156,81 @@ class VeSync:
             self._energy_update_interval = new_energy_update
 
     @staticmethod
-    def remove_dev_test(device, new_list):
-        """Test if device should be removed - False = Remove."""
-        if isinstance(new_list, list) and device.cid:
-            for item in new_list:
-                device_found = False
-                if 'cid' in item:
-                    if device.cid == item['cid']:
-                        device_found = True
-                        break
-                else:
-                    _LOGGER.error('No cid found in - %s', str(item))
-            if not device_found:
-                _LOGGER.debug("Device removed - %s - %s", device.device_name,
-                              device.device_type)
-                return False
-        return True
+    def dev_key(details: dict) -> tuple:
+        """Return (cid, subDeviceNo) index key of device list entry."""
+        return details.get('cid'), details.get('subDeviceNo', 0)
+
+    def index_devices(self):
+        """Rebuild (cid, sub_device_no) index from the device lists.
+
+        add_devices() and remove_missing_devices() keep the index in
+        sync, this is only needed after assigning the lists directly.
+        """
+        devices = [self.outlets, self.bulbs, self.switches, self.fans]
+        self._dev_index = {(dev.cid, dev.sub_device_no): dev
+                           for dev in chain(*devices)}
+
+    def add_devices(self, outlets, switches, fans, bulbs):
+        """Add new devices to the device lists and index.
+
+        New outlets are given their place in the energy update stagger.
+        """
+        self.schedule_energy(outlets, refreshed=False)
+        self.outlets.extend(outlets)
+        self.switches.extend(switches)
+        self.fans.extend(fans)
+        self.bulbs.extend(bulbs)
+        for dev in chain(outlets, switches, fans, bulbs):
+            if getattr(dev, 'cid', None) is not None:
+                self._dev_index[(dev.cid, dev.sub_device_no)] = dev
+
+    def get_device_by_cid(self, cid, sub_device_no=0):
+        """Return device with cid and sub device number or None."""
+        return self._dev_index.get((cid, sub_device_no))
 
     def add_dev_test(self, new_dev):
         """Test if new device should be added - True = Add."""
         if 'cid' in new_dev:
-            devices = [self.outlets, self.bulbs, self.switches, self.fans]
-            was_found = False
-            for dev in chain(*devices):
-                if dev.cid == new_dev.get('cid') and\
-                        new_dev.get('subDeviceNo', 0) == dev.sub_device_no:
-                    was_found = True
-                    break
-            if not was_found:
+            if self.dev_key(new_dev) not in self._dev_index:
                 _LOGGER.debug("Adding device - %s", new_dev)
                 return True
         return False
 
-    def process_devices(self, devices) -> tuple:
-        """Call VSFactory to instantiate device classes."""
+    def remove_missing_devices(self, keys):
+        """Remove devices whose (cid, subDeviceNo) key is not in keys."""
+        for key in set(self._dev_index) - set(keys):
+            dev = self._dev_index.pop(key)
+            self.scheduler.forget(key)
+            if self.offline is not None:
+                self.offline.forget(key)
+            _LOGGER.debug("Device removed - %s - %s", dev.device_name,
+                          dev.device_type)
+
+        def in_index(dev):
+            return (dev.cid, dev.sub_device_no) in self._dev_index
+
+        self.outlets[:] = [x for x in self.outlets if in_index(x)]
+        for dev in self.outlets:
+            _LOGGER.debug('Outlets updated - %s', str(dev))
+
+        self.fans[:] = [x for x in self.fans if in_index(x)]
+        for dev in self.fans:
+            _LOGGER.debug('Fans Updated - %s', str(dev))
+
+        self.switches[:] = [x for x in self.switches if in_index(x)]
+        for dev in self.switches:
+            _LOGGER.debug('Switches Updated - %s', str(dev))
+
+        self.bulbs[:] = [x for x in self.bulbs if in_index(x)]
+        for dev in self.bulbs:
+            _LOGGER.debug('Bulbs - %s', str(dev))
+
+    def process_devices(self, devices, remove_missing=True) -> tuple:
+        """Call VSFactory to instantiate device classes.
+
+        Devices missing from the list are removed unless remove_missing
+        is False, which is used to process one page of a longer list.
+        """
         outlets = []
         switches = []
         fans = []
@@ -134,38 +243,29 @@ class VeSync:
         fan_types = ['LV-PUR131S']
         bulb_types = ['ESL100', 'ESL100CW']
 
-        num_devices = len(self.outlets) + len(self.switches) + len(self.fans) \
-            + len(self.bulbs)
-
-        if not num_devices and devices:
+        if not self._dev_index and devices:
             _LOGGER.debug('New device list initialized')
         elif not devices:
             _LOGGER.warning('No devices found in api return')
         else:
-            self.outlets[:] = [
-                x for x in self.outlets if self.remove_dev_test(x, devices)
-            ]
-            for dev in self.outlets:
-                _LOGGER.debug('Outlets updated - %s', str(dev))
-
-            self.fans[:] = [
-                x for x in self.fans if self.remove_dev_test(x, devices)
-            ]
-            for dev in self.fans:
-                _LOGGER.debug('Fans Updated - %s', str(dev))
-
-            self.switches[:] = [
-                x for x in self.switches if self.remove_dev_test(x, devices)
-            ]
-            for dev in self.switches:
-                _LOGGER.debug('Switches Updated - %s', str(dev))
-
-            self.bulbs[:] = [
-                x for x in self.bulbs if self.remove_dev_test(x, devices)
-            ]
-            for dev in self.bulbs:
-                _LOGGER.debug('Bulbs - %s', str(dev))
-
+            if remove_missing:
+                new_keys = set()
+                for item in devices:
+                    if 'cid' in item:
+                        new_keys.add(self.dev_key(item))
+                    else:
+                        _LOGGER.error('No cid found in - %s', str(item))
+                self.remove_missing_devices(new_keys)
+
+            for item in devices:
+                dev = self._dev_index.get(self.dev_key(item))
+                if dev is not None:
+                    state = dev.poll_state()
+                    dev.update_from_list(item)
+                    if dev.poll_state() != state:
+                        self.scheduler.promote(dev)
+                    if self.offline is not None:
+                        self.track_listed(dev)
             devices[:] = [x for x in devices if self.add_dev_test(x)]
 
         for dev in devices:
@@ -185,38 +285,105 @@ class VeSync:
             else:
                 _LOGGER.error('Details keys not found %s', str(dev))
 
+        if self.offline is not None:
+            for dev in chain(outlets, switches, fans, bulbs):
+                self.track_listed(dev)
         return outlets, switches, fans, bulbs
 
-    def get_devices(self) -> tuple:
-        """Return tuple listing outlets, switches, and fans of devices."""
-        outlets = []
-        switches = []
-        fans = []
-        bulbs = []
-        if not self.enabled:
-            return None
-
-        self.in_process = True
-
+    def track_listed(self, dev):
+        """Start probe backoff of device the device list shows offline.
+
+        Devices listed online return to normal polling. Backoff of
+        devices already tracked is left to their probes.
+        """
+        if dev.connection_status == 'online':
+            self.offline.online(dev)
+        elif not self.offline.is_offline(dev):
+            self.offline.record(dev)
+
+    def get_device_page(self, page_no: int = 1):
+        """Return result of one page of the device list or None."""
+        body = helpers.req_body(self, 'devicelist')
+        body['pageNo'] = str(page_no)
         response, _ = helpers.call_api('/cloud/v1/deviceManaged/devices',
                                        'post',
                                        headers=helpers.req_headers(self),
-                                       json=helpers.req_body(
-                                           self, 'devicelist'))
+                                       json=body,
+                                       manager=self)
 
         if response and helpers.code_check(response):
             if 'result' in response and 'list' in response['result']:
-                device_list = response['result']['list']
-                outlets, switches, fans, bulbs = self.process_devices(
-                    device_list)
-            else:
-                _LOGGER.error('Device list in response not found')
+                return response['result']
+            _LOGGER.error('Device list in response not found')
         else:
             _LOGGER.warning('Error retrieving device list')
+        return None
+
+    def get_devices(self) -> tuple:
+        """Return tuple listing outlets, switches, and fans of devices.
+
+        The first page of the device list reports the total number of
+        devices. Remaining pages are fetched concurrently on up to
+        DEVICE_PAGE_WORKERS threads, or max_workers if higher, and each
+        page is processed as it arrives. Devices are only removed when
+        every page was retrieved.
+        """
+        new_devices = ([], [], [], [])
+        if not self.enabled:
+            return None
+
+        self.in_process = True
+        seen = set()
+
+        def process_page(page):
+            entries = [x for x in page['list']
+                       if 'cid' not in x or self.dev_key(x) not in seen]
+            seen.update(self.dev_key(x) for x in entries if 'cid' in x)
+            for dev_list, new in zip(new_devices, self.process_devices(
+                    entries, remove_missing=False)):
+                dev_list.extend(new)
+
+        result = self.get_device_page(1)
+        if result is not None:
+            process_page(result)
+            complete = True
+            pages = 1
+            try:
+                total = int(result.get('total') or 0)
+                page_size = int(result.get('pageSize') or DEVICE_PAGE_SIZE)
+            except (TypeError, ValueError):
+                _LOGGER.warning('Invalid device list total %s',
+                                result.get('total'))
+                complete = False
+            else:
+                if page_size > 0 and total > page_size:
+                    pages = -(-total // page_size)
+            if pages > 1:
+                workers = min(max(self.max_workers or 1,
+                                  DEVICE_PAGE_WORKERS), pages - 1)
+                end = helpers.current_deadline()
+
+                def get_page(page_no):
+                    with helpers.deadline_scope(end):
+                        return self.get_device_page(page_no)
+
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(get_page, page_no)
+                               for page_no in range(2, pages + 1)]
+                    for future in as_completed(futures):
+                        page = future.result()
+                        if page is None:
+                            complete = False
+                        else:
+                            process_page(page)
+            if complete and seen:
+                self.remove_missing_devices(seen)
+            elif not complete:
+                _LOGGER.warning('Device list incomplete, keeping devices')
 
         self.in_process = False
 
-        return (outlets, switches, fans, bulbs)
+        return new_devices
 
     def login(self) -> bool:
         """Return True if log in request succeeds."""
@@ -229,9 +396,10 @@ class VeSync:
             _LOGGER.error('Password invalid')
             return False
 
-        response, _ = helpers.call_api('/cloud/v1/user/login',
+        response, _ = helpers.call_api(LOGIN_API,
                                        'post',
-                                       json=helpers.req_body(self, 'login'))
+                                       json=helpers.req_body(self, 'login'),
+                                       manager=self)
 
         if helpers.code_check(response) and 'result' in response:
             self.token = response.get('result').get('token')
@@ -242,41 +410,281 @@ class VeSync:
         _LOGGER.error('Error logging in with username and password')
         return False
 
+    def relogin(self, stale_token=None) -> bool:
+        """Log in again after a token expires.
+
+        Concurrent callers wait on one login. Callers holding a token
+        that was already replaced return True without logging in, and
+        a failed login is not retried for the same token within the
+        update interval.
+        """
+        with self._login_lock:
+            if self.enabled and stale_token is not None \
+                    and stale_token != self.token:
+                return True
+            failed_token, failed_ts = self._relogin_failed
+            if failed_token == stale_token and \
+                    time.time() - failed_ts < self.update_interval:
+                return False
+            _LOGGER.debug('Token expired, logging in again')
+            if self.login():
+                self._relogin_failed = (None, 0)
+                return True
+            self._relogin_failed = (stale_token, time.time())
+            return False
+
+    def run_device_calls(self, devices, method, *args,
+                         max_workers=None, deadline=None) -> UpdateReport:
+        """Call method on each device using a bounded thread pool.
+
+        Each device is called once. Exceptions are collected and
+        returned in a report keyed by device instead of stopping
+        the remaining calls. With a deadline in seconds, read calls
+        are not sent once it has passed and devices that finish late
+        are marked stale.
+        """
+        unique = list({id(dev): dev for dev in devices}.values())
+        calls = [((dev,), method,
+                  functools.partial(getattr(dev, method), *args))
+                 for dev in unique]
+        return self.run_calls(calls, max_workers, deadline)
+
+    def run_group_calls(self, devices, method, max_workers=None,
+                        deadline=None) -> UpdateReport:
+        """Call method once for each group of devices sharing API calls.
+
+        The first device of a group is called and updates the others.
+        """
+        calls = [(group, method, getattr(group[0], method))
+                 for group in self.device_groups(devices)]
+        return self.run_calls(calls, max_workers, deadline)
+
+    @staticmethod
+    def device_groups(devices) -> list:
+        """Return tuples of devices that share detail API calls.
+
+        Devices with the same unit_id, the plugs of an outdoor unit,
+        share a group, every other device is alone.
+        """
+        groups = {}
+        for dev in devices:
+            if dev.unit_id is not None:
+                key = ('unit', dev.unit_id)
+            else:
+                key = id(dev)
+            group = groups.setdefault(key, [])
+            if not any(dev is other for other in group):
+                group.append(dev)
+        return [tuple(group) for group in groups.values()]
+
+    def run_calls(self, calls, max_workers=None,
+                  deadline=None) -> UpdateReport:
+        """Run (devices, name, function) calls using a bounded thread pool.
+
+        devices is the tuple of devices updated by a call, and a device
+        can have several calls. It is refreshed when all of them finish
+        before the deadline without error and without returning False.
+        """
+        if max_workers is None:
+            max_workers = self.max_workers
+        report = UpdateReport()
+        late = set()
+        failed = set()
+        end = helpers.current_deadline()
+        if deadline is not None:
+            deadline = time.monotonic() + deadline
+            end = deadline if end is None else min(end, deadline)
+
+        def call(item):
+            devs, name, func = item
+            try:
+                with helpers.deadline_scope(end):
+                    result = func()
+            except Exception as exc:  # pylint: disable=broad-except
+                _LOGGER.warning('Error running %s on %s - %s', name,
+                                devs[0].device_name, exc)
+                for dev in devs:
+                    report[dev] = exc
+                return
+            if result is False:
+                failed.update(id(dev) for dev in devs)
+            elif end is not None and time.monotonic() > end:
+                late.update(id(dev) for dev in devs)
+
+        if max_workers is None or max_workers <= 1 or len(calls) <= 1:
+            for item in calls:
+                call(item)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(call, calls))
+
+        devices = {id(dev): dev for item in calls for dev in item[0]}
+        for dev in devices.values():
+            dev.stale = dev in report or id(dev) in late or \
+                id(dev) in failed
+            if dev.stale:
+                report.stale.append(dev)
+            else:
+                report.refreshed.append(dev)
+        if report.stale and end is not None:
+            _LOGGER.debug('%d devices not refreshed before deadline',
+                          len(report.stale))
+        return report
+
+    @property
+    def session(self):
+        """Return requests session of transport, None if it has none."""
+        return getattr(self.transport, 'session', None)
+
+    def close(self):
+        """Close pooled connections held by the manager transport."""
+        if self.hedger is not None:
+            self.hedger.close()
+        self.transport.close()
+
     def device_time_check(self) -> bool:
-        """Test if update interval has been exceeded."""
+        """Test if device list update interval has been exceeded."""
         if self.last_update_ts is None or (
                 time.time() - self.last_update_ts) > self.update_interval:
             return True
         return False
 
-    def update(self):
-        """Fetch updated information about devices."""
-        if self.device_time_check():
-
-            if not self.in_process and self.enabled:
-                outlets, switches, fans, bulbs = self.get_devices()
+    def update(self, max_workers=None, deadline=None) -> UpdateReport:
+        """Fetch updated information about devices.
+
+        Status, connection, mode and speed of known devices are
+        updated from the device list once the update interval has
+        passed. Detail calls are only made for devices whose next poll
+        is due in the manager scheduler, and for offline devices when
+        their next probe is due. deadline bounds the update, including
+        the device list, to that many seconds. Returns report of device
+        update errors keyed by device, with refreshed and stale devices.
+        """
+        report = UpdateReport()
+        if not self.in_process and self.enabled:
+            if self.device_time_check():
+                end = None
+                if deadline is not None:
+                    end = time.monotonic() + deadline
+                with helpers.deadline_scope(end):
+                    outlets, switches, fans, bulbs = self.get_devices()
+                    self.add_devices(outlets, switches, fans, bulbs)
+                if deadline is not None:
+                    deadline = end - time.monotonic()
+                self.last_update_ts = time.time()
 
-                self.outlets.extend(outlets)
-                self.switches.extend(switches)
-                self.fans.extend(fans)
-                self.bulbs.extend(bulbs)
+            devices = [self.outlets, self.bulbs, self.switches, self.fans]
+            due = self.details_due(chain(*devices))
+            states = self.poll_states(due)
+
+            report = self.run_group_calls(due, 'update',
+                                          max_workers=max_workers,
+                                          deadline=deadline)
+            self.record_details(report.refreshed, states)
+            self.record_failures(report.stale)
+        else:
+            _LOGGER.error('You are not logged in to VeSync')
+        return report
 
-                devices = [self.outlets, self.bulbs, self.switches, self.fans]
+    def details_due(self, devices) -> list:
+        """Return devices due for a detail call."""
+        now = time.time()
+        return [dev for dev in devices if self.scheduler.due(dev, now) and (
+            self.offline is None or self.offline.due(dev))]
 
-                for device in chain(*devices):
-                    device.update()
+    @staticmethod
+    def poll_states(devices) -> dict:
+        """Return poll state of devices keyed by device id."""
+        return {id(dev): dev.poll_state() for dev in devices}
 
-                self.last_update_ts = time.time()
-            else:
-                _LOGGER.error('You are not logged in to VeSync')
+    def record_details(self, devices, states=None):
+        """Record refreshed details and connection status of devices.
 
-    def update_energy(self, bypass_check=False):
-        """Fetch updated energy information about devices."""
-        for outlet in self.outlets:
-            outlet.update_energy(bypass_check)
+        Devices whose poll state differs from states are polled again
+        at their fast interval.
+        """
+        now = time.time()
+        for dev in devices:
+            dev.details_ts = now
+            changed = states is not None and \
+                states.get(id(dev)) != dev.poll_state()
+            self.scheduler.record(dev, changed)
+            if self.offline is not None:
+                self.offline.record(dev)
+
+    def record_failures(self, devices):
+        """Record failed detail calls of devices.
+
+        Failed polls are scheduled again like polls without a change,
+        so their interval grows, and devices known to be offline are
+        probed less often, instead of spending a request timeout on
+        them every update.
+        """
+        for dev in devices:
+            self.scheduler.record(dev)
+            if self.offline is not None:
+                self.offline.failed(dev)
 
-    def update_all_devices(self):
-        """Run get_details() for each device."""
+    @property
+    def energy_workers(self) -> int:
+        """Return default threads for energy calls, max_workers or more."""
+        return max(self.max_workers or 1, DEFAULT_ENER_WORKERS)
+
+    def energy_due(self) -> list:
+        """Return outlets whose energy update is due."""
+        return [dev for dev in self.outlets if dev.update_time_check]
+
+    def schedule_energy(self, outlets, refreshed: bool = True):
+        """Set next energy update time of outlets.
+
+        Outlets get a phase spread evenly across the energy update
+        interval the first time they are scheduled, when they are
+        added, and are due once per interval at their phase plus up to
+        energy_jitter of the interval, so energy calls trickle in
+        instead of all coming due at once. refreshed is False for
+        outlets whose energy was not just fetched.
+        """
+        interval = self.energy_update_interval
+        now = time.time()
+        groups = self.device_groups(outlets)
+        new = [group for group in groups if group[0].energy_phase is None]
+        for index, group in enumerate(new):
+            phase = (now / interval + (index + random.random()) / len(new)) % 1
+            for dev in group:
+                dev.energy_phase = phase
+        for group in groups:
+            offset = group[0].energy_phase * interval
+            due = offset + ((now - offset) // interval + 1) * interval
+            due += random.uniform(0, self.energy_jitter * interval)
+            for dev in group:
+                if refreshed:
+                    dev.update_energy_ts = now
+                dev.energy_due_ts = due
+
+    def update_energy(self, bypass_check=False, max_workers=None,
+                      deadline=None) -> UpdateReport:
+        """Fetch updated energy information about devices.
+
+        Only the slice of outlets whose staggered energy update is due
+        is refreshed, so this can be called often. With bypass_check
+        every outlet is refreshed and keeps its place in the stagger.
+        The week, month and year energy calls of those outlets share
+        one pool of max_workers threads, energy_workers by default.
+        Plugs of an outdoor unit share one meter and its energy is
+        fetched once. deadline bounds the update to that many seconds.
+        """
+        outlets = self.outlets if bypass_check else self.energy_due()
+        calls = [(group, func.__name__, func)
+                 for group in self.device_groups(outlets)
+                 for func in group[0].energy_calls(bypass_check)]
+        if max_workers is None:
+            max_workers = self.energy_workers
+        report = self.run_calls(calls, max_workers, deadline)
+        self.schedule_energy(report.refreshed)
+        return report
+
+    def update_all_devices(self, max_workers=None) -> dict:
+        """Run get_details() once for each device or outdoor plug unit."""
         dev_list = [self.outlets, self.fans, self.bulbs, self.switches]
-        for dev in chain(*dev_list):
-            dev.get_details()
+        return self.run_group_calls(chain(*dev_list), 'get_details',
+                                    max_workers=max_workers)
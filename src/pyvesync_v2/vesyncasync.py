@@ -0,0 +1,216 @@
+"""Asyncio interface for VeSync API."""
+
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+from pyvesync_v2.helpers import DEFAULT_POOL_SIZE
+from pyvesync_v2.vesync import VeSync, DEFAULT_TZ, DEFAULT_RETRY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncVeSyncDevice:
+    """Awaitable wrapper for VeSync device objects.
+
+    Methods of the wrapped device return coroutines that run the
+    blocking API call in the executor of the async manager. Other
+    attributes and properties are returned as is.
+    """
+
+    def __init__(self, device, manager):
+        """Initialize wrapper with device and AsyncVeSync manager."""
+        self.device = device
+        self._manager = manager
+
+    def __getattr__(self, name):
+        """Return awaitable version of device methods."""
+        attr = getattr(self.device, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def wrapper(*args, **kwargs):
+            return await self._manager.run(attr, *args, **kwargs)
+        return wrapper
+
+    def __eq__(self, other):
+        """Compare wrapped devices."""
+        if isinstance(other, AsyncVeSyncDevice):
+            other = other.device
+        return self.device == other
+
+    def __hash__(self):
+        """Use wrapped device hash."""
+        return hash(self.device)
+
+    def __str__(self):
+        """Use wrapped device string representation."""
+        return str(self.device)
+
+    def __repr__(self):
+        """Representation of wrapped device."""
+        return 'Async' + repr(self.device)
+
+
+class AsyncVeSync:
+    """Asyncio VeSync API functions.
+
+    Wraps a VeSync manager and runs its blocking calls in a thread
+    pool so that device calls of an update cycle run concurrently
+    under one event loop. concurrency limits the number of API calls
+    in flight at once.
+    """
+
+    def __init__(self, username, password, time_zone=DEFAULT_TZ,
+                 pool_size=DEFAULT_POOL_SIZE, concurrency=None,
+                 rate_limiter=None, retry_policy=DEFAULT_RETRY,
+                 transport=None):
+        """Initialize async manager with username, password and time zone."""
+        self.manager = VeSync(username, password, time_zone, pool_size,
+                              rate_limiter=rate_limiter,
+                              retry_policy=retry_policy,
+                              transport=transport)
+        self.concurrency = concurrency or pool_size
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+
+    def _wrap(self, devices) -> list:
+        """Return list of awaitable device wrappers."""
+        return [AsyncVeSyncDevice(dev, self) for dev in devices]
+
+    @property
+    def outlets(self) -> list:
+        """Return awaitable outlet devices."""
+        return self._wrap(self.manager.outlets)
+
+    @property
+    def switches(self) -> list:
+        """Return awaitable switch devices."""
+        return self._wrap(self.manager.switches)
+
+    @property
+    def fans(self) -> list:
+        """Return awaitable fan devices."""
+        return self._wrap(self.manager.fans)
+
+    @property
+    def bulbs(self) -> list:
+        """Return awaitable bulb devices."""
+        return self._wrap(self.manager.bulbs)
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if manager is logged in."""
+        return self.manager.enabled
+
+    async def run(self, func, *args, **kwargs):
+        """Run blocking function in the manager executor."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _gather(self, devices, method, *args, grouped=False) -> tuple:
+        """Call method on each device concurrently.
+
+        With grouped, method is called once for each group of devices
+        sharing API calls. Returns errors keyed by device and the list
+        of devices whose call neither raised nor returned False.
+        """
+        devices = list({id(dev): dev for dev in devices}.values())
+        if grouped:
+            groups = self.manager.device_groups(devices)
+        else:
+            groups = [(dev,) for dev in devices]
+        return await self._run_calls(
+            [(group, method, functools.partial(getattr(group[0], method),
+                                               *args))
+             for group in groups])
+
+    async def _run_calls(self, calls) -> tuple:
+        """Run (devices, name, function) calls concurrently.
+
+        Returns errors keyed by device and the list of devices all of
+        whose calls neither raised nor returned False.
+        """
+        errors = {}
+        failed = set()
+        results = await asyncio.gather(
+            *[self.run(func) for _, _, func in calls],
+            return_exceptions=True)
+        for (devs, name, _), result in zip(calls, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning('Error running %s on %s - %s', name,
+                                devs[0].device_name, result)
+                for dev in devs:
+                    errors[dev] = result
+            if isinstance(result, Exception) or result is False:
+                failed.update(id(dev) for dev in devs)
+        devices = {id(dev): dev for devs, _, _ in calls for dev in devs}
+        refreshed = [dev for key, dev in devices.items() if key not in failed]
+        return errors, refreshed
+
+    async def login(self) -> bool:
+        """Return True if log in request succeeds."""
+        return await self.run(self.manager.login)
+
+    async def get_devices(self) -> tuple:
+        """Return tuple of new awaitable outlets, switches, fans and bulbs."""
+        devices = await self.run(self.manager.get_devices)
+        if devices is None:
+            return None
+        return tuple(self._wrap(dev_list) for dev_list in devices)
+
+    async def update(self) -> dict:
+        """Fetch updated information about devices due concurrently."""
+        manager = self.manager
+        errors = {}
+        if not manager.in_process and manager.enabled:
+            if manager.device_time_check():
+                outlets, switches, fans, bulbs = await self.run(
+                    manager.get_devices)
+
+                manager.add_devices(outlets, switches, fans, bulbs)
+                manager.last_update_ts = time.time()
+
+            devices = [manager.outlets, manager.bulbs,
+                       manager.switches, manager.fans]
+
+            due = manager.details_due(chain(*devices))
+            states = manager.poll_states(due)
+            errors, refreshed = await self._gather(due, 'update',
+                                                   grouped=True)
+            manager.record_details(refreshed, states)
+            polled = {id(dev) for dev in refreshed}
+            manager.record_failures([dev for dev in due
+                                     if id(dev) not in polled])
+        else:
+            _LOGGER.error('You are not logged in to VeSync')
+        return errors
+
+    async def update_energy(self, bypass_check=False) -> dict:
+        """Fetch energy of outlets due an update concurrently."""
+        manager = self.manager
+        outlets = manager.outlets if bypass_check else manager.energy_due()
+        errors, refreshed = await self._run_calls(
+            [(group, func.__name__, func)
+             for group in manager.device_groups(outlets)
+             for func in group[0].energy_calls(bypass_check)])
+        manager.schedule_energy(refreshed)
+        return errors
+
+    async def update_all_devices(self) -> dict:
+        """Run get_details() for each device concurrently."""
+        manager = self.manager
+        dev_list = [manager.outlets, manager.fans, manager.bulbs,
+                    manager.switches]
+        errors, _ = await self._gather(chain(*dev_list), 'get_details',
+                                       grouped=True)
+        return errors
+
+    async def close(self):
+        """Close manager transport and shut down executor."""
+        self.manager.close()
+        self._executor.shutdown(wait=False)
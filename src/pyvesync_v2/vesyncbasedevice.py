@@ -2,16 +2,27 @@
 
 import logging
 import collections
-import json
+from pyvesync_v2 import codec
+
 _LOGGER = logging.getLogger(__name__)
 
+# Device list fields refreshed by update_from_list()
+LIST_FIELDS = ('deviceStatus', 'connectionStatus', 'mode', 'speed')
+
 
 class VeSyncBaseDevice:
     """Properties shared across all VeSync devices."""
 
+    # (fast, idle) seconds between detail calls scheduled by the manager
+    poll_intervals = (30, 300)
+    # Devices with the same unit_id share detail and energy calls
+    unit_id = None
+
     def __init__(self, details, manager):
         """Initilize VeSync device base class."""
         self.manager = manager
+        self.stale = False
+        self.details_ts = None
         if 'cid' in details and details['cid'] is not None:
             self.device_name = details.get('deviceName', None)
             self.device_image = details.get('deviceImg', None)
@@ -37,6 +48,25 @@ class VeSyncBaseDevice:
         else:
             _LOGGER.error('No cid found for %s', self.__class__.__name__)
 
+    def update_from_list(self, details: dict):
+        """Update status, connection, mode and speed from device list."""
+        if not any(key in details for key in LIST_FIELDS):
+            return
+        self.connection_status = details.get('connectionStatus',
+                                             self.connection_status)
+        self.mode = details.get('mode', self.mode)
+        self.speed = details.get('speed', self.speed)
+        if self.connection_status != 'online':
+            self.device_status = 'off'
+        else:
+            self.device_status = details.get('deviceStatus',
+                                             self.device_status)
+
+    def poll_state(self) -> tuple:
+        """Return state compared between polls to detect changes."""
+        return (self.device_status, self.connection_status, self.mode,
+                self.speed)
+
     def __eq__(self, other):
         """Use device CID and subdevice number to test equality."""
         return bool(other.cid == self.cid
@@ -98,9 +128,13 @@ class VeSyncBaseDevice:
         for k, v in disp1.items():
             print("{:.<15} {:<15}".format(k, v))
 
-    def display_json(self):
+    def display_json(self) -> str:
         """JSON API for device details."""
-        return json.dumps({
+        return codec.dumps_str(self.display_dict())
+
+    def display_dict(self) -> dict:
+        """Return device details shown by display_json()."""
+        return {
             'Device Name': self.device_name,
             'Model': self.device_type,
             'Subdevice No': str(self.sub_device_no),
@@ -108,4 +142,4 @@ class VeSyncBaseDevice:
             'Online': self.connection_status,
             'Type': self.type,
             'CID': self.cid
-        })
+        }
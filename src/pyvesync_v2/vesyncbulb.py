@@ -1,7 +1,6 @@
 """Etekcity Smart Light Bulb."""
 
 import logging
-import json
 from abc import ABCMeta, abstractmethod
 
 from pyvesync_v2.helpers import Helpers as helpers
@@ -11,6 +10,7 @@ _LOGGER = logging.getLogger(__name__)
 
 # Possible features - dimmable, color_temp, rgb_shift
 FEATURE_DICT = {'ESL100': ['dimmable'], 'ESL100CW': ['dimmable', 'color_temp']}
+BULB_POLL_INTERVALS = (5, 300)
 
 
 def pct_to_kelvin(pct, max_k=6500, min_k=2700):
@@ -24,12 +24,18 @@ class VeSyncBulb(VeSyncBaseDevice):
 
     __metaclass__ = ABCMeta
 
+    poll_intervals = BULB_POLL_INTERVALS
+
     def __init__(self, details, manager):
         """Initialize VeSync smart bulb base class."""
         super().__init__(details, manager)
         self._brightness = None
         self._color_temp = None
 
+    def poll_state(self) -> tuple:
+        """Return state with brightness and color temperature."""
+        return super().poll_state() + (self._brightness, self._color_temp)
+
     @property
     def brightness(self):
         """Return brightness of vesync bulb."""
@@ -98,8 +104,8 @@ class VeSyncBulb(VeSyncBaseDevice):
         return False
 
     def update(self):
-        """Update bulb details."""
-        self.get_details()
+        """Update bulb details - return True if successful."""
+        return self.get_details()
 
     def display(self):
         """Return formatted bulb info to stdout."""
@@ -110,10 +116,9 @@ class VeSyncBulb(VeSyncBaseDevice):
             for line in disp1:
                 print("{:.<17} {} {}".format(line[0], line[1], line[2]))
 
-    def display_json(self):
-        """Return bulb device info in JSON format."""
-        sup = super().display_json()
-        sup_val = json.loads(sup)
+    def display_dict(self) -> dict:
+        """Return bulb device info for JSON output."""
+        sup_val = super().display_dict()
         if self.connection_status == 'online':
             if self.dimmable_feature:
                 sup_val.update({"Brightness": str(self.brightness)})
@@ -137,14 +142,16 @@ class VeSyncBulbESL100(VeSyncBulb):
         r, _ = helpers.call_api('/SmartBulb/v1/device/devicedetail',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
         if helpers.code_check(r):
             self.connection_status = r.get('connectionStatus')
             self.device_status = r.get('deviceStatus')
             if self.dimmable_feature:
                 self._brightness = int(r.get('brightNess'))
-        else:
-            _LOGGER.debug('Error getting %s details', self.device_name)
+            return True
+        _LOGGER.debug('Error getting %s details', self.device_name)
+        return False
 
     def get_config(self):
         """Get configuration of dimmable bulb."""
@@ -155,7 +162,8 @@ class VeSyncBulbESL100(VeSyncBulb):
         r, _ = helpers.call_api('/SmartBulb/v1/device/configurations',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if helpers.code_check(r):
             self.config = helpers.build_config_dict(r)
@@ -170,7 +178,8 @@ class VeSyncBulbESL100(VeSyncBulb):
         r, _ = helpers.call_api('/SmartBulb/v1/device/devicestatus',
                                 'put',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
         if helpers.code_check(r):
             self.device_status = status
             return True
@@ -193,7 +202,8 @@ class VeSyncBulbESL100(VeSyncBulb):
         r, _ = helpers.call_api('/SmartBulb/v1/device/updateBrightness',
                                 'put',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if helpers.code_check(r):
             self._brightness = brightness
@@ -219,7 +229,11 @@ class VeSyncBulbESL100CW(VeSyncBulb):
         r, _ = helpers.call_api('/cloud/v1/deviceManaged/bypass',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
+        if not isinstance(r, dict):
+            _LOGGER.debug('Error getting %s details', self.device_name)
+            return False
         if r.get('code') == 0 and r.get('result').get('light') is not None:
             light = r.get('result').get('light')
             self.connection_status = 'online'
@@ -228,13 +242,15 @@ class VeSyncBulbESL100CW(VeSyncBulb):
                 self._brightness = light.get('brightness')
             if self.color_temp_feature:
                 self._color_temp = light.get('colorTempe')
-        elif r.get('code') == -11300027:
+            return True
+        if r.get('code') == -11300027:
             _LOGGER.debug('%s device offline', self.device_name)
             self.connection_status = 'offline'
             self.device_status = 'off'
-        else:
-            _LOGGER.warning('%s - Unknown return code - %d with message %s',
-                            self.device_name, r.get('code'), r.get('msg'))
+            return True
+        _LOGGER.warning('%s - Unknown return code - %d with message %s',
+                        self.device_name, r.get('code'), r.get('msg'))
+        return False
 
     def get_config(self):
         """Get configuration and firmware info of tunable bulb."""
@@ -244,7 +260,8 @@ class VeSyncBulbESL100CW(VeSyncBulb):
         r, _ = helpers.call_api('/cloud/v1/deviceManaged/configurations',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if helpers.code_check(r):
             self.config = helpers.build_config_dict(r)
@@ -260,8 +277,9 @@ class VeSyncBulbESL100CW(VeSyncBulb):
         r, _ = helpers.call_api('/cloud/v1/deviceManaged/bypass',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
-        if r.get('code') == 0:
+                                json=body,
+                                manager=self.manager)
+        if helpers.code_check(r):
             self.device_status = status
             return True
         _LOGGER.debug('%s offline', self.device_name)
@@ -289,7 +307,8 @@ class VeSyncBulbESL100CW(VeSyncBulb):
         r, _ = helpers.call_api('/cloud/v1/deviceManaged/bypass',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if helpers.code_check(r):
             self._brightness = brightness
@@ -316,8 +335,13 @@ class VeSyncBulbESL100CW(VeSyncBulb):
         r, _ = helpers.call_api('/cloud/v1/deviceManaged/bypass',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
+        if not isinstance(r, dict):
+            _LOGGER.debug('Error setting %s color temperature',
+                          self.device_name)
+            return False
         if r.get('code') == -11300027:
             _LOGGER.debug('%s device offline', self.device_name)
             self.connection_status = 'offline'
@@ -1,6 +1,5 @@
 """VeSync API for controling fans and purifiers."""
 
-import json
 import logging
 from pyvesync_v2.vesyncbasedevice import VeSyncBaseDevice
 from pyvesync_v2.helpers import Helpers as helpers
@@ -17,6 +16,11 @@ class VeSyncAir131(VeSyncBaseDevice):
 
         self.details = {}
 
+    def poll_state(self) -> tuple:
+        """Return state with fan level and air quality."""
+        return super().poll_state() + (self.details.get('level'),
+                                       self.details.get('air_quality'))
+
     def get_details(self):
         """Build details dictionary."""
         body = helpers.req_body(self.manager, 'devicedetail')
@@ -26,7 +30,8 @@ class VeSyncAir131(VeSyncBaseDevice):
         r, _ = helpers.call_api('/131airPurifier/v1/device/deviceDetail',
                                 method='post',
                                 headers=head,
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if r is not None and helpers.code_check(r):
             self.device_status = r.get('deviceStatus', 'unknown')
@@ -37,8 +42,9 @@ class VeSyncAir131(VeSyncBaseDevice):
             self.mode = r.get('mode', self.mode)
             self.details['level'] = r.get('level', 0)
             self.details['air_quality'] = r.get('airQuality', 'unknown')
-        else:
-            _LOGGER.debug('Error getting %s details', self.device_name)
+            return True
+        _LOGGER.debug('Error getting %s details', self.device_name)
+        return False
 
     def get_config(self):
         """Get configuration info for air purifier."""
@@ -49,7 +55,8 @@ class VeSyncAir131(VeSyncBaseDevice):
         r, _ = helpers.call_api('/131airpurifier/v1/device/configurations',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if helpers.code_check(r):
             self.config = helpers.build_config_dict(r)
@@ -108,7 +115,8 @@ class VeSyncAir131(VeSyncBaseDevice):
             r, _ = helpers.call_api('/131airPurifier/v1/device/deviceStatus',
                                     'put',
                                     json=body,
-                                    headers=head)
+                                    headers=head,
+                                    manager=self.manager)
 
             if r is not None and helpers.code_check(r):
                 self.device_status = 'on'
@@ -127,7 +135,8 @@ class VeSyncAir131(VeSyncBaseDevice):
             r, _ = helpers.call_api('/131airPurifier/v1/device/deviceStatus',
                                     'put',
                                     json=body,
-                                    headers=head)
+                                    headers=head,
+                                    manager=self.manager)
 
             if r is not None and helpers.code_check(r):
                 self.device_status = 'off'
@@ -185,7 +194,8 @@ class VeSyncAir131(VeSyncBaseDevice):
         r, _ = helpers.call_api('/131airPurifier/v1/device/updateSpeed',
                                 'put',
                                 json=body,
-                                headers=head)
+                                headers=head,
+                                manager=self.manager)
 
         if r is not None and helpers.code_check(r):
             self.details['level'] = body['level']
@@ -206,7 +216,8 @@ class VeSyncAir131(VeSyncBaseDevice):
             r, _ = helpers.call_api('/131airPurifier/v1/device/updateMode',
                                     'put',
                                     json=body,
-                                    headers=head)
+                                    headers=head,
+                                    manager=self.manager)
 
             if r is not None and helpers.code_check(r):
                 self.mode = mode
@@ -216,8 +227,8 @@ class VeSyncAir131(VeSyncBaseDevice):
         return False
 
     def update(self):
-        """Run function to get device details."""
-        self.get_details()
+        """Get device details - return True if successful."""
+        return self.get_details()
 
     def display(self):
         """Return formatted device info to stdout."""
@@ -231,11 +242,10 @@ class VeSyncAir131(VeSyncBaseDevice):
         for line in disp1:
             print("{:.<15} {} {}".format(line[0], line[1], line[2]))
 
-    def display_json(self):
+    def display_dict(self) -> dict:
         """Return air purifier status and properties in JSON output."""
-        sup = super().display_json()
-        sup_val = json.loads(sup)
-        sup_val.append({
+        sup_val = super().display_dict()
+        sup_val.update({
             "Active Time": str(self.active_time),
             "Fan Level": self.fan_level,
             "Air Quality": self.air_quality,
@@ -258,7 +268,8 @@ class VeSyncAir131(VeSyncBaseDevice):
         r, _ = helpers.call_api('/131airPurifier/v1/device/updateScreen',
                                 'put',
                                 json=body,
-                                headers=head)
+                                headers=head,
+                                manager=self.manager)
 
         if r is not None and helpers.code_check(r):
             self.details['screen_status'] = mode
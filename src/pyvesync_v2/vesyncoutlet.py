@@ -2,7 +2,6 @@
 
 import logging
 import time
-import json
 from abc import ABCMeta, abstractmethod
 
 from pyvesync_v2.helpers import Helpers as helpers
@@ -10,12 +9,17 @@ from pyvesync_v2.vesyncbasedevice import VeSyncBaseDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+# Power readings change without a state change, so outlets stay fresher
+OUTLET_POLL_INTERVALS = (30, 120)
+
 
 class VeSyncOutlet(VeSyncBaseDevice):
     """Base class for Etekcity Outlets."""
 
     __metaclass__ = ABCMeta
 
+    poll_intervals = OUTLET_POLL_INTERVALS
+
     def __init__(self, details, manager):
         """Initilize VeSync Outlet base class."""
         super().__init__(details, manager)
@@ -23,11 +27,20 @@ class VeSyncOutlet(VeSyncBaseDevice):
         self.details = {}
         self.energy = {}
         self.update_energy_ts = None
+        self.energy_due_ts = None
+        self.energy_phase = None
         self._energy_update_interval = manager.energy_update_interval
 
+    @property
+    def meter_id(self):
+        """Return id of the energy meter measuring this outlet."""
+        return self.cid
+
     @property
     def update_time_check(self) -> bool:
-        """Test if energy update interval has been exceeded."""
+        """Test if energy is due, or update interval has been exceeded."""
+        if self.energy_due_ts is not None:
+            return time.time() >= self.energy_due_ts
         if self.update_energy_ts is not None:
             return bool((time.time() - self.update_energy_ts)
                         > self._energy_update_interval)
@@ -62,19 +75,32 @@ class VeSyncOutlet(VeSyncBaseDevice):
         """Get configuration and firmware details."""
 
     def update(self):
-        """Get Device Energy and Status."""
-        self.get_details()
+        """Get device status - return True if successful."""
+        return self.get_details()
 
-    def update_energy(self, bypass_check: bool = False):
-        """Build weekly, monthly and yearly dictionaries."""
-        if bypass_check or (not bypass_check and self.update_time_check):
+    def energy_calls(self, bypass_check: bool = False) -> list:
+        """Return energy methods to call, empty if energy is up to date."""
+        if bypass_check or self.update_time_check:
             self.update_energy_ts = time.time()
-            self.get_weekly_energy()
-            if 'week' in self.energy:
-                self.get_monthly_energy()
-                self.get_yearly_energy()
-            if not bypass_check:
-                self.update_energy_ts = time.time()
+            self.energy_due_ts = None
+            return [self.get_weekly_energy, self.get_monthly_energy,
+                    self.get_yearly_energy]
+        return []
+
+    def update_energy(self, bypass_check: bool = False) -> bool:
+        """Build weekly, monthly and yearly dictionaries.
+
+        The energy calls run concurrently through the manager, see
+        VeSync.run_calls, and the next energy update is scheduled at
+        the phase of the outlet. Return False if one of them failed.
+        """
+        calls = [((self,), call.__name__, call)
+                 for call in self.energy_calls(bypass_check)]
+        if not calls:
+            return True
+        report = self.manager.run_calls(calls, self.manager.energy_workers)
+        self.manager.schedule_energy(report.refreshed)
+        return not report.stale
 
     @property
     def active_time(self) -> int:
@@ -124,10 +150,9 @@ class VeSyncOutlet(VeSyncBaseDevice):
         for line in disp1:
             print("{:.<15} {} {}".format(line[0], line[1], line[2]))
 
-    def display_json(self):
-        """Return JSON details for outlet."""
-        sup = super().display_json()
-        sup_val = json.loads(sup)
+    def display_dict(self) -> dict:
+        """Return details of outlet for JSON output."""
+        sup_val = super().display_dict()
         sup_val.update({
             "Active Time": str(self.active_time),
             "Energy": str(self.energy_today),
@@ -168,7 +193,8 @@ class VeSyncOutlet7A(VeSyncOutlet):
         """Get 7A outlet details."""
         r, _ = helpers.call_api('/v1/device/' + self.cid + '/detail',
                                 'get',
-                                headers=helpers.req_headers(self.manager))
+                                headers=helpers.req_headers(self.manager),
+                                manager=self.manager)
 
         if r is not None and all(x in r for x in self.det_keys):
             self.device_status = r.get('deviceStatus', self.device_status)
@@ -180,48 +206,56 @@ class VeSyncOutlet7A(VeSyncOutlet):
             voltage = r.get('voltage', '0:0')
             voltage = round(float(helpers.calculate_hex(voltage)), 2)
             self.details['voltage'] = voltage
-        else:
-            _LOGGER.debug('Unable to get %s details', self.device_name)
+            return True
+        _LOGGER.debug('Unable to get %s details', self.device_name)
+        return False
 
     def get_weekly_energy(self):
         """Get 7A outlet weekly energy info and buld weekly energy dict."""
         r, _ = helpers.call_api('/v1/device/' + self.cid + '/energy/week',
                                 'get',
-                                headers=helpers.req_headers(self.manager))
+                                headers=helpers.req_headers(self.manager),
+                                manager=self.manager)
 
         if r is not None and all(x in r for x in self.energy_keys):
             self.energy['week'] = helpers.build_energy_dict(r)
-        else:
-            _LOGGER.debug('Unable to get %s weekly data', self.device_name)
+            return True
+        _LOGGER.debug('Unable to get %s weekly data', self.device_name)
+        return False
 
     def get_monthly_energy(self):
         """Get 7A outlet monthly energy info and buld monthly energy dict."""
         r, _ = helpers.call_api('/v1/device/' + self.cid + '/energy/month',
                                 'get',
-                                headers=helpers.req_headers(self.manager))
+                                headers=helpers.req_headers(self.manager),
+                                manager=self.manager)
 
         if r is not None and all(x in r for x in self.energy_keys):
             self.energy['month'] = helpers.build_energy_dict(r)
-        else:
-            _LOGGER.warning('Unable to get %s monthly data', self.device_name)
+            return True
+        _LOGGER.warning('Unable to get %s monthly data', self.device_name)
+        return False
 
     def get_yearly_energy(self):
         """Get 7A outlet yearly energy info and build yearly energy dict."""
         r, _ = helpers.call_api('/v1/device/' + self.cid + '/energy/year',
                                 'get',
-                                headers=helpers.req_headers(self.manager))
+                                headers=helpers.req_headers(self.manager),
+                                manager=self.manager)
 
         if r is not None and all(x in r for x in self.energy_keys):
             self.energy['year'] = helpers.build_energy_dict(r)
-        else:
-            _LOGGER.debug('Unable to get %s yearly data', self.device_name)
+            return True
+        _LOGGER.debug('Unable to get %s yearly data', self.device_name)
+        return False
 
     def turn_on(self):
         """Turn 7A outlet on - return True if successful."""
         _, status_code = helpers.call_api(
             '/v1/wifi-switch-1.3/' + self.cid + '/status/on',
             'put',
-            headers=helpers.req_headers(self.manager))
+            headers=helpers.req_headers(self.manager),
+            manager=self.manager)
 
         if status_code is not None and status_code == 200:
             self.device_status = 'on'
@@ -235,7 +269,8 @@ class VeSyncOutlet7A(VeSyncOutlet):
         _, status_code = helpers.call_api(
             '/v1/wifi-switch-1.3/' + self.cid + '/status/off',
             'put',
-            headers=helpers.req_headers(self.manager))
+            headers=helpers.req_headers(self.manager),
+            manager=self.manager)
 
         if status_code is not None and status_code == 200:
             self.device_status = 'off'
@@ -248,9 +283,10 @@ class VeSyncOutlet7A(VeSyncOutlet):
         """Get 7A outlet configuration info."""
         r, _ = helpers.call_api('/v1/device/' + self.cid + '/configurations',
                                 'get',
-                                headers=helpers.req_headers(self.manager))
+                                headers=helpers.req_headers(self.manager),
+                                manager=self.manager)
 
-        if 'currentFirmVersion' in r:
+        if r is not None and 'currentFirmVersion' in r:
             self.config = helpers.build_config_dict(r)
         else:
             _LOGGER.debug("Error getting configuration info for %s",
@@ -272,15 +308,17 @@ class VeSyncOutlet10A(VeSyncOutlet):
         r, _ = helpers.call_api('/10a/v1/device/devicedetail',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if helpers.code_check(r):
             self.device_status = r.get('deviceStatus', self.device_status)
             self.connection_status = r.get('connectionStatus',
                                            self.connection_status)
             self.details = helpers.build_details_dict(r)
-        else:
-            _LOGGER.debug('Unable to get %s details', self.device_name)
+            return True
+        _LOGGER.debug('Unable to get %s details', self.device_name)
+        return False
 
     def get_config(self):
         """Get 10A outlet configuration info."""
@@ -291,7 +329,8 @@ class VeSyncOutlet10A(VeSyncOutlet):
         r, _ = helpers.call_api('/10a/v1/device/configurations',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if helpers.code_check(r):
             self.config = helpers.build_config_dict(r)
@@ -307,12 +346,14 @@ class VeSyncOutlet10A(VeSyncOutlet):
                                        'post',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             self.energy['week'] = helpers.build_energy_dict(response)
-        else:
-            _LOGGER.debug('Unable to get %s weekly data', self.device_name)
+            return True
+        _LOGGER.debug('Unable to get %s weekly data', self.device_name)
+        return False
 
     def get_monthly_energy(self):
         """Get 10A outlet monthly energy info and populate energy dict."""
@@ -323,12 +364,14 @@ class VeSyncOutlet10A(VeSyncOutlet):
                                        'post',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             self.energy['month'] = helpers.build_energy_dict(response)
-        else:
-            _LOGGER.debug('Unable to get %s monthly data', self.device_name)
+            return True
+        _LOGGER.debug('Unable to get %s monthly data', self.device_name)
+        return False
 
     def get_yearly_energy(self):
         """Get 10A outlet yearly energy info and populate energy dict."""
@@ -339,12 +382,14 @@ class VeSyncOutlet10A(VeSyncOutlet):
                                        'post',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             self.energy['year'] = helpers.build_energy_dict(response)
-        else:
-            _LOGGER.debug('Unable to get %s yearly data', self.device_name)
+            return True
+        _LOGGER.debug('Unable to get %s yearly data', self.device_name)
+        return False
 
     def turn_on(self):
         """Turn 10A outlet on - return True if successful."""
@@ -356,7 +401,8 @@ class VeSyncOutlet10A(VeSyncOutlet):
                                        'put',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             self.device_status = 'on'
@@ -374,7 +420,8 @@ class VeSyncOutlet10A(VeSyncOutlet):
                                        'put',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             self.device_status = 'off'
@@ -398,7 +445,8 @@ class VeSyncOutlet15A(VeSyncOutlet):
         r, _ = helpers.call_api('/15a/v1/device/devicedetail',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         attr_list = ('deviceStatus', 'activeTime', 'energy', 'power',
                      'voltage', 'nightLightStatus', 'nightLightAutomode',
@@ -409,8 +457,9 @@ class VeSyncOutlet15A(VeSyncOutlet):
             self.device_status = r.get('deviceStatus')
             self.connection_status = r.get('connectionStatus')
             self.details = helpers.build_details_dict(r)
-        else:
-            _LOGGER.debug('Unable to get %s details', self.device_name)
+            return True
+        _LOGGER.debug('Unable to get %s details', self.device_name)
+        return False
 
     def get_config(self):
         """Get 15A outlet configuration info."""
@@ -421,7 +470,8 @@ class VeSyncOutlet15A(VeSyncOutlet):
         r, _ = helpers.call_api('/15a/v1/device/configurations',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if helpers.code_check(r):
             self.config = helpers.build_config_dict(r)
@@ -437,12 +487,14 @@ class VeSyncOutlet15A(VeSyncOutlet):
                                        'post',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             self.energy['week'] = helpers.build_energy_dict(response)
-        else:
-            _LOGGER.debug('Unable to get %s weekly data', self.device_name)
+            return True
+        _LOGGER.debug('Unable to get %s weekly data', self.device_name)
+        return False
 
     def get_monthly_energy(self):
         """Get 15A outlet monthly energy info and populate energy dict."""
@@ -453,12 +505,14 @@ class VeSyncOutlet15A(VeSyncOutlet):
                                        'post',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             self.energy['month'] = helpers.build_energy_dict(response)
-        else:
-            _LOGGER.debug('Unable to get %s monthly data', self.device_name)
+            return True
+        _LOGGER.debug('Unable to get %s monthly data', self.device_name)
+        return False
 
     def get_yearly_energy(self):
         """Get 15A outlet yearly energy info and populate energy dict."""
@@ -469,12 +523,14 @@ class VeSyncOutlet15A(VeSyncOutlet):
                                        'post',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             self.energy['year'] = helpers.build_energy_dict(response)
-        else:
-            _LOGGER.debug('Unable to get %s yearly data', self.device_name)
+            return True
+        _LOGGER.debug('Unable to get %s yearly data', self.device_name)
+        return False
 
     def turn_on(self):
         """Turn 15A outlet on - return True if successful."""
@@ -486,7 +542,8 @@ class VeSyncOutlet15A(VeSyncOutlet):
                                        'put',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             self.device_status = 'on'
@@ -504,7 +561,8 @@ class VeSyncOutlet15A(VeSyncOutlet):
                                        'put',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             self.device_status = 'off'
@@ -523,7 +581,8 @@ class VeSyncOutlet15A(VeSyncOutlet):
                                        'put',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             return True
@@ -539,7 +598,8 @@ class VeSyncOutlet15A(VeSyncOutlet):
                                        'put',
                                        headers=helpers.req_headers(
                                            self.manager),
-                                       json=body)
+                                       json=body,
+                                       manager=self.manager)
 
         if helpers.code_check(response):
             return True
@@ -553,26 +613,49 @@ class VeSyncOutdoorPlug(VeSyncOutlet):
         """Initialize Etekcity Outdoor Plug class."""
         super().__init__(details, manager)
 
+    @property
+    def meter_id(self):
+        """Return uuid of the outdoor unit, whose meter both plugs share."""
+        return self.uuid
+
+    @property
+    def unit_id(self):
+        """Return uuid of the outdoor unit holding this plug."""
+        return self.uuid
+
+    def siblings(self) -> list:
+        """Return this plug and manager plugs of the same outdoor unit."""
+        return [self] + [dev for dev in self.manager.outlets
+                         if isinstance(dev, VeSyncOutdoorPlug)
+                         and dev is not self and dev.uuid == self.uuid]
+
     def get_details(self):
-        """Get details for outdoor outlet."""
+        """Get details for all plugs of the outdoor unit in one call."""
         body = helpers.req_body(self.manager, 'devicedetail')
         body['uuid'] = self.uuid
         r, _ = helpers.call_api('/outdoorsocket15a/v1/device/devicedetail',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if helpers.code_check(r):
-            self.details = helpers.build_details_dict(r)
-            self.connection_status = r.get('connectionStatus')
+            for plug in self.siblings():
+                plug.apply_details(r)
+            return True
+        _LOGGER.debug('Unable to get %s details', self.device_name)
+        return False
 
-            dev_no = self.sub_device_no
-            sub_device_list = r.get('subDevices')
-            if sub_device_list and dev_no <= len(sub_device_list):
-                self.device_status = sub_device_list[(
-                    dev_no + -1)].get('subDeviceStatus')
-        else:
-            _LOGGER.debug('Unable to get %s details', self.device_name)
+    def apply_details(self, r: dict):
+        """Update plug from outdoor unit detail response."""
+        self.details = helpers.build_details_dict(r)
+        self.connection_status = r.get('connectionStatus')
+
+        dev_no = self.sub_device_no
+        sub_device_list = r.get('subDevices')
+        if sub_device_list and dev_no <= len(sub_device_list):
+            self.device_status = sub_device_list[(
+                dev_no + -1)].get('subDeviceStatus')
 
     def get_config(self):
         """Get configuration info for outdoor outlet."""
@@ -583,7 +666,8 @@ class VeSyncOutdoorPlug(VeSyncOutlet):
         r, _ = helpers.call_api('/outdoorsocket15a/v1/device/configurations',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if helpers.code_check(r):
             self.config = helpers.build_config_dict(r)
@@ -591,7 +675,7 @@ class VeSyncOutdoorPlug(VeSyncOutlet):
             _LOGGER.debug("Error getting %s config info", self.device_name)
 
     def get_weekly_energy(self):
-        """Get outdoor outlet weekly energy info and populate energy dict."""
+        """Get outdoor unit weekly energy info for all its plugs."""
         body = helpers.req_body(self.manager, 'energy_week')
         body['uuid'] = self.uuid
 
@@ -599,15 +683,19 @@ class VeSyncOutdoorPlug(VeSyncOutlet):
             '/outdoorsocket15a/v1/device/energyweek',
             'post',
             headers=helpers.req_headers(self.manager),
-            json=body)
+            json=body,
+            manager=self.manager)
 
         if helpers.code_check(response):
-            self.energy['week'] = helpers.build_energy_dict(response)
-        else:
-            _LOGGER.debug('Unable to get %s weekly data', self.device_name)
+            energy = helpers.build_energy_dict(response)
+            for plug in self.siblings():
+                plug.energy['week'] = energy
+            return True
+        _LOGGER.debug('Unable to get %s weekly data', self.device_name)
+        return False
 
     def get_monthly_energy(self):
-        """Get outdoor outlet monthly energy info and populate energy dict."""
+        """Get outdoor unit monthly energy info for all its plugs."""
         body = helpers.req_body(self.manager, 'energy_month')
         body['uuid'] = self.uuid
 
@@ -615,15 +703,19 @@ class VeSyncOutdoorPlug(VeSyncOutlet):
             '/outdoorsocket15a/v1/device/energymonth',
             'post',
             headers=helpers.req_headers(self.manager),
-            json=body)
+            json=body,
+            manager=self.manager)
 
         if helpers.code_check(response):
-            self.energy['month'] = helpers.build_energy_dict(response)
-        else:
-            _LOGGER.debug('Unable to get %s monthly data', self.device_name)
+            energy = helpers.build_energy_dict(response)
+            for plug in self.siblings():
+                plug.energy['month'] = energy
+            return True
+        _LOGGER.debug('Unable to get %s monthly data', self.device_name)
+        return False
 
     def get_yearly_energy(self):
-        """Get outdoor outlet yearly energy info and populate energy dict."""
+        """Get outdoor unit yearly energy info for all its plugs."""
         body = helpers.req_body(self.manager, 'energy_year')
         body['uuid'] = self.uuid
 
@@ -631,12 +723,16 @@ class VeSyncOutdoorPlug(VeSyncOutlet):
             '/outdoorsocket15a/v1/device/energyyear',
             'post',
             headers=helpers.req_headers(self.manager),
-            json=body)
+            json=body,
+            manager=self.manager)
 
         if helpers.code_check(response):
-            self.energy['year'] = helpers.build_energy_dict(response)
-        else:
-            _LOGGER.debug('Unable to get %s yearly data', self.device_name)
+            energy = helpers.build_energy_dict(response)
+            for plug in self.siblings():
+                plug.energy['year'] = energy
+            return True
+        _LOGGER.debug('Unable to get %s yearly data', self.device_name)
+        return False
 
     def toggle(self, status):
         """Toggle power for outdoor outlet."""
@@ -649,7 +745,8 @@ class VeSyncOutdoorPlug(VeSyncOutlet):
             '/outdoorsocket15a/v1/device/devicestatus',
             'put',
             headers=helpers.req_headers(self.manager),
-            json=body)
+            json=body,
+            manager=self.manager)
 
         if helpers.code_check(response):
             self.device_status = status
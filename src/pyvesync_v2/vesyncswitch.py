@@ -1,13 +1,18 @@
 """Classes for VeSync Switch Devices."""
 
 import logging
-import json
 from abc import ABCMeta, abstractmethod
 
 from pyvesync_v2.helpers import Helpers as helpers
 from pyvesync_v2.vesyncbasedevice import VeSyncBaseDevice
 
 _LOGGER = logging.getLogger(__name__)
+
+# The device list has the on/off state of standard wall switches, so
+# their details are only fetched for active time
+WALL_SWITCH_POLL_INTERVALS = (3600, 3600)
+# Dimmer brightness changes are polled quickly
+DIMMER_POLL_INTERVALS = (5, 300)
 FEATURE_DICT = {
     'ESWL01': [],
     'ESWD16': ['dimmable']
@@ -52,13 +57,15 @@ class VeSyncSwitch(VeSyncBaseDevice):
         return self.details.get('active_time', 0)
 
     def update(self):
-        """Update device details."""
-        self.get_details()
+        """Update device details - return True if successful."""
+        return self.get_details()
 
 
 class VeSyncWallSwitch(VeSyncSwitch):
     """Etekcity standard wall switch class."""
 
+    poll_intervals = WALL_SWITCH_POLL_INTERVALS
+
     def __init__(self, details, manager):
         """Initialize standard etekcity wall switch class."""
         super().__init__(details, manager)
@@ -72,15 +79,17 @@ class VeSyncWallSwitch(VeSyncSwitch):
         r, _ = helpers.call_api('/inwallswitch/v1/device/devicedetail',
                                 'post',
                                 headers=head,
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if r is not None and helpers.code_check(r):
             self.device_status = r.get('deviceStatus', self.device_status)
             self.details['active_time'] = r.get('activeTime', 0)
             self.connection_status = r.get('connectionStatus',
                                            self.connection_status)
-        else:
-            _LOGGER.debug('Error getting %s details', self.device_name)
+            return True
+        _LOGGER.debug('Error getting %s details', self.device_name)
+        return False
 
     def get_config(self):
         """Get switch device configuration info."""
@@ -91,7 +100,8 @@ class VeSyncWallSwitch(VeSyncSwitch):
         r, _ = helpers.call_api('/inwallswitch/v1/device/configurations',
                                 'post',
                                 headers=helpers.req_headers(self.manager),
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if helpers.code_check(r):
             self.config = helpers.build_config_dict(r)
@@ -108,7 +118,8 @@ class VeSyncWallSwitch(VeSyncSwitch):
         r, _ = helpers.call_api('/inwallswitch/v1/device/devicestatus',
                                 'put',
                                 headers=head,
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if r is not None and helpers.code_check(r):
             self.device_status = 'off'
@@ -126,7 +137,8 @@ class VeSyncWallSwitch(VeSyncSwitch):
         r, _ = helpers.call_api('/inwallswitch/v1/device/devicestatus',
                                 'put',
                                 headers=head,
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if r is not None and helpers.code_check(r):
             self.device_status = 'on'
@@ -138,6 +150,8 @@ class VeSyncWallSwitch(VeSyncSwitch):
 class VeSyncDimmerSwitch(VeSyncSwitch):
     """Vesync Dimmer Switch Class with RGB Faceplate."""
 
+    poll_intervals = DIMMER_POLL_INTERVALS
+
     def __init__(self, details, manager):
         """Initilize dimmer switch class."""
         super().__init__(details, manager)
@@ -146,6 +160,11 @@ class VeSyncDimmerSwitch(VeSyncSwitch):
         self._rgb_status = None
         self._indicator_light = None
 
+    def poll_state(self) -> tuple:
+        """Return state with brightness and faceplate light."""
+        return super().poll_state() + (
+            self._brightness, self._rgb_status, self._indicator_light)
+
     def get_details(self):
         """Get dimmer switch details."""
         body = helpers.req_body(self.manager, 'devicedetail')
@@ -155,7 +174,8 @@ class VeSyncDimmerSwitch(VeSyncSwitch):
         r, _ = helpers.call_api('/dimmer/v1/device/devicedetail',
                                 'post',
                                 headers=head,
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if r is not None and helpers.code_check(r):
             self.device_status = r.get('deviceStatus', self.device_status)
@@ -166,8 +186,9 @@ class VeSyncDimmerSwitch(VeSyncSwitch):
             self._rgb_status = r.get('rgbStatus')
             self._rgb_value = r.get('rgbValue')
             self._indicator_light = r.get('indicatorlightStatus')
-        else:
-            _LOGGER.debug('Error getting %s details', self.device_name)
+            return True
+        _LOGGER.debug('Error getting %s details', self.device_name)
+        return False
 
     @property
     def brightness(self):
@@ -202,7 +223,8 @@ class VeSyncDimmerSwitch(VeSyncSwitch):
         r, _ = helpers.call_api('/dimmer/v1/device/devicestatus',
                                 'put',
                                 headers=head,
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if r is not None and helpers.code_check(r):
             self.device_status = status
@@ -232,7 +254,8 @@ class VeSyncDimmerSwitch(VeSyncSwitch):
         r, _ = helpers.call_api('/dimmer/v1/device/indicatorlightstatus',
                                 'put',
                                 headers=head,
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if r is not None and helpers.code_check(r):
             self.device_status = status
@@ -266,7 +289,8 @@ class VeSyncDimmerSwitch(VeSyncSwitch):
         r, _ = helpers.call_api('/dimmer/v1/device/devicergbstatus',
                                 'put',
                                 headers=head,
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if r is not None and helpers.code_check(r):
             self._rgb_status = status
@@ -310,7 +334,8 @@ class VeSyncDimmerSwitch(VeSyncSwitch):
         r, _ = helpers.call_api('/dimmer/v1/device/updatebrightness',
                                 'put',
                                 headers=head,
-                                json=body)
+                                json=body,
+                                manager=self.manager)
 
         if r is not None and helpers.code_check(r):
             self._brightness = brightness
@@ -318,10 +343,9 @@ class VeSyncDimmerSwitch(VeSyncSwitch):
         _LOGGER.warning('Error setting %s brightness', self.device_name)
         return False
 
-    def display_json(self):
-        """JSON API for dimmer switch."""
-        sup = super().display_json()
-        sup_val = json.loads(sup)
+    def display_dict(self) -> dict:
+        """Return details of dimmer switch for JSON output."""
+        sup_val = super().display_dict()
         if self.is_dimmable is True:
             sup_val.update({
                 "Indicator Light": str(self.active_time),
@@ -0,0 +1,34 @@
+"""Shared fixtures for pyvesync_v2 tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyvesync_v2 import VeSync
+
+
+@pytest.fixture()
+def make_manager():
+    """Return factory of logged in VeSync objects."""
+    def make(**kwargs):
+        vesync_obj = VeSync('sam@mail.com', 'pass', **kwargs)
+        vesync_obj.enabled = True
+        vesync_obj.token = 'sample_tk'
+        vesync_obj.account_id = 'sample_actid'
+        return vesync_obj
+    return make
+
+
+@pytest.fixture()
+def manager(make_manager):
+    """Return logged in VeSync object."""
+    return make_manager()
+
+
+@pytest.fixture()
+def fake_dev():
+    """Return factory of mock devices for scheduling tests."""
+    def make(name, status='online', intervals=(5, 40)):
+        return MagicMock(device_name=name, cid=name, sub_device_no=0,
+                         connection_status=status, poll_intervals=intervals)
+    return make
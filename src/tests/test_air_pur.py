@@ -87,7 +87,8 @@ class TestVesyncAirPurifier(object):
         on = fan.turn_on()
         self.mock_api.assert_called_with(
             '/131airPurifier/v1/device/deviceStatus', 'put',
-            json=body, headers=head)
+            json=body, headers=head,
+            manager=self.vesync_obj)
         call_args = self.mock_api.call_args_list[0][0]
         assert call_args[0] == '/131airPurifier/v1/device/deviceStatus'
         assert call_args[1] == 'put'
@@ -97,7 +98,8 @@ class TestVesyncAirPurifier(object):
         body['status'] = 'off'
         self.mock_api.assert_called_with(
             '/131airPurifier/v1/device/deviceStatus', 'put',
-            json=body, headers=head)
+            json=body, headers=head,
+            manager=self.vesync_obj)
         assert off
 
     def test_airpur_onoff_fail(self, api_mock):
@@ -0,0 +1,98 @@
+"""Test circuit breaker for endpoint families."""
+
+from unittest.mock import patch
+
+import pytest
+from pyvesync_v2 import VeSync, CircuitBreaker
+from pyvesync_v2.breaker import CLOSED, OPEN, HALF_OPEN
+from pyvesync_v2.helpers import Helpers as helpers
+
+
+def test_breaker_states():
+    """Test circuit opens, half opens and closes."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0)
+    breaker.record('/10a', False)
+    assert breaker.state('/10a') == CLOSED
+    breaker.record('/10a', False)
+    assert breaker.state('/10a') == HALF_OPEN
+    assert breaker.allow('/10a')
+    assert not breaker.allow('/10a')
+    breaker.record('/10a', True)
+    assert breaker.state('/10a') == CLOSED
+    assert breaker.allow('/15a')
+
+
+def test_failed_probe_reopens():
+    """Test failed probe opens circuit again."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record('/dimmer', False)
+    assert breaker.allow('/dimmer')
+    breaker.reset_timeout = 60
+    breaker.record('/dimmer', False)
+    assert breaker.state('/dimmer') == OPEN
+    assert not breaker.allow('/dimmer')
+
+
+@pytest.mark.parametrize('api, family', [
+    ('/10a/v1/device/devicedetail', '/10a'),
+    ('/131airpurifier/v1/device/configurations', '/131airpurifier'),
+    ('/131airPurifier/v1/device/deviceDetail', '/131airpurifier'),
+    ('/v1/device/7A-CID/detail', '/v1'),
+    ('/cloud/v1/deviceManaged/bypass', '/cloud/v1/deviceManaged/bypass'),
+])
+def test_endpoint_family(api, family):
+    """Test endpoint family of API paths."""
+    assert helpers.endpoint_family(api) == family
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request')
+def test_call_api_fails_fast(send_mock):
+    """Test open circuit skips calls for that family only."""
+    manager = VeSync('sam@mail.com', 'pass', retry_policy=None)
+    manager.circuit_breaker = CircuitBreaker(failure_threshold=2)
+    send_mock.return_value = (None, None)
+
+    for _ in range(4):
+        helpers.call_api('/dimmer/v1/device/devicedetail', 'post',
+                         json={}, manager=manager)
+    assert send_mock.call_count == 2
+
+    send_mock.return_value = ({'code': 0}, 200)
+    r = helpers.call_api('/10a/v1/device/devicedetail', 'post',
+                         json={}, manager=manager)
+    assert r == ({'code': 0}, 200)
+    assert send_mock.call_count == 3
+
+
+def test_lost_probe_released():
+    """Test probes without a result do not keep the circuit half open."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0,
+                             probe_timeout=60)
+    breaker.record('/10a', False)
+    assert breaker.allow('/10a')
+    assert not breaker.allow('/10a')
+    breaker.release('/10a')
+    assert breaker.allow('/10a')
+
+    breaker.probe_timeout = 0
+    assert breaker.allow('/10a')
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request')
+def test_probe_recorded_on_error(send_mock):
+    """Test a probe whose transport raises is recorded as a failure."""
+    manager = VeSync('sam@mail.com', 'pass', retry_policy=None)
+    manager.circuit_breaker = CircuitBreaker(failure_threshold=1,
+                                             reset_timeout=0)
+    manager.circuit_breaker.record('/10a', False)
+    send_mock.side_effect = OSError('connection reset')
+
+    with pytest.raises(OSError):
+        helpers.call_api('/10a/v1/device/devicedetail', 'post', json={},
+                         manager=manager)
+
+    send_mock.side_effect = None
+    send_mock.return_value = ({'code': 0}, 200)
+    assert helpers.call_api('/10a/v1/device/devicedetail', 'post', json={},
+                            manager=manager) == ({'code': 0}, 200)
+    assert manager.circuit_breaker.state('/10a') == CLOSED
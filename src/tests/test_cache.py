@@ -0,0 +1,66 @@
+"""Test response cache for configuration calls."""
+
+import time
+from unittest.mock import patch
+
+from pyvesync_v2 import ResponseCache, VeSyncOutlet10A, VeSyncOutlet7A
+from pyvesync_v2.vesyncbulb import VeSyncBulbESL100CW
+
+from . import call_json
+
+CONFIG = {'code': 0, 'currentFirmVersion': '1.0',
+          'latestFirmVersion': '1.1', 'maxPower': '1800'}
+
+LIST_CONF_ESL100CW = dict(call_json.LIST_CONF_ESL100,
+                          deviceType='ESL100CW', cid='CW-CID')
+
+
+def test_lru_and_ttl():
+    """Test entries expire and least recently used is evicted."""
+    cache = ResponseCache(max_size=2, ttls={'detail': 0.05})
+    assert cache.ttl('/v1/device/cid/detail') == 0.05
+    assert cache.ttl('/10a/v1/device/devicedetail') == 0
+    cache.set('a', 1, 10)
+    cache.set('b', 2, 10)
+    assert cache.get('a') == 1
+    cache.set('c', 3, 10)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    cache.set('d', 4, 0.01)
+    time.sleep(0.02)
+    assert cache.get('d') is None
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request')
+def test_config_cached(send_mock, manager):
+    """Test get_config across devices is served from cache."""
+    send_mock.return_value = (CONFIG, 200)
+    outlet = VeSyncOutlet10A(call_json.LIST_CONF_10AUS, manager)
+    outlet_7a = VeSyncOutlet7A(call_json.LIST_CONF_7A, manager)
+    bulb = VeSyncBulbESL100CW(LIST_CONF_ESL100CW, manager)
+
+    for _ in range(3):
+        for device in (outlet, outlet_7a, bulb):
+            device.get_config()
+            assert device.firmware_update
+
+    assert send_mock.call_count == 3
+
+    manager.response_cache.invalidate('/10a/v1/device/configurations')
+    outlet.get_config()
+    outlet_7a.get_config()
+    assert send_mock.call_count == 4
+
+    manager.response_cache.invalidate()
+    assert len(manager.response_cache) == 0
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request')
+def test_errors_not_cached(send_mock, manager):
+    """Test failed configuration calls are not cached."""
+    send_mock.return_value = ({'code': 1}, 200)
+    outlet = VeSyncOutlet10A(call_json.LIST_CONF_10AUS, manager)
+    outlet.get_config()
+    outlet.get_config()
+    assert send_mock.call_count == 2
+    assert outlet.config == {}
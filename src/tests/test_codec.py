@@ -0,0 +1,34 @@
+"""Test JSON codec and device JSON output."""
+
+import json
+
+from pyvesync_v2 import codec, VeSync, VeSyncAir131, VeSyncOutlet10A
+
+from . import call_json
+
+
+def test_round_trip():
+    """Test codec encodes compact bytes and decodes bytes and strings."""
+    body = {'acceptLanguage': 'en', 'traceId': '1', 'uuid': 'ü'}
+
+    data = codec.dumps(body)
+
+    assert isinstance(data, bytes)
+    assert b' ' not in data
+    assert codec.loads(data) == body
+    assert codec.loads(data.decode('utf-8')) == body
+    assert json.loads(codec.dumps_str(body)) == body
+
+
+def test_display_json():
+    """Test display_json returns JSON of display_dict."""
+    manager = VeSync('sam@mail.com', 'pass')
+    outlet = VeSyncOutlet10A(call_json.LIST_CONF_10AUS, manager)
+    fan = VeSyncAir131(call_json.LIST_CONF_AIR, manager)
+
+    for device in (outlet, fan):
+        result = device.display_dict()
+        assert result['CID'] == device.cid
+        assert json.loads(device.display_json()) == result
+    assert 'Power' in outlet.display_dict()
+    assert 'Filter Life' in fan.display_dict()
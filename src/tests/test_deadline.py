@@ -0,0 +1,138 @@
+"""Test deadline bounded update cycles."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from pyvesync_v2 import CircuitBreaker, FakeTransport, RetryPolicy
+from pyvesync_v2.helpers import Helpers as helpers
+
+DETAIL_API = '/10a/v1/device/devicedetail'
+STATUS_API = '/10a/v1/device/devicestatus'
+
+
+def test_reads_skipped_after_deadline(make_manager):
+    """Test reads are not sent after deadline while writes are."""
+    transport = FakeTransport({('post', DETAIL_API): ({'code': 0}, 200),
+                               ('put', STATUS_API): ({'code': 0}, 200)})
+    manager = make_manager(transport=transport)
+    manager.circuit_breaker.failure_threshold = 1
+
+    with helpers.deadline_scope(time.monotonic() - 1):
+        assert helpers.call_api(DETAIL_API, 'post', json={},
+                                manager=manager) == (None, None)
+        assert helpers.call_api(STATUS_API, 'put', json={},
+                                manager=manager) == ({'code': 0}, 200)
+    assert [c[0] for c in transport.calls] == ['put']
+    assert manager.circuit_breaker.allow('/10a')
+
+
+def test_timeout_bounded_by_deadline(make_manager):
+    """Test request timeout does not exceed time left."""
+    timeouts = []
+
+    class Transport(FakeTransport):
+        def send(self, method, path, json=None, headers=None, timeout=None):
+            timeouts.append(timeout)
+            return super().send(method, path, json, headers)
+
+    manager = make_manager(
+        transport=Transport({('post', DETAIL_API): (None, 500)}))
+    manager.retry_policy = RetryPolicy(max_attempts=5, backoff=1)
+
+    start = time.monotonic()
+    with helpers.deadline_scope(start + 0.5):
+        helpers.call_api(DETAIL_API, 'post', json={}, manager=manager)
+
+    assert time.monotonic() - start < 0.5
+    assert len(timeouts) == 1
+    assert timeouts[0] <= 0.5
+
+
+def test_stale_devices_reported(make_manager):
+    """Test devices finishing after the deadline are marked stale."""
+    manager = make_manager(transport=FakeTransport())
+    fast = MagicMock(device_name='fast', stale=True)
+    slow = MagicMock(device_name='slow', stale=False)
+    slow.update.side_effect = lambda: time.sleep(0.2)
+    broken = MagicMock(device_name='broken', stale=False)
+    broken.update.side_effect = ValueError('bad response')
+
+    report = manager.run_device_calls([fast, slow, broken], 'update',
+                                      deadline=0.1)
+
+    assert report.refreshed == [fast]
+    assert report.stale == [slow, broken]
+    assert list(report) == [broken]
+    assert not fast.stale
+    assert slow.stale and broken.stale
+    assert helpers.current_deadline() is None
+
+
+def test_update_deadline(make_manager):
+    """Test update() bounds device list and detail calls."""
+    manager = make_manager(transport=FakeTransport())
+    manager.get_devices = MagicMock(return_value=([], [], [], []))
+    outlet = MagicMock(device_name='outlet', cid='cid', sub_device_no=0,
+                       poll_intervals=(5, 40))
+
+    def update():
+        assert helpers.current_deadline() is not None
+        time.sleep(0.1)
+    outlet.update.side_effect = update
+    manager.outlets = [outlet]
+    manager.add_devices = MagicMock()
+
+    report = manager.update(deadline=0.05)
+
+    assert report.stale == [outlet]
+    assert report == {}
+    assert helpers.current_deadline() is None
+
+
+def test_concurrent_deadlines(make_manager):
+    """Test concurrent updates each keep their own deadline."""
+    manager = make_manager(transport=FakeTransport())
+    seen = {}
+
+    def record(name):
+        seen[name] = helpers.current_deadline()
+        time.sleep(0.05)
+    short = MagicMock(device_name='short')
+    short.update.side_effect = lambda: record('short')
+    long = MagicMock(device_name='long')
+    long.update.side_effect = lambda: record('long')
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reports = list(executor.map(
+            lambda args: manager.run_device_calls([args[0]], 'update',
+                                                  deadline=args[1]),
+            [(short, 0.01), (long, 10)]))
+
+    assert seen['short'] < start + 1 < seen['long']
+    assert reports[0].stale == [short]
+    assert reports[1].refreshed == [long]
+
+
+def test_probe_released_at_deadline(make_manager):
+    """Test a probe cut off by the deadline does not wedge the circuit."""
+    class Transport(FakeTransport):
+        def send(self, method, path, json=None, headers=None, timeout=None):
+            time.sleep(timeout)
+            return None, None
+
+    manager = make_manager(transport=Transport(), retry_policy=None)
+    manager.hedger = None
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0,
+                             probe_timeout=60)
+    manager.circuit_breaker = breaker
+    breaker.record('/10a', False)
+
+    with helpers.deadline_scope(time.monotonic() + 0.05):
+        assert helpers.call_api(DETAIL_API, 'post', json={},
+                                manager=manager) == (None, None)
+
+    breaker.reset_timeout = 60
+    assert breaker.state('/10a') == 'half_open'
+    assert breaker.allow('/10a')
@@ -0,0 +1,213 @@
+"""Test hedged detail reads."""
+
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from pyvesync_v2 import (VeSync, Hedger, LatencyTracker, FakeTransport,
+                         RateLimiter)
+from pyvesync_v2.hedge import DEFAULT_HEDGE_WORKERS
+from pyvesync_v2.helpers import Helpers as helpers, BYPASS_API
+
+DETAIL_API = '/10a/v1/device/devicedetail'
+
+
+def slow_first(answers):
+    """Return send function whose first call is slow."""
+    calls = []
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            calls.append(len(calls))
+            number = len(calls)
+        if number == 1:
+            time.sleep(0.3)
+        return answers[number - 1]
+    send.calls = calls
+    return send
+
+
+def test_hedge_answers_lost_request():
+    """Test second request answers when first is slow and fails."""
+    hedger = Hedger()
+    send = slow_first([(None, None), ({'n': 2}, 200)])
+
+    assert hedger.run(send, 0.02) == ({'n': 2}, 200)
+    assert len(send.calls) == 2
+    hedger.close()
+
+
+def test_slow_answer_kept():
+    """Test answer of first request is used once it arrives."""
+    hedger = Hedger()
+    send = slow_first([({'n': 1}, 200), ({'n': 2}, 200)])
+
+    assert hedger.run(send, 0.02) == ({'n': 1}, 200)
+    assert len(send.calls) == 2
+    hedger.close()
+
+
+def test_first_request_on_caller_thread():
+    """Test hedging threads do not limit requests in flight."""
+    hedger = Hedger(max_workers=2)
+    callers = []
+
+    def send():
+        callers.append(threading.current_thread())
+        time.sleep(0.1)
+        return {'n': 1}, 200
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: hedger.run(send, 1),
+                                    range(8)))
+
+    assert time.monotonic() - start < 0.25
+    assert results == [({'n': 1}, 200)] * 8
+    assert len(set(callers)) == 8
+    hedger.close()
+
+
+def test_fast_request_not_hedged():
+    """Test no second request is sent for a fast answer."""
+    hedger = Hedger()
+    calls = []
+
+    def send():
+        calls.append(1)
+        return {'n': 1}, 200
+
+    assert hedger.run(send, 1) == ({'n': 1}, 200)
+    assert len(calls) == 1
+    hedger.close()
+
+
+def test_hedge_needs_budget():
+    """Test hedge is skipped without rate limit budget."""
+    hedger = Hedger()
+    send = slow_first([(None, None), ({'n': 2}, 200)])
+
+    assert hedger.run(send, 0.02, lambda: False) == (None, None)
+    assert len(send.calls) == 1
+    hedger.close()
+
+
+def test_hedges_limited_by_budget():
+    """Test hedges stop once the hedge budget is spent."""
+    hedger = Hedger(budget=0.5, burst=1)
+    sends = [slow_first([(None, None), ({'n': 2}, 200)])
+             for _ in range(3)]
+
+    assert hedger.run(sends[0], 0.02) == ({'n': 2}, 200)
+    assert hedger.run(sends[1], 0.02) == (None, None)
+    assert hedger.run(sends[2], 0.02) == ({'n': 2}, 200)
+    assert [len(send.calls) for send in sends] == [2, 1, 2]
+    hedger.close()
+
+
+def test_refused_hedge_refunded():
+    """Test a hedge refused by the rate limiter keeps its budget."""
+    hedger = Hedger(budget=0, burst=1)
+    refused = slow_first([(None, None), ({'n': 2}, 200)])
+    hedged = slow_first([(None, None), ({'n': 2}, 200)])
+
+    assert hedger.run(refused, 0.02, lambda: False) == (None, None)
+    assert hedger.run(hedged, 0.02, lambda: True) == ({'n': 2}, 200)
+    hedger.close()
+
+
+def test_queue_wait_not_hedged():
+    """Test delay is counted from when the request leaves the queue."""
+    hedger = Hedger()
+    started = threading.Event()
+    calls = []
+
+    def send():
+        calls.append(1)
+        time.sleep(0.1)
+        started.set()
+        return {'n': 1}, 200
+
+    assert hedger.run(send, 0.02, started=started) == ({'n': 1}, 200)
+    assert len(calls) == 1
+    hedger.close()
+
+
+def test_failed_answer_loses():
+    """Test answer without status waits for the other request."""
+    hedger = Hedger()
+    calls = []
+
+    def send():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.2)
+            return {'n': 1}, 200
+        return None, None
+
+    assert hedger.run(send, 0.02) == ({'n': 1}, 200)
+    hedger.close()
+
+
+def test_hedgeable():
+    """Test only idempotent detail reads are hedged."""
+    assert helpers.hedgeable(DETAIL_API, 'post')
+    assert helpers.hedgeable('/131airPurifier/v1/device/deviceDetail', 'post')
+    assert not helpers.hedgeable('/10a/v1/device/devicestatus', 'put')
+    assert helpers.hedgeable(BYPASS_API, 'post',
+                             {'jsonCmd': {'getLightStatus': 'get'}})
+    assert not helpers.hedgeable(BYPASS_API, 'post',
+                                 {'jsonCmd': {'light': {'action': 'on'}}})
+
+
+def test_call_api_hedged():
+    """Test manager hedges slow detail reads within rate budget."""
+    answers = iter([(0.3, (None, None))])
+
+    def route(json, headers):
+        delay, answer = next(answers, (0, ({'code': 0}, 200)))
+        time.sleep(delay)
+        return answer
+
+    transport = FakeTransport({('post', DETAIL_API): route})
+    manager = VeSync('sam@mail.com', 'pass', transport=transport,
+                     rate_limiter=RateLimiter(read_rate=100),
+                     retry_policy=None)
+    manager.latency = LatencyTracker(min_samples=1)
+    manager.latency.record(DETAIL_API, 0.02)
+
+    result = helpers.call_api(DETAIL_API, 'post', json={}, manager=manager)
+
+    assert result == ({'code': 0}, 200)
+    assert len(transport.calls) == 2
+    manager.close()
+
+
+def test_hedged_reads_not_capped_by_hedge_pool():
+    """Test more concurrent hedgeable reads than hedging threads."""
+    def route(json, headers):
+        time.sleep(0.1)
+        return {'code': 0}, 200
+
+    workers = DEFAULT_HEDGE_WORKERS * 2
+    transport = FakeTransport({('post', DETAIL_API): route})
+    manager = VeSync('sam@mail.com', 'pass', transport=transport,
+                     max_workers=workers)
+    manager.latency = LatencyTracker(min_samples=1)
+    manager.latency.record(DETAIL_API, 1)
+    devices = [MagicMock(device_name=str(n)) for n in range(workers)]
+    for n, dev in enumerate(devices):
+        dev.update.side_effect = functools.partial(
+            helpers.call_api, DETAIL_API, 'post', json={'n': n},
+            manager=manager)
+
+    start = time.monotonic()
+    report = manager.run_device_calls(devices, 'update', deadline=0.5)
+
+    assert time.monotonic() - start < 0.18
+    assert len(report.refreshed) == workers
+    assert len(transport.calls) == workers
+    manager.close()
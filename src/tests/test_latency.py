@@ -0,0 +1,101 @@
+"""Test adaptive per endpoint timeouts."""
+
+import time
+
+from pyvesync_v2 import VeSync, LatencyTracker, FakeTransport
+from pyvesync_v2.helpers import Helpers as helpers
+
+DETAIL_API = '/10a/v1/device/devicedetail'
+
+
+class TimeoutTransport(FakeTransport):
+    """Fake transport remembering the timeout of each call."""
+
+    def __init__(self, routes=None):
+        """Initialize with empty timeout list."""
+        super().__init__(routes)
+        self.timeouts = []
+
+    def send(self, method, path, json=None, headers=None, timeout=None):
+        """Record timeout and answer from routes."""
+        self.timeouts.append(timeout)
+        return super().send(method, path, json, headers)
+
+
+def test_percentile_and_bounds():
+    """Test timeout follows latency percentile within floor and ceiling."""
+    tracker = LatencyTracker(window=10, percentile=90, multiplier=2,
+                             floor=0.3, ceiling=5, min_samples=5)
+    for _ in range(4):
+        tracker.record('/a', 0.1)
+    assert tracker.latency('/a') is None
+    assert tracker.timeout('/a') == 5
+
+    for latency in (0.1, 0.1, 0.1, 0.1, 0.1, 1.0):
+        tracker.record('/a', latency)
+    assert tracker.latency('/a') == 0.1
+    assert tracker.latency('/a', 100) == 1.0
+    assert tracker.timeout('/a') == 0.3
+
+    for _ in range(10):
+        tracker.record('/slow', 4)
+    assert tracker.timeout('/slow') == 5
+
+    tracker.reset('/a')
+    assert tracker.latency('/a') is None
+    assert tracker.latency('/slow') == 4
+
+
+def test_call_api_timeouts():
+    """Test call_api uses adaptive timeout unless one is passed."""
+    transport = TimeoutTransport({('post', DETAIL_API): ({'code': 0}, 200)})
+    manager = VeSync('sam@mail.com', 'pass', transport=transport)
+    manager.latency = LatencyTracker(floor=0.3, ceiling=5, min_samples=2)
+
+    for _ in range(3):
+        helpers.call_api(DETAIL_API, 'post', json={}, manager=manager)
+    helpers.call_api(DETAIL_API, 'post', json={}, manager=manager,
+                     timeout=1.5)
+
+    assert transport.timeouts == [5, 5, 0.3, 1.5]
+
+
+def test_unanswered_calls_not_recorded():
+    """Test calls without a response do not count as latency samples."""
+    transport = FakeTransport({('post', DETAIL_API): (None, None)})
+    manager = VeSync('sam@mail.com', 'pass', transport=transport,
+                     retry_policy=None)
+    manager.latency = LatencyTracker(min_samples=1)
+
+    helpers.call_api(DETAIL_API, 'post', json={}, manager=manager)
+
+    assert manager.latency.latency(DETAIL_API) is None
+
+
+def test_timeouts_raise_timeout():
+    """Test timed out calls count as samples of at least the timeout."""
+    backend_latency = 0.08
+
+    class SlowTransport(TimeoutTransport):
+        def send(self, method, path, json=None, headers=None, timeout=None):
+            self.timeouts.append(timeout)
+            time.sleep(min(timeout, backend_latency))
+            if timeout < backend_latency:
+                return None, None
+            return {'code': 0}, 200
+
+    transport = SlowTransport()
+    manager = VeSync('sam@mail.com', 'pass', transport=transport,
+                     retry_policy=None)
+    manager.hedger = None
+    manager.latency = LatencyTracker(window=4, floor=0.05, ceiling=5,
+                                     min_samples=2)
+    for _ in range(4):
+        manager.latency.record(DETAIL_API, 0.001)
+    assert manager.latency.timeout(DETAIL_API) == 0.05
+
+    results = [helpers.call_api(DETAIL_API, 'post', json={},
+                                manager=manager)[1] for _ in range(3)]
+
+    assert results == [None, 200, 200]
+    assert transport.timeouts[1] >= backend_latency
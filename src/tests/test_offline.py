@@ -0,0 +1,113 @@
+"""Test probe backoff of offline devices."""
+
+from unittest.mock import MagicMock, patch
+
+from pyvesync_v2 import OfflineTracker, FakeTransport
+from pyvesync_v2.vesyncbulb import VeSyncBulbESL100CW
+
+from . import call_json
+
+BULB_API = '/cloud/v1/deviceManaged/bypass'
+DEVICES_API = '/cloud/v1/deviceManaged/devices'
+DETAIL_10A_API = '/10a/v1/device/devicedetail'
+
+
+@patch('pyvesync_v2.offline.time')
+def test_backoff_doubles(time_mock, fake_dev):
+    """Test probe delay doubles up to the maximum and resets online."""
+    time_mock.time.return_value = 1000
+    tracker = OfflineTracker(backoff=10, max_backoff=30)
+    dev = fake_dev('plug', 'offline')
+
+    delays = []
+    for _ in range(4):
+        tracker.record(dev)
+        delays.append(tracker._offline[tracker.key(dev)][1] - 1000)
+    assert delays == [10, 20, 30, 30]
+
+    assert not tracker.due(dev)
+    time_mock.time.return_value = 1030
+    assert tracker.due(dev)
+
+    dev.connection_status = 'online'
+    tracker.record(dev)
+    assert not tracker.is_offline(dev)
+    assert len(tracker) == 0
+
+
+def test_update_skips_offline_until_probe(make_manager, fake_dev):
+    """Test update() probes offline devices only when due."""
+    manager = make_manager(transport=FakeTransport())
+    manager.get_devices = MagicMock(return_value=([], [], [], []))
+    manager.add_devices = MagicMock()
+    online = fake_dev('online', intervals=(0, 0))
+    offline = fake_dev('offline', 'offline', intervals=(0, 0))
+    manager.outlets = [online, offline]
+
+    manager.update()
+    manager.last_update_ts = None
+    manager.update()
+
+    assert online.update.call_count == 2
+    assert offline.update.call_count == 1
+    assert manager.offline.is_offline(offline)
+
+    manager.offline.online(offline)
+    manager.last_update_ts = None
+    manager.update()
+    assert offline.update.call_count == 2
+
+
+def test_offline_bulb_backoff(make_manager):
+    """Test offline bulb is backed off until listed online."""
+    manager = make_manager(transport=FakeTransport({
+        ('post', BULB_API): ({'code': -11300027, 'msg': 'offline'}, 200)}))
+    bulb = VeSyncBulbESL100CW({'deviceName': 'bulb', 'cid': 'bulb-cid',
+                               'deviceType': 'ESL100CW',
+                               'connectionStatus': 'online',
+                               'deviceStatus': 'on'}, manager)
+    manager.get_devices = MagicMock(return_value=([], [], [], []))
+    manager.add_devices = MagicMock()
+    manager.bulbs = [bulb]
+    manager.index_devices()
+
+    manager.update()
+
+    assert bulb.connection_status == 'offline'
+    assert manager.offline.is_offline(bulb)
+    assert not manager.details_due([bulb])
+
+    bulb_item = {'cid': 'bulb-cid', 'deviceType': 'ESL100CW',
+                 'deviceName': 'bulb', 'connectionStatus': 'online',
+                 'deviceStatus': 'on'}
+    manager.process_devices([bulb_item])
+
+    assert bulb.connection_status == 'online'
+    assert not manager.offline.is_offline(bulb)
+    assert manager.details_due([bulb]) == [bulb]
+
+
+def test_listed_offline_backed_off(make_manager):
+    """Test devices listed offline with unanswered probes back off."""
+    plug = dict(call_json.LIST_CONF_10AUS, connectionStatus='offline')
+    transport = FakeTransport({
+        ('post', DEVICES_API): ({'code': 0, 'result': {'list': [plug]}},
+                                200),
+        ('post', DETAIL_10A_API): (None, None)})
+    manager = make_manager(transport=transport, retry_policy=None)
+    manager.hedger = None
+
+    manager.update()
+    outlet = manager.outlets[0]
+    assert manager.offline.is_offline(outlet)
+    assert transport.calls[-1][1] == DEVICES_API
+
+    key = manager.offline.key(outlet)
+    manager.offline._offline[key] = (1, 0)
+    for _ in range(4):
+        manager.update()
+
+    detail_calls = [c for c in transport.calls if c[1] == DETAIL_10A_API]
+    assert len(detail_calls) == 1
+    assert manager.offline._offline[key][0] == 2
+    assert manager.circuit_breaker.allow('/10a')
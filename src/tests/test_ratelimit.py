@@ -0,0 +1,95 @@
+"""Test client side rate limiting."""
+
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+from pyvesync_v2 import VeSync, RateLimiter
+from pyvesync_v2.helpers import Helpers as helpers, THROTTLED
+from pyvesync_v2.ratelimit import TokenBucket
+
+
+def test_bucket_burst_and_refill():
+    """Test bucket allows burst then waits for refill."""
+    bucket = TokenBucket(20, capacity=2)
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    start = time.monotonic()
+    assert bucket.acquire()
+    assert time.monotonic() - start >= 0.03
+    assert not bucket.acquire(timeout=0.001)
+
+
+def test_bucket_invalid_rate():
+    """Test bucket rejects rate of zero and capacity below one call."""
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+    with pytest.raises(ValueError):
+        TokenBucket(1, capacity=0.5)
+
+
+def test_bucket_slow_rate():
+    """Test rates below one call per second still allow calls."""
+    bucket = TokenBucket(0.5)
+    assert bucket.capacity == 1
+    assert bucket.try_acquire()
+    assert not bucket.acquire(timeout=0.1)
+    bucket._last -= 2
+    assert bucket.acquire(timeout=0.1)
+
+
+def test_separate_budgets():
+    """Test reads do not use the write budget."""
+    limiter = RateLimiter(read_rate=1, write_rate=1)
+    assert limiter.try_acquire('read')
+    assert not limiter.try_acquire('read')
+    assert limiter.try_acquire('write')
+
+
+@pytest.mark.parametrize('api, method, json, kind', [
+    ('/10a/v1/device/devicedetail', 'post', {}, 'read'),
+    ('/10a/v1/device/devicestatus', 'put', {}, 'write'),
+    ('/cloud/v1/deviceManaged/bypass', 'post',
+     {'jsonCmd': {'getLightStatus': 'get'}}, 'read'),
+    ('/cloud/v1/deviceManaged/bypass', 'post',
+     {'jsonCmd': {'light': {'action': 'on'}}}, 'write'),
+])
+def test_request_kind(api, method, json, kind):
+    """Test classification of API calls."""
+    assert helpers.request_kind(api, method, json) == kind
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request')
+def test_shared_limiter(send_mock):
+    """Test managers sharing a limiter take tokens for each call."""
+    send_mock.return_value = ({'code': 0}, 200)
+    limiter = MagicMock()
+    manager_1 = VeSync('sam@mail.com', 'pass', rate_limiter=limiter)
+    manager_2 = VeSync('tom@mail.com', 'pass', rate_limiter=limiter)
+
+    helpers.call_api('/10a/v1/device/devicestatus', 'put',
+                     json={}, manager=manager_1)
+    helpers.call_api('/10a/v1/device/devicedetail', 'post',
+                     json={}, manager=manager_2)
+
+    assert [c[0][0] for c in limiter.acquire.call_args_list] == \
+        ['write', 'read']
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request')
+def test_throttled_not_failure(send_mock):
+    """Test calls refused by the limiter are not retried or counted."""
+    limiter = MagicMock()
+    limiter.acquire.return_value = False
+    manager = VeSync('sam@mail.com', 'pass', rate_limiter=limiter)
+    manager.circuit_breaker.failure_threshold = 1
+
+    assert helpers.dispatch('/10a/v1/device/devicedetail', 'post', json={},
+                            manager=manager) == (None, THROTTLED)
+    assert helpers.call_api('/10a/v1/device/devicedetail', 'post',
+                            json={}, manager=manager) == (None, None)
+
+    send_mock.assert_not_called()
+    assert limiter.acquire.call_count == 2
+    assert manager.circuit_breaker.allow('/10a')
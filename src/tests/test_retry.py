@@ -0,0 +1,82 @@
+"""Test retries of failed API calls."""
+
+from unittest.mock import patch, Mock
+
+import pytest
+from pyvesync_v2 import RetryPolicy, VeSyncOutlet7A
+from pyvesync_v2.helpers import Helpers as helpers
+
+from . import call_json
+
+FAIL_THEN_OK = [(None, 503), (None, None), ({'code': 0}, 200)]
+
+
+@pytest.fixture()
+def manager(make_manager):
+    """Return logged in VeSync object with fast retry policy."""
+    return make_manager(retry_policy=RetryPolicy(backoff=0))
+
+
+def test_delay_backoff():
+    """Test exponential delay with jitter stays in range."""
+    policy = RetryPolicy(backoff=1, max_backoff=3, jitter=0.5)
+    assert 0.5 <= policy.delay(1) <= 1
+    assert 1 <= policy.delay(2) <= 2
+    assert 1.5 <= policy.delay(5) <= 3
+    assert RetryPolicy(backoff=1, jitter=0).delay(2) == 2
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request')
+def test_read_retried(send_mock, manager):
+    """Test read calls are retried until success."""
+    send_mock.side_effect = FAIL_THEN_OK
+    r = helpers.call_api('/10a/v1/device/devicedetail', 'post',
+                         json={}, manager=manager)
+    assert r == ({'code': 0}, 200)
+    assert send_mock.call_count == 3
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request')
+def test_write_needs_opt_in(send_mock, manager):
+    """Test state changing calls are only retried on request."""
+    send_mock.side_effect = FAIL_THEN_OK
+    r = helpers.call_api('/10a/v1/device/devicestatus', 'put',
+                         json={}, manager=manager)
+    assert r == (None, None)
+    assert send_mock.call_count == 1
+
+    send_mock.side_effect = FAIL_THEN_OK
+    r = helpers.call_api('/10a/v1/device/devicestatus', 'put',
+                         json={}, manager=manager, retry=True)
+    assert r == ({'code': 0}, 200)
+    assert send_mock.call_count == 4
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request')
+def test_client_error_not_retried(send_mock, manager):
+    """Test 4xx errors are returned without retry."""
+    send_mock.return_value = (None, 404)
+    helpers.call_api('/10a/v1/device/devicedetail', 'post',
+                     json={}, manager=manager)
+    assert send_mock.call_count == 1
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request')
+def test_retry_deadline(send_mock, manager):
+    """Test deadline stops retries."""
+    manager.retry_policy = RetryPolicy(max_attempts=5, backoff=1,
+                                       deadline=0.5)
+    send_mock.return_value = (None, 500)
+    helpers.call_api('/10a/v1/device/devicedetail', 'post',
+                     json={}, manager=manager)
+    assert send_mock.call_count == 1
+
+
+@patch('pyvesync_v2.helpers.requests.Session.get')
+def test_7a_config_no_response(get_mock, manager):
+    """Test 7A get_config handles failed call."""
+    get_mock.return_value = Mock(status_code=500)
+    outlet = VeSyncOutlet7A(call_json.LIST_CONF_7A, manager)
+    outlet.get_config()
+    assert outlet.config == {}
+    assert get_mock.call_count == 3
@@ -0,0 +1,98 @@
+"""Test per device poll scheduling."""
+
+from unittest.mock import MagicMock, patch
+
+from pyvesync_v2 import PollScheduler, FakeTransport
+
+
+@patch('pyvesync_v2.scheduler.time')
+def test_interval_growth(time_mock, fake_dev):
+    """Test idle devices slow down and changed devices speed up."""
+    time_mock.time.return_value = 1000
+    scheduler = PollScheduler(growth=2)
+    dev = fake_dev('dimmer')
+    assert scheduler.due(dev)
+
+    intervals = []
+    for _ in range(5):
+        scheduler.record(dev)
+        intervals.append(scheduler.interval(dev))
+    assert intervals == [5, 10, 20, 40, 40]
+    assert scheduler.next_due(dev) == 1040
+    assert not scheduler.due(dev)
+    assert scheduler.due(dev, now=1040)
+
+    scheduler.record(dev, changed=True)
+    assert scheduler.interval(dev) == 5
+
+    scheduler.promote(dev)
+    assert scheduler.due(dev)
+
+
+@patch('pyvesync_v2.scheduler.time')
+def test_subscribed_stays_fast(time_mock, fake_dev):
+    """Test subscribed devices keep the fast interval."""
+    time_mock.time.return_value = 1000
+    scheduler = PollScheduler()
+    dev = fake_dev('purifier')
+    scheduler.subscribe(dev)
+    assert scheduler.subscribed(dev)
+    assert scheduler.due(dev)
+
+    for _ in range(3):
+        scheduler.record(dev)
+    assert scheduler.interval(dev) == 5
+
+    scheduler.unsubscribe(dev)
+    scheduler.record(dev)
+    assert scheduler.interval(dev) == 10
+
+    scheduler.forget(scheduler.key(dev))
+    assert scheduler.next_due(dev) is None
+
+
+def test_update_records_changes(make_manager, fake_dev):
+    """Test update() polls changed devices at their fast interval."""
+    manager = make_manager(transport=FakeTransport())
+    manager.get_devices = MagicMock(return_value=([], [], [], []))
+    manager.add_devices = MagicMock()
+    idle = fake_dev('idle')
+    busy = fake_dev('busy')
+    idle.poll_state.return_value = ('on',)
+    busy.poll_state.side_effect = [('on',), ('off',), ('off',), ('on',)]
+    manager.outlets = [idle, busy]
+
+    manager.update()
+    schedule = manager.scheduler._schedule
+    for key, (interval, _) in schedule.items():
+        schedule[key] = (interval, 0)
+    manager.update()
+
+    assert manager.get_devices.call_count == 1
+    assert idle.update.call_count == busy.update.call_count == 2
+    assert manager.scheduler.interval(idle) == 10
+    assert manager.scheduler.interval(busy) == 5
+
+
+def test_failed_details_rescheduled(make_manager, fake_dev):
+    """Test devices whose detail call fails are stale and back off."""
+    manager = make_manager(transport=FakeTransport())
+    manager.get_devices = MagicMock(return_value=([], [], [], []))
+    manager.add_devices = MagicMock()
+    good = fake_dev('good')
+    bad = fake_dev('bad')
+    bad.update.return_value = False
+    manager.outlets = [good, bad]
+
+    report = manager.update()
+
+    assert report.refreshed == [good]
+    assert report.stale == [bad]
+    assert report == {}
+    assert not manager.scheduler.due(bad)
+    assert manager.scheduler.interval(bad) == 5
+
+    manager.scheduler._schedule[manager.scheduler.key(bad)] = (5, 0)
+    manager.update()
+    assert bad.update.call_count == 2
+    assert manager.scheduler.interval(bad) == 10
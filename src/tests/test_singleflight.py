@@ -0,0 +1,85 @@
+"""Test coalescing of identical concurrent API calls."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from pyvesync_v2.helpers import Helpers as helpers
+from pyvesync_v2.singleflight import SingleFlight
+
+
+def slow_response(*args, **kwargs):
+    """Return successful response after a delay."""
+    time.sleep(0.1)
+    return {'code': 0}, 200
+
+
+def run_threads(target, args_list):
+    """Run target in a thread for each args tuple and return results."""
+    results = []
+    threads = [threading.Thread(target=lambda a=a: results.append(target(*a)))
+               for a in args_list]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request',
+       side_effect=slow_response)
+def test_identical_reads_share_call(send_mock, manager):
+    """Test concurrent identical reads send one request."""
+    def detail(uuid, trace_id):
+        body = helpers.req_body(manager, 'devicedetail')
+        body['uuid'] = uuid
+        body['traceId'] = trace_id
+        return helpers.call_api('/outdoorsocket15a/v1/device/devicedetail',
+                                'post', json=body, manager=manager)
+
+    results = run_threads(detail, [('UUID', str(i)) for i in range(4)]
+                          + [('OTHER', '1')])
+
+    assert send_mock.call_count == 2
+    assert results == [({'code': 0}, 200)] * 5
+    assert manager.single_flight.in_flight() == 0
+
+
+@patch('pyvesync_v2.helpers.Helpers.send_request',
+       side_effect=slow_response)
+def test_writes_not_shared(send_mock, manager):
+    """Test concurrent writes are all sent."""
+    def toggle():
+        return helpers.call_api('/10a/v1/device/devicestatus', 'put',
+                                json={'uuid': 'UUID', 'status': 'on'},
+                                manager=manager)
+
+    run_threads(toggle, [()] * 3)
+
+    assert send_mock.call_count == 3
+
+
+def test_error_shared():
+    """Test waiting callers receive exception of the call."""
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.05)
+        raise ValueError('failed')
+
+    errors = []
+
+    def call():
+        try:
+            flight.do('key', fail)
+        except ValueError as exc:
+            errors.append(exc)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    call()
+    leader.join()
+    assert len(errors) == 2
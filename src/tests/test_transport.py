@@ -0,0 +1,154 @@
+"""Test pluggable transports of the VeSync manager."""
+
+import threading
+import time
+from json import dumps
+from unittest.mock import patch, Mock
+
+from pyvesync_v2 import (VeSync, SessionTransport, PriorityTransport,
+                         FakeTransport, RecordReplayTransport, LatencyTracker)
+from pyvesync_v2.helpers import Helpers as helpers, LOGIN_API, THROTTLED
+
+DETAIL_API = '/10a/v1/device/devicedetail'
+
+LOGIN_RESPONSE = {'code': 0, 'result': {'token': 'sample_tk',
+                                        'accountID': 'sample_id'}}
+
+
+def test_fake_transport_login():
+    """Test manager sends calls through injected transport."""
+    transport = FakeTransport({('post', LOGIN_API): (LOGIN_RESPONSE, 200)})
+    manager = VeSync('sam@email.com', 'password', transport=transport)
+
+    assert manager.login()
+    assert manager.token == 'sample_tk'
+    method, path, json, _ = transport.calls[0]
+    assert (method, path) == ('post', LOGIN_API)
+    assert json['email'] == 'sam@email.com'
+    assert manager.session is None
+
+
+def test_fake_transport_routes():
+    """Test callable routes and unknown routes."""
+    transport = FakeTransport()
+    transport.add_route('put', '/test', lambda json, headers: (json, 200))
+
+    assert transport.send('put', '/test', {'a': 1}) == ({'a': 1}, 200)
+    assert transport.send('get', '/missing') == (None, 404)
+
+
+@patch('pyvesync_v2.helpers.requests.Session.get')
+def test_session_transport_base_url(get_mock):
+    """Test session transport sends to its base url."""
+    get_mock.return_value = Mock(status_code=200)
+    get_mock.return_value.content = dumps({'code': 0})
+    transport = SessionTransport(base_url='http://localhost:8080',
+                                 timeout=2)
+
+    assert transport.send('get', '/test') == ({'code': 0}, 200)
+    assert get_mock.call_args[0][0] == 'http://localhost:8080/test'
+    assert get_mock.call_args[1]['timeout'] == 2
+    assert transport.send('patch', '/test') == (None, None)
+
+
+def test_record_replay(tmp_path):
+    """Test recorded responses are replayed in order."""
+    fake = FakeTransport({('post', '/test'): ({'code': 0}, 200)})
+    recorder = RecordReplayTransport(fake)
+    recorder.send('post', '/test', {'token': 'secret'})
+    recorder.send('post', '/test')
+    recorder.save(str(tmp_path / 'calls.json'))
+    assert 'secret' not in (tmp_path / 'calls.json').read_text()
+
+    replay = RecordReplayTransport.load(str(tmp_path / 'calls.json'))
+    assert replay.send('post', '/test') == ({'code': 0}, 200)
+    assert replay.send('post', '/test') == ({'code': 0}, 200)
+    assert replay.send('post', '/test') == (None, 404)
+
+
+def queued_order(aging: float) -> list:
+    """Return order of two polls and a command queued behind a poll."""
+    release = threading.Event()
+    order = []
+
+    def route(json, headers):
+        order.append(json['n'])
+        if json['n'] == 0:
+            release.wait(1)
+        return {'code': 0}, 200
+
+    fake = FakeTransport({('post', '/poll'): route, ('put', '/cmd'): route})
+    transport = PriorityTransport(fake, max_in_flight=1, aging=aging)
+    calls = [('post', '/poll'), ('post', '/poll'), ('post', '/poll'),
+             ('put', '/cmd')]
+    threads = []
+    for n, (method, path) in enumerate(calls):
+        thread = threading.Thread(target=transport.send,
+                                  args=(method, path, {'n': n}))
+        thread.start()
+        threads.append(thread)
+        while len(order) + len(transport._waiting) <= n:
+            time.sleep(0.01)
+        time.sleep(0.02)
+    release.set()
+    for thread in threads:
+        thread.join(1)
+    return order
+
+
+def test_priority_transport_order():
+    """Test commands are sent ahead of waiting polls."""
+    assert queued_order(aging=5) == [0, 3, 1, 2]
+
+
+def test_priority_transport_aging():
+    """Test polls waiting longer than aging go before new commands."""
+    assert queued_order(aging=0) == [0, 1, 2, 3]
+
+
+def test_priority_transport_wait_bounded():
+    """Test requests queued past their timeout are not sent."""
+    release = threading.Event()
+
+    def route(json, headers):
+        release.wait(1)
+        return {'code': 0}, 200
+
+    fake = FakeTransport({('post', '/poll'): route})
+    transport = PriorityTransport(fake, max_in_flight=1)
+    thread = threading.Thread(target=transport.send, args=('post', '/poll'))
+    thread.start()
+    while not fake.calls:
+        time.sleep(0.01)
+
+    start = time.monotonic()
+    assert transport.send('post', '/poll', timeout=0.05) == (None, THROTTLED)
+    assert time.monotonic() - start < 0.5
+    assert transport._waiting == []
+    assert len(fake.calls) == 1
+    release.set()
+    thread.join(1)
+
+
+def test_latency_excludes_queue_time():
+    """Test latency is measured from when a queued request is sent."""
+    def route(json, headers):
+        time.sleep(0.1)
+        return {'code': 0}, 200
+
+    fake = FakeTransport({('post', DETAIL_API): route})
+    manager = VeSync('sam@mail.com', 'pass',
+                     transport=PriorityTransport(fake, max_in_flight=1))
+    manager.hedger = None
+    manager.latency = LatencyTracker(min_samples=1)
+    threads = [threading.Thread(target=helpers.call_api,
+                                args=(DETAIL_API, 'post', {'n': n}),
+                                kwargs={'manager': manager})
+               for n in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(2)
+
+    assert len(fake.calls) == 3
+    assert manager.latency.latency(DETAIL_API, 100) < 0.18
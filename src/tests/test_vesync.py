@@ -2,6 +2,7 @@
 
 import unittest
 import logging
+from json import dumps
 from unittest import mock
 from unittest.mock import patch, Mock
 
@@ -111,7 +112,8 @@ class TestVesync(unittest.TestCase):
             body['password'] = Helpers.hash_password(self.vesync_1.password)
             mocked_post.assert_called_with('/cloud/v1/user/login',
                                            'post',
-                                           json=body)
+                                           json=body,
+                                           manager=self.vesync_1)
             self.assertTrue(data)
 
 
@@ -122,7 +124,7 @@ class TestApiFunc:
     def test_api_get(self, get_mock):
         """Test get api call."""
         get_mock.return_value = Mock(ok=True, status_code=200)
-        get_mock.return_value.json.return_value = {'code': 0}
+        get_mock.return_value.content = dumps({'code': 0})
 
         mock_return = Helpers.call_api('/call/location', method='get')
 
@@ -132,7 +134,7 @@ class TestApiFunc:
     def test_api_post(self, post_mock):
         """Test post api call."""
         post_mock.return_value = Mock(ok=True, status_code=200)
-        post_mock.return_value.json.return_value = {'code': 0}
+        post_mock.return_value.content = dumps({'code': 0})
 
         mock_return = Helpers.call_api('/call/location', method='post')
 
@@ -142,7 +144,7 @@ class TestApiFunc:
     def test_api_put(self, put_mock):
         """Test put api call."""
         put_mock.return_value = Mock(ok=True, status_code=200)
-        put_mock.return_value.json.return_value = {'code': 0}
+        put_mock.return_value.content = dumps({'code': 0})
 
         mock_return = Helpers.call_api('/call/location', method='put')
 
@@ -152,7 +154,7 @@ class TestApiFunc:
     def test_api_bad_response(self, api_mock):
         """Test bad API response handling."""
         api_mock.return_value = Mock(ok=True, status_code=500)
-        api_mock.return_value.json.return_value = {}
+        api_mock.return_value.content = dumps({})
 
         mock_return = Helpers.call_api('/call/location', method='get')
 
@@ -169,6 +171,61 @@ class TestApiFunc:
 
         assert len(caplog.records) == 2
 
+    @patch('pyvesync_v2.helpers.requests.Session.post', autospec=True)
+    def test_api_manager_session(self, post_mock):
+        """Test call_api sends requests through the manager session."""
+        post_mock.return_value = Mock(ok=True, status_code=200)
+        post_mock.return_value.content = dumps({'code': 0})
+        manager = VeSync('sam@email.com', 'password', pool_size=4)
+
+        mock_return = Helpers.call_api('/call/location', method='post',
+                                       manager=manager)
+
+        assert mock_return == ({'code': 0}, 200)
+        assert post_mock.call_args[0][0] is manager.session
+        adapter = manager.session.get_adapter('https://smartapi.vesync.com')
+        assert adapter._pool_maxsize == 4
+
+
+class TestRequestTemplates:
+    """Test cached request body and header templates."""
+
+    def test_body_built_once(self, manager):
+        """Test body template is reused with a new traceId."""
+        with patch.object(Helpers, 'build_body',
+                          wraps=Helpers.build_body) as build_mock:
+            first = Helpers.req_body(manager, 'devicedetail')
+            second = Helpers.req_body(manager, 'devicedetail')
+        assert build_mock.call_count == 1
+        first.pop('traceId')
+        second.pop('traceId')
+        assert first == second
+        first['uuid'] = 'changed'
+        assert 'uuid' not in Helpers.req_body(manager, 'devicedetail')
+
+    def test_headers_copied(self, manager):
+        """Test header template is copied for each call."""
+        headers = Helpers.req_headers(manager)
+        headers['tk'] = 'changed'
+        assert Helpers.req_headers(manager)['tk'] == 'sample_tk'
+
+    def test_templates_invalidated(self, manager):
+        """Test templates are rebuilt when login or time zone changes."""
+        Helpers.req_body(manager, 'devicedetail')
+        manager.token = 'new_tk'
+        manager.time_zone = 'Europe/Berlin'
+        body = Helpers.req_body(manager, 'devicedetail')
+        assert body['token'] == 'new_tk'
+        assert body['timeZone'] == 'Europe/Berlin'
+        assert Helpers.req_headers(manager)['tk'] == 'new_tk'
+
+    def test_login_not_cached(self, manager):
+        """Test login body is built from current credentials."""
+        Helpers.req_body(manager, 'login')
+        manager.username = 'other@email.com'
+        assert Helpers.req_body(manager, 'login')['email'] == \
+            'other@email.com'
+
 
 if __name__ == '__main__':
     unittest.main()
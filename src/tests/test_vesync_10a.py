@@ -1,5 +1,6 @@
 """Test scripts for Etekcity 10A Outlets."""
 
+import time
 import pytest
 from unittest.mock import patch
 import logging
@@ -58,7 +59,7 @@ class TestVesync10ASwitch(object):
         """Test 10A get_details()."""
         self.mock_api.return_value = CORRECT_10A_DETAILS
         outlet = VeSyncOutlet10A(DEV_LIST_DETAIL_US, self.vesync_obj)
-        outlet.get_details()
+        assert outlet.get_details()
         dev_details = outlet.details
         assert outlet.device_status == 'on'
         assert type(dev_details) == dict
@@ -73,7 +74,7 @@ class TestVesync10ASwitch(object):
         """Test 10A get_details with Code>0."""
         self.mock_api.return_value = BAD_10A_LIST
         out = VeSyncOutlet10A(DEV_LIST_DETAIL_EU, self.vesync_obj)
-        out.get_details()
+        assert out.get_details() is False
         assert len(caplog.records) == 1
         assert 'details' in caplog.text
 
@@ -90,14 +91,16 @@ class TestVesync10ASwitch(object):
         self.mock_api.assert_called_with('/10a/v1/device/devicestatus',
                                          'put',
                                          headers=head,
-                                         json=body)
+                                         json=body,
+                                         manager=self.vesync_obj)
         assert on
         off = out.turn_off()
         body['status'] = 'off'
         self.mock_api.assert_called_with('/10a/v1/device/devicestatus',
                                          'put',
                                          headers=head,
-                                         json=body)
+                                         json=body,
+                                         manager=self.vesync_obj)
         assert off
 
     def test_10a_onoff_fail(self, api_mock):
@@ -118,7 +121,8 @@ class TestVesync10ASwitch(object):
                                          'post',
                                          headers=helpers.req_headers(
                                              self.vesync_obj),
-                                         json=body)
+                                         json=body,
+                                         manager=self.vesync_obj)
         energy_dict = out.energy['week']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -138,7 +142,8 @@ class TestVesync10ASwitch(object):
                                          'post',
                                          headers=helpers.req_headers(
                                              self.vesync_obj),
-                                         json=body)
+                                         json=body,
+                                         manager=self.vesync_obj)
         energy_dict = out.energy['month']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -158,7 +163,8 @@ class TestVesync10ASwitch(object):
                                          'post',
                                          headers=helpers.req_headers(
                                              self.vesync_obj),
-                                         json=body)
+                                         json=body,
+                                         manager=self.vesync_obj)
         energy_dict = out.energy['year']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -172,9 +178,10 @@ class TestVesync10ASwitch(object):
         bad_history = {"code": 1}
         self.mock_api.return_value = (bad_history, 200)
         out = VeSyncOutlet10A(DEV_LIST_DETAIL_US, self.vesync_obj)
-        out.update_energy()
-        assert len(caplog.records) == 1
-        assert 'weekly' in caplog.text
+        assert out.update_energy() is False
+        assert len(caplog.records) == 3
+        for period in ('weekly', 'monthly', 'yearly'):
+            assert period in caplog.text
         caplog.clear()
         out.get_monthly_energy()
         assert len(caplog.records) == 1
@@ -183,3 +190,27 @@ class TestVesync10ASwitch(object):
         out.get_yearly_energy()
         assert len(caplog.records) == 1
         assert 'yearly' in caplog.text
+
+    def test_energy_concurrent(self, api_mock):
+        """Test energy is fetched concurrently with default workers."""
+        def slow_energy(*args, **kwargs):
+            time.sleep(0.1)
+            return ENERGY_HISTORY
+        self.mock_api.side_effect = slow_energy
+        out = VeSyncOutlet10A(DEV_LIST_DETAIL_US, self.vesync_obj)
+
+        start = time.monotonic()
+        with patch.object(self.vesync_obj, 'run_calls',
+                          wraps=self.vesync_obj.run_calls) as run_calls:
+            assert out.update_energy()
+        run_calls.assert_called_once()
+        assert time.monotonic() - start < 0.25
+        assert self.mock_api.call_count == 3
+        assert set(out.energy) == {'week', 'month', 'year'}
+
+        self.vesync_obj.outlets = [out]
+        start = time.monotonic()
+        report = self.vesync_obj.update_energy(bypass_check=True)
+        assert time.monotonic() - start < 0.25
+        assert report.refreshed == [out]
+        assert self.mock_api.call_count == 6
@@ -97,12 +97,14 @@ class TestVesync15ASwitch:
         body['uuid'] = vswitch15a.uuid
         on = vswitch15a.turn_on()
         self.mock_api.assert_called_with(
-            '/15a/v1/device/devicestatus', 'put', headers=head, json=body)
+            '/15a/v1/device/devicestatus', 'put', headers=head, json=body,
+            manager=self.vesync_obj)
         assert on
         off = vswitch15a.turn_off()
         body['status'] = 'off'
         self.mock_api.assert_called_with(
-            '/15a/v1/device/devicestatus', 'put', headers=head, json=body)
+            '/15a/v1/device/devicestatus', 'put', headers=head, json=body,
+            manager=self.vesync_obj)
         assert off
 
     def test_15a_onoff_fail(self, api_mock):
@@ -121,7 +123,8 @@ class TestVesync15ASwitch:
         body['uuid'] = vswitch15a.uuid
         self.mock_api.assert_called_with(
             '/15a/v1/device/energyweek', 'post',
-            headers=helpers.req_headers(self.vesync_obj), json=body)
+            headers=helpers.req_headers(self.vesync_obj), json=body,
+            manager=self.vesync_obj)
         energy_dict = vswitch15a.energy['week']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -139,7 +142,8 @@ class TestVesync15ASwitch:
         body['uuid'] = vswitch15a.uuid
         self.mock_api.assert_called_with(
             '/15a/v1/device/energymonth', 'post',
-            headers=helpers.req_headers(self.vesync_obj), json=body)
+            headers=helpers.req_headers(self.vesync_obj), json=body,
+            manager=self.vesync_obj)
         energy_dict = vswitch15a.energy['month']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -157,7 +161,8 @@ class TestVesync15ASwitch:
         body['uuid'] = vswitch15a.uuid
         self.mock_api.assert_called_with(
             '/15a/v1/device/energyyear', 'post',
-            headers=helpers.req_headers(self.vesync_obj), json=body)
+            headers=helpers.req_headers(self.vesync_obj), json=body,
+            manager=self.vesync_obj)
         energy_dict = vswitch15a.energy['year']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -172,8 +177,9 @@ class TestVesync15ASwitch:
         self.mock_api.return_value = (bad_history, 200)
         vswitch15a = VeSyncOutlet15A(DEV_LIST_DETAIL, self.vesync_obj)
         vswitch15a.update_energy()
-        assert len(caplog.records) == 1
-        assert 'weekly' in caplog.text
+        assert len(caplog.records) == 3
+        for period in ('weekly', 'monthly', 'yearly'):
+            assert period in caplog.text
         caplog.clear()
         vswitch15a.get_monthly_energy()
         assert len(caplog.records) == 1
@@ -97,12 +97,14 @@ class TestVesync7ASwitch(object):
         head = helpers.req_headers(self.vesync_obj)
         self.mock_api.assert_called_with(
             '/v1/wifi-switch-1.3/' + vswitch7a.cid + '/status/on', 'put',
-            headers=head)
+            headers=head,
+            manager=self.vesync_obj)
         assert on
         off = vswitch7a.turn_off()
         self.mock_api.assert_called_with(
                 '/v1/wifi-switch-1.3/' + vswitch7a.cid + '/status/off', 'put',
-                headers=head)
+                headers=head,
+                manager=self.vesync_obj)
         assert off
 
     def test_7a_onoff_fail(self, api_mock):
@@ -120,7 +122,8 @@ class TestVesync7ASwitch(object):
         self.mock_api.assert_called_with(
             '/v1/device/' + vswitch7a.cid + '/energy/week',
             'get',
-            headers=helpers.req_headers(self.vesync_obj))
+            headers=helpers.req_headers(self.vesync_obj),
+            manager=self.vesync_obj)
         energy_dict = vswitch7a.energy['week']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -136,7 +139,8 @@ class TestVesync7ASwitch(object):
         self.mock_api.assert_called_with(
             '/v1/device/' + vswitch7a.cid + '/energy/month',
             'get',
-            headers=helpers.req_headers(self.vesync_obj))
+            headers=helpers.req_headers(self.vesync_obj),
+            manager=self.vesync_obj)
         energy_dict = vswitch7a.energy['month']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -152,7 +156,8 @@ class TestVesync7ASwitch(object):
         self.mock_api.assert_called_with(
             '/v1/device/' + vswitch7a.cid + '/energy/year',
             'get',
-            headers=helpers.req_headers(self.vesync_obj))
+            headers=helpers.req_headers(self.vesync_obj),
+            manager=self.vesync_obj)
         energy_dict = vswitch7a.energy['year']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -166,8 +171,9 @@ class TestVesync7ASwitch(object):
         self.mock_api.return_value = (bad_history, 200)
         vswitch7a = VeSyncOutlet7A(DEV_LIST_DETAIL, self.vesync_obj)
         vswitch7a.update_energy()
-        assert len(caplog.records) == 1
-        assert 'weekly' in caplog.text
+        assert len(caplog.records) == 3
+        for period in ('weekly', 'monthly', 'yearly'):
+            assert period in caplog.text
         caplog.clear()
         vswitch7a.get_monthly_energy()
         assert len(caplog.records) == 1
@@ -0,0 +1,106 @@
+"""Test asyncio VeSync manager."""
+
+import asyncio
+import logging
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from pyvesync_v2 import AsyncVeSync, VeSyncOutlet10A
+from pyvesync_v2.vesyncasync import AsyncVeSyncDevice
+
+from . import call_json
+
+DETAILS = ({'code': 0, 'deviceStatus': 'on', 'connectionStatus': 'online',
+            'brightNess': '50'}, 200)
+
+
+def run(coro):
+    """Run coroutine in a new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestAsyncVeSync(object):
+    """Test AsyncVeSync manager and device wrappers."""
+
+    @pytest.fixture()
+    def api_mock(self, caplog):
+        """Mock call_api() and initialize AsyncVeSync object."""
+        self.mock_api_call = patch('pyvesync_v2.helpers.Helpers.call_api')
+        self.mock_api = self.mock_api_call.start()
+        self.vesync_obj = AsyncVeSync('sam@mail.com', 'pass', concurrency=8)
+        self.vesync_obj.manager.enabled = True
+        self.vesync_obj.manager.token = 'sample_tk'
+        self.vesync_obj.manager.account_id = 'sample_actid'
+        caplog.set_level(logging.DEBUG)
+        yield
+        self.mock_api_call.stop()
+        run(self.vesync_obj.close())
+
+    def test_async_update(self, api_mock):
+        """Test update() runs device detail calls concurrently."""
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def api_side_effect(api, *args, **kwargs):
+            if api == '/cloud/v1/deviceManaged/devices':
+                return call_json.DEVLIST_ALL
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.05)
+            with lock:
+                state['active'] -= 1
+            return DETAILS
+
+        self.mock_api.side_effect = api_side_effect
+        run(self.vesync_obj.update())
+
+        assert len(self.vesync_obj.outlets) == 6
+        assert len(self.vesync_obj.switches) == 1
+        # list call plus one detail call per device, one per outdoor unit
+        assert self.mock_api.call_count == 9
+        assert state['peak'] > 1
+        assert self.vesync_obj.manager.last_update_ts is not None
+
+    def test_async_device_methods(self, api_mock):
+        """Test device wrapper methods are awaitable."""
+        self.mock_api.return_value = ({'code': 0}, 200)
+        outlet = VeSyncOutlet10A(call_json.LIST_CONF_10AUS,
+                                 self.vesync_obj.manager)
+        self.vesync_obj.manager.outlets.append(outlet)
+        async_outlet = self.vesync_obj.outlets[0]
+
+        assert isinstance(async_outlet, AsyncVeSyncDevice)
+        assert async_outlet == outlet
+        assert async_outlet.cid == outlet.cid
+        assert run(async_outlet.turn_off())
+        assert outlet.device_status == 'off'
+        assert not async_outlet.is_on
+
+    def test_async_login(self, api_mock):
+        """Test awaitable login."""
+        self.mock_api.return_value = call_json.LOGIN_RET_BODY
+        assert run(self.vesync_obj.login())
+        assert self.vesync_obj.manager.token == call_json.SAMPLE_TOKEN
+
+    def test_async_update_energy(self, api_mock):
+        """Test energy calls run on the async executor and are scheduled."""
+        self.mock_api.return_value = call_json.ENERGY_HISTORY
+        manager = self.vesync_obj.manager
+        outlet = VeSyncOutlet10A(call_json.LIST_CONF_10AUS, manager)
+        manager.outlets.append(outlet)
+
+        with patch.object(manager, 'run_calls') as run_calls:
+            errors = run(self.vesync_obj.update_energy())
+
+        assert errors == {}
+        run_calls.assert_not_called()
+        assert self.mock_api.call_count == 3
+        assert set(outlet.energy) == {'week', 'month', 'year'}
+        assert outlet.energy_due_ts is not None
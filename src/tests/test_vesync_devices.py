@@ -5,7 +5,6 @@ from unittest.mock import patch, MagicMock
 import logging
 import pyvesync_v2
 import time
-import copy
 from itertools import chain
 from pyvesync_v2 import (VeSyncAir131, VeSyncBulbESL100, VeSyncOutdoorPlug,
                          VeSyncOutlet10A, VeSyncOutlet15A, VeSyncOutlet7A,
@@ -190,36 +189,47 @@ class TestDeviceList(object):
         """
         outlet_10a = out10a_patch.return_value
         outlet_10a.cid = '10A-CID1'
+        outlet_10a.sub_device_no = 0
         outlet_10a.device_type = 'ESW10-EU'
         outlet_10a.device_name = '10A Removed'
+        outlet_10a.energy_phase = None
 
         outlet_15a = out15a_patch.return_value
         outlet_15a.cid = '15A-CID1'
+        outlet_15a.sub_device_no = 0
         outlet_15a.device_type = 'ESW15-USA'
         outlet_15a.device_name = '15A Removed'
+        outlet_15a.energy_phase = None
 
         outlet_7a = out7a_patch.return_value
         outlet_7a.cid = '7A-CID1'
+        outlet_7a.sub_device_no = 0
         outlet_7a.device_type = 'wifi-switch-1.3'
         outlet_7a.device_name = '7A Removed'
+        outlet_7a.energy_phase = None
 
         outlet_outdoor = outdoor_patch.return_value
         outlet_outdoor.cid = 'OUTDOOR-CID1'
+        outlet_outdoor.sub_device_no = 0
         outlet_outdoor.device_type = 'ESO15-TB'
         outlet_outdoor.device_name = 'Outdoor Removed'
+        outlet_outdoor.energy_phase = None
 
         bulb_esl100 = esl100_patch.return_value
         bulb_esl100.cid = 'BULB-CID1'
+        bulb_esl100.sub_device_no = 0
         bulb_esl100.device_type = 'ESL100'
         bulb_esl100.device_name = 'Bulb Removed'
 
         switch = ws_patch.return_value
         switch.cid = 'WS-CID2'
+        switch.sub_device_no = 0
         switch.device_name = 'Switch Removed'
         switch.device_type = 'ESWL01'
 
         air = air_patch.return_value
         air.cid = 'AirCID2'
+        air.sub_device_no = 0
         air.device_type = 'LV-PUR131S'
         air.device_name = 'fan Removed'
 
@@ -260,11 +270,9 @@ class TestDeviceList(object):
 
         json_ret = json_vals.FULL_DEV_LIST
 
-        self.vesync_obj.outlets = [outlet_10a, outlet_15a,
-                                   outlet_7a, outlet_outdoor]
-        self.vesync_obj.switches = [switch]
-        self.vesync_obj.fans = [air]
-        self.vesync_obj.bulbs = [bulb_esl100]
+        self.vesync_obj.add_devices(
+            [outlet_10a, outlet_15a, outlet_7a, outlet_outdoor], [switch],
+            [air], [bulb_esl100])
 
         outlets, switches, fans, bulbs = self.vesync_obj.process_devices(
             json_ret)
@@ -279,33 +287,6 @@ class TestDeviceList(object):
         assert len(fans) == 1
         assert len(bulbs) == 1
 
-    @patch('pyvesync_v2.vesync.VeSyncOutlet7A', autospec=True)
-    def test_remove_device(self, outlet_patch, caplog, api_mock):
-        """Test remove device test."""
-        device = copy.deepcopy(json_vals.LIST_CONF_7A)
-
-        outlet_test = outlet_patch.return_value
-        outlet_test.cid = '7A-CID'
-        outlet_test.device_type = 'wifi-switch-1.3'
-        outlet_test.device_name = '7A Device'
-
-        new_list = [device]
-
-        device_exists = pyvesync_v2.vesync.VeSync.remove_dev_test(
-            outlet_test, new_list)
-
-        assert device_exists
-
-        del device['cid']
-
-        device_exists = pyvesync_v2.vesync.VeSync.remove_dev_test(
-            outlet_test, new_list)
-
-        assert device_exists is False
-
-        assert len(caplog.records) == 2
-        assert 'cid' in caplog.text
-
     @patch('pyvesync_v2.vesync.VeSyncOutdoorPlug', autospec=True)
     def test_add_dev_test(self, outdoor_patch, caplog, api_mock):
         """Test add_device_test to return if device found in existing conf."""
@@ -341,3 +322,225 @@ class TestDeviceList(object):
             device.display()
 
         assert len(caplog.records) == 0
+
+    def test_update_all_devices_parallel(self, caplog, api_mock):
+        """Test update_all_devices() fans out and collects errors."""
+        outlets = [MagicMock(device_name='outlet %d' % i) for i in range(4)]
+        outlets[2].get_details.side_effect = ValueError('bad response')
+        self.vesync_obj.outlets = outlets
+        self.vesync_obj.switches = [outlets[0]]
+
+        errors = self.vesync_obj.update_all_devices(max_workers=3)
+
+        for outlet in outlets:
+            assert outlet.get_details.call_count == 1
+        assert list(errors) == [outlets[2]]
+        assert isinstance(errors[outlets[2]], ValueError)
+        assert 'bad response' in caplog.text
+
+    def test_update_energy_parallel(self, api_mock):
+        """Test update_energy() runs energy calls of all outlets."""
+        outlets = [MagicMock() for _ in range(3)]
+        calls = []
+        for outlet in outlets:
+            calls.append([MagicMock(__name__='get_%s_energy' % period)
+                          for period in ('weekly', 'monthly', 'yearly')])
+            outlet.energy_calls.return_value = calls[-1]
+        outlets[1].energy_calls.return_value = []
+        self.vesync_obj.outlets = outlets
+        self.vesync_obj.max_workers = 2
+
+        errors = self.vesync_obj.update_energy(bypass_check=True)
+
+        assert errors == {}
+        assert errors.refreshed == [outlets[0], outlets[2]]
+        for outlet in outlets:
+            outlet.energy_calls.assert_called_once_with(True)
+            outlet.update_energy.assert_not_called()
+        for energy_call in calls[0] + calls[2]:
+            energy_call.assert_called_once_with()
+
+    def test_update_energy_staggered(self, api_mock):
+        """Test energy due times are spread across the interval."""
+        interval = self.vesync_obj.energy_update_interval
+        outlets = []
+        for index in range(10):
+            outlet = VeSyncOutlet10A(dict(json_vals.LIST_CONF_10AUS,
+                                          cid='CID-%d' % index),
+                                     self.vesync_obj)
+            for period in ('weekly', 'monthly', 'yearly'):
+                setattr(outlet, 'get_%s_energy' % period,
+                        MagicMock(__name__='get_%s_energy' % period))
+            outlets.append(outlet)
+        self.vesync_obj.outlets = outlets
+        self.vesync_obj.energy_jitter = 0
+
+        start = time.time()
+        report = self.vesync_obj.update_energy()
+
+        assert len(report.refreshed) == 10
+        slots = sorted(int((outlet.energy_due_ts - start) * 10 // interval)
+                       for outlet in outlets)
+        assert slots == list(range(10))
+        assert self.vesync_obj.energy_due() == []
+
+        outlets[3].energy_due_ts = time.time() - 1
+        assert self.vesync_obj.energy_due() == [outlets[3]]
+        report = self.vesync_obj.update_energy()
+        assert report.refreshed == [outlets[3]]
+        assert outlets[3].get_weekly_energy.call_count == 2
+        assert outlets[0].get_weekly_energy.call_count == 1
+        assert outlets[3].energy_due_ts > time.time()
+
+        phases = [outlet.energy_phase for outlet in outlets]
+        due = [outlet.energy_due_ts for outlet in outlets]
+        report = self.vesync_obj.update_energy(bypass_check=True)
+        assert len(report.refreshed) == 10
+        assert outlets[0].get_weekly_energy.call_count == 2
+        assert [outlet.energy_phase for outlet in outlets] == phases
+        assert [outlet.energy_due_ts for outlet in outlets] == \
+            pytest.approx(due, abs=1)
+        assert self.vesync_obj.energy_due() == []
+
+    def test_added_outlets_staggered(self, api_mock):
+        """Test outlets get their energy due time when they are added."""
+        interval = self.vesync_obj.energy_update_interval
+        self.vesync_obj.energy_jitter = 0
+        outlets = [VeSyncOutlet10A(dict(json_vals.LIST_CONF_10AUS,
+                                        cid='CID-%d' % index),
+                                   self.vesync_obj)
+                   for index in range(10)]
+
+        start = time.time()
+        self.vesync_obj.add_devices(outlets, [], [], [])
+
+        assert self.vesync_obj.energy_due() == []
+        slots = sorted(int((outlet.energy_due_ts - start) * 10 // interval)
+                       for outlet in outlets)
+        assert slots == list(range(10))
+        assert all(outlet.update_energy_ts is None for outlet in outlets)
+
+    def test_device_index(self, api_mock):
+        """Test devices are indexed by cid and sub device number."""
+        self.mock_api.return_value = json_vals.DEVLIST_ALL
+        self.vesync_obj.update()
+
+        outdoor_1 = self.vesync_obj.get_device_by_cid('OUTDOOR-CID', 1)
+        outdoor_2 = self.vesync_obj.get_device_by_cid('OUTDOOR-CID', 2)
+        assert isinstance(outdoor_1, VeSyncOutdoorPlug)
+        assert outdoor_1.sub_device_no == 1
+        assert outdoor_2.sub_device_no == 2
+        assert self.vesync_obj.get_device_by_cid('7A-CID') in \
+            self.vesync_obj.outlets
+        assert self.vesync_obj.get_device_by_cid('MISSING-CID') is None
+
+        new_list = [x for x in json_vals.FULL_DEV_LIST
+                    if x['cid'] != '7A-CID']
+        with patch.object(self.vesync_obj, 'index_devices') as rebuild:
+            outlets, _, _, _ = self.vesync_obj.process_devices(new_list)
+        rebuild.assert_not_called()
+        assert outlets == []
+        assert self.vesync_obj.get_device_by_cid('7A-CID') is None
+        assert len(self.vesync_obj.outlets) == 5
+
+    def test_get_devices_pages(self, api_mock):
+        """Test get_devices() walks every page of the device list."""
+        page_size = 4
+        full_list = json_vals.FULL_DEV_LIST
+        pages = {}
+
+        def api_side_effect(api, method, json=None, **kwargs):
+            page_no = int(json['pageNo'])
+            pages[page_no] = pages.get(page_no, 0) + 1
+            start = (page_no - 1) * page_size
+            return ({'code': 0, 'result': {
+                'total': str(len(full_list)), 'pageNo': page_no,
+                'pageSize': page_size,
+                'list': full_list[start:start + page_size]}}, 200)
+
+        self.mock_api.side_effect = api_side_effect
+        with patch('pyvesync_v2.vesync.ThreadPoolExecutor',
+                   wraps=pyvesync_v2.vesync.ThreadPoolExecutor) as pool:
+            outlets, switches, fans, bulbs = self.vesync_obj.get_devices()
+
+        pool.assert_called_once_with(max_workers=2)
+        assert pages == {1: 1, 2: 1, 3: 1}
+        assert len(outlets) == 6
+        assert len(switches) == 1
+        assert len(fans) == 1
+        assert len(bulbs) == 1
+        assert not self.vesync_obj.in_process
+
+    def test_get_devices_page_error(self, caplog, api_mock):
+        """Test devices are kept if a page of the list fails."""
+        outlet = VeSyncOutlet7A(json_vals.LIST_CONF_7A, self.vesync_obj)
+        self.vesync_obj.add_devices([outlet], [], [], [])
+        first_page = ({'code': 0, 'result': {
+            'total': 60, 'pageNo': 1, 'pageSize': 50,
+            'list': [json_vals.LIST_CONF_WS]}}, 200)
+        self.mock_api.side_effect = [first_page, ({'code': 1}, 200)]
+
+        outlets, switches, _, _ = self.vesync_obj.get_devices()
+
+        assert len(switches) == 1
+        assert self.vesync_obj.outlets == [outlet]
+        assert 'Device list incomplete' in caplog.text
+
+    def test_get_devices_bad_total(self, caplog, api_mock):
+        """Test devices are kept if the list total is not a number."""
+        outlet = VeSyncOutlet7A(json_vals.LIST_CONF_7A, self.vesync_obj)
+        self.vesync_obj.add_devices([outlet], [], [], [])
+        self.mock_api.return_value = ({'code': 0, 'result': {
+            'total': 'many', 'pageNo': 1, 'pageSize': 50,
+            'list': [json_vals.LIST_CONF_WS]}}, 200)
+
+        _, switches, _, _ = self.vesync_obj.get_devices()
+
+        assert len(switches) == 1
+        assert self.vesync_obj.outlets == [outlet]
+        assert 'Invalid device list total' in caplog.text
+
+    def test_update_from_list(self, api_mock):
+        """Test known devices are updated in place from the device list."""
+        self.mock_api.return_value = json_vals.DEVLIST_ALL
+        self.vesync_obj.add_devices(*self.vesync_obj.get_devices())
+        switch = self.vesync_obj.switches[0]
+        assert switch.device_status == 'on'
+        self.vesync_obj.scheduler.record(switch)
+        assert not self.vesync_obj.scheduler.due(switch)
+
+        ws_off = dict(json_vals.LIST_CONF_WS, deviceStatus='off')
+        self.mock_api.return_value = ({'code': 0, 'result': {'list': [
+            ws_off if x is json_vals.LIST_CONF_WS else x
+            for x in json_vals.FULL_DEV_LIST]}}, 200)
+        new_devices = self.vesync_obj.get_devices()
+
+        assert all(not dev_list for dev_list in new_devices)
+        assert self.vesync_obj.switches[0] is switch
+        assert switch.device_status == 'off'
+        assert self.vesync_obj.scheduler.due(switch)
+
+    def test_update_polls_due_devices(self, api_mock):
+        """Test update() only fetches details of devices due a poll."""
+        self.mock_api.return_value = json_vals.DEVLIST_ALL
+        self.vesync_obj.add_devices(*self.vesync_obj.get_devices())
+        self.mock_api.reset_mock()
+        switch = self.vesync_obj.switches[0]
+        outlet = self.vesync_obj.outlets[0]
+        switch.update = MagicMock()
+        outlet.update = MagicMock()
+
+        self.vesync_obj.update()
+        self.vesync_obj.last_update_ts = None
+        self.vesync_obj.update()
+
+        assert switch.update.call_count == 1
+        assert outlet.update.call_count == 1
+        assert self.vesync_obj.scheduler.interval(switch) == 3600
+
+        self.vesync_obj.scheduler.promote(outlet)
+        self.vesync_obj.update()
+
+        assert switch.update.call_count == 1
+        assert outlet.update.call_count == 2
+        assert switch.details_ts is not None
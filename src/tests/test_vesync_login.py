@@ -1,11 +1,15 @@
 """Test VeSync login method."""
 
 import logging
+import threading
+from json import dumps
+import time
 import pytest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 import pyvesync_v2
 from pyvesync_v2.vesync import VeSync
-from pyvesync_v2.helpers import Helpers as helpers
+from pyvesync_v2 import codec
+from pyvesync_v2.helpers import Helpers as helpers, JSON_HEADERS
 
 login_test_vals = [('sam@mail.com', 'pass', 'America/New_York', 'full corret'),
                    ('sam@mail.com', 'pass', 'invalidtz!', 'invalid tz'),
@@ -63,7 +67,8 @@ class TestLogin(object):
             jd = helpers.req_body(vesync_obj, 'login')
             self.mock_api.assert_called_with('/cloud/v1/user/login',
                                              'post',
-                                             json=jd)
+                                             json=jd,
+                                             manager=vesync_obj)
         else:
             assert not self.mock_api.called
 
@@ -82,18 +87,20 @@ class TestLogin(object):
         jd = helpers.req_body(vesync_obj, 'login')
         self.mock_api.assert_called_with('/cloud/v1/user/login',
                                          'post',
-                                         json=jd)
+                                         json=jd,
+                                         manager=vesync_obj)
         assert vesync_obj.token == 'sam_token'
         assert vesync_obj.account_id == 'sam_actid'
 
 
 @pytest.mark.parametrize('email, password, testid', login_bad_call)
-@patch('pyvesync_v2.helpers.requests.post')
+@patch('pyvesync_v2.helpers.requests.Session.post')
 def test_login(mock_api, email, password, testid):
     """Test multiple failed login calls."""
     return_tuple = {'code': 455, 'msg': 'sdasd'}
     mock_api.return_value.ok = True
-    mock_api.return_value.json.return_value = return_tuple
+    mock_api.return_value.status_code = 200
+    mock_api.return_value.content = dumps(return_tuple)
     vesync_obj = VeSync(email, password)
     vesync_login = vesync_obj.login()
     assert vesync_login is False
@@ -101,8 +108,72 @@ def test_login(mock_api, email, password, testid):
         jd = helpers.req_body(vesync_obj, 'login')
         mock_api.assert_called_with(
             'https://smartapi.vesync.com/cloud/v1/user/login',
-            headers=None,
-            json=jd,
+            headers=JSON_HEADERS,
+            data=codec.dumps(jd),
             timeout=5)
     else:
         assert not mock_api.called
+
+
+class TestRelogin(object):
+    """Test automatic login after token expires."""
+
+    @pytest.fixture()
+    def vesync_obj(self):
+        """Return logged in VeSync object."""
+        vesync_obj = VeSync('sam@mail.com', 'pass')
+        vesync_obj.enabled = True
+        vesync_obj.token = 'old_tk'
+        vesync_obj.account_id = 'sam_actid'
+        return vesync_obj
+
+    @patch('pyvesync_v2.helpers.requests.Session.post')
+    def test_expired_token_replay(self, mock_post, vesync_obj):
+        """Test request is sent again with new token after login."""
+        expired = Mock(status_code=200)
+        expired.content = dumps({'code': -11012022, 'msg': 'expired'})
+        login = Mock(status_code=200)
+        login.content = dumps({'code': 0, 'result': {
+            'token': 'new_tk', 'accountID': 'sam_actid'}})
+        success = Mock(status_code=200)
+        success.content = dumps({'code': 0})
+        mock_post.side_effect = [expired, login, success]
+
+        head = helpers.req_headers(vesync_obj)
+        body = helpers.req_body(vesync_obj, 'devicedetail')
+        response = helpers.call_api('/10a/v1/device/devicedetail', 'post',
+                                    headers=head, json=body,
+                                    manager=vesync_obj)
+
+        assert response == ({'code': 0}, 200)
+        assert vesync_obj.token == 'new_tk'
+        replay = mock_post.call_args_list[2][1]
+        assert replay['headers']['tk'] == 'new_tk'
+        assert codec.loads(replay['data'])['token'] == 'new_tk'
+        assert head['tk'] == 'old_tk'
+
+    def test_single_login(self, vesync_obj):
+        """Test concurrent callers share one login."""
+        def login():
+            time.sleep(0.05)
+            vesync_obj.token = 'new_tk'
+            return True
+
+        with patch.object(vesync_obj, 'login', side_effect=login) as mock:
+            threads = [threading.Thread(target=vesync_obj.relogin,
+                                        args=('old_tk',)) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert mock.call_count == 1
+            assert vesync_obj.relogin('old_tk')
+            assert mock.call_count == 1
+
+    def test_failed_login_not_repeated(self, vesync_obj):
+        """Test failed login is not retried for the same token."""
+        with patch.object(vesync_obj, 'login', return_value=False) as mock:
+            assert not vesync_obj.relogin('old_tk')
+            assert not vesync_obj.relogin('old_tk')
+            assert mock.call_count == 1
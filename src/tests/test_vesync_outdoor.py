@@ -1,9 +1,10 @@
 """Test scripts for Etekcity Outdoor Outlet."""
 
+import copy
 import pytest
 from unittest.mock import patch
 import logging
-from pyvesync_v2 import VeSync, VeSyncOutdoorPlug
+from pyvesync_v2 import VeSync, VeSyncOutdoorPlug, VeSyncOutlet10A
 from pyvesync_v2.helpers import Helpers as helpers
 from . import call_json
 
@@ -83,8 +84,8 @@ class TestVesyncOutdoorPlug:
             '/outdoorsocket15a/v1/device/devicestatus',
             'put',
             headers=head,
-            json=body
-            )
+            json=body,
+            manager=self.vesync_obj)
         assert on
         off = outdoor_outlet.turn_off()
         body['status'] = 'off'
@@ -92,8 +93,8 @@ class TestVesyncOutdoorPlug:
             '/outdoorsocket15a/v1/device/devicestatus',
             'put',
             headers=head,
-            json=body
-            )
+            json=body,
+            manager=self.vesync_obj)
         assert off
 
     def test_outdoor_outlet_onoff_fail(self, api_mock):
@@ -112,7 +113,8 @@ class TestVesyncOutdoorPlug:
         body['uuid'] = outdoor_outlet.uuid
         self.mock_api.assert_called_with(
             '/outdoorsocket15a/v1/device/energyweek', 'post',
-            headers=helpers.req_headers(self.vesync_obj), json=body)
+            headers=helpers.req_headers(self.vesync_obj), json=body,
+            manager=self.vesync_obj)
         energy_dict = outdoor_outlet.energy['week']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -132,7 +134,8 @@ class TestVesyncOutdoorPlug:
             '/outdoorsocket15a/v1/device/energymonth',
             'post',
             headers=helpers.req_headers(self.vesync_obj),
-            json=body)
+            json=body,
+            manager=self.vesync_obj)
         energy_dict = outdoor_outlet.energy['month']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -152,7 +155,8 @@ class TestVesyncOutdoorPlug:
             '/outdoorsocket15a/v1/device/energyyear',
             'post',
             headers=helpers.req_headers(self.vesync_obj),
-            json=body)
+            json=body,
+            manager=self.vesync_obj)
         energy_dict = outdoor_outlet.energy['year']
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
@@ -167,8 +171,9 @@ class TestVesyncOutdoorPlug:
         self.mock_api.return_value = (bad_history, 200)
         outdoor_outlet = VeSyncOutdoorPlug(DEV_LIST_DETAIL, self.vesync_obj)
         outdoor_outlet.update_energy()
-        assert len(caplog.records) == 1
-        assert 'weekly' in caplog.text
+        assert len(caplog.records) == 3
+        for period in ('weekly', 'monthly', 'yearly'):
+            assert period in caplog.text
         caplog.clear()
         outdoor_outlet.get_monthly_energy()
         assert len(caplog.records) == 1
@@ -177,3 +182,45 @@ class TestVesyncOutdoorPlug:
         outdoor_outlet.get_yearly_energy()
         assert len(caplog.records) == 1
         assert 'yearly' in caplog.text
+
+    def test_outdoor_shared_details(self, api_mock):
+        """Test one detail call updates both plugs of an outdoor unit."""
+        details = copy.deepcopy(CORRECT_OUTDOOR_DETAILS)
+        details[0]['subDevices'][1]['subDeviceStatus'] = 'off'
+        self.mock_api.return_value = details
+        plug_1 = VeSyncOutdoorPlug(DEV_LIST_DETAIL, self.vesync_obj)
+        plug_2 = VeSyncOutdoorPlug(DEV_LIST_DETAIL_2, self.vesync_obj)
+        self.vesync_obj.outlets = [plug_1, plug_2]
+
+        report = self.vesync_obj.update_all_devices()
+
+        assert self.mock_api.call_count == 1
+        assert report == {}
+        assert plug_1.device_status == 'on'
+        assert plug_2.device_status == 'off'
+        assert plug_2.details['active_time'] == 1
+        assert self.vesync_obj.device_groups([plug_1, plug_2]) == \
+            [(plug_1, plug_2)]
+
+    def test_outdoor_shared_energy(self, api_mock):
+        """Test energy is fetched once per unit and counted once."""
+        self.mock_api.return_value = ENERGY_HISTORY
+        plug_1 = VeSyncOutdoorPlug(DEV_LIST_DETAIL, self.vesync_obj)
+        plug_2 = VeSyncOutdoorPlug(DEV_LIST_DETAIL_2, self.vesync_obj)
+        outlet = VeSyncOutlet10A(call_json.LIST_CONF_10AUS, self.vesync_obj)
+        self.vesync_obj.outlets = [plug_1, plug_2, outlet]
+
+        report = self.vesync_obj.update_energy()
+
+        assert self.mock_api.call_count == 6
+        assert report.refreshed == [plug_1, plug_2, outlet]
+        assert plug_2.energy == plug_1.energy
+        assert plug_2.update_energy_ts is not None
+        assert plug_1.meter_id == plug_2.meter_id
+        total = ENERGY_HISTORY[0]['totalEnergy']
+        outlets = self.vesync_obj.outlets
+        assert helpers.unique_meters(outlets) == [plug_1, outlet]
+        assert helpers.energy_total(outlets, 'month') == total * 2
+        plug_1.details['power'] = plug_2.details['power'] = 5
+        outlet.details['power'] = 10
+        assert helpers.power_total(outlets) == 15
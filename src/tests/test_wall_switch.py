@@ -85,7 +85,8 @@ class TestVesyncWallSwitch(object):
             '/inwallswitch/v1/device/devicestatus',
             'put',
             headers=head,
-            json=body)
+            json=body,
+            manager=self.vesync_obj)
         assert on
         off = wswitch.turn_off()
         body['status'] = 'off'
@@ -93,7 +94,8 @@ class TestVesyncWallSwitch(object):
             '/inwallswitch/v1/device/devicestatus',
             'put',
             headers=head,
-            json=body)
+            json=body,
+            manager=self.vesync_obj)
         assert off
 
     def test_ws_onoff_fail(self, api_mock):